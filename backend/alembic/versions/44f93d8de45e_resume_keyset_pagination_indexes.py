@@ -0,0 +1,57 @@
+"""resume keyset pagination indexes
+
+Revision ID: 44f93d8de45e
+Revises: f4abb91ffa5b
+Create Date: 2026-10-18 11:10:42.518390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '44f93d8de45e'
+down_revision: Union[str, Sequence[str], None] = 'f4abb91ffa5b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Versions assigned by MAX(version) + 1 may have collided under
+    # concurrent improves; renumber per resume before enforcing uniqueness.
+    op.execute(sa.text(
+        """
+        UPDATE resume_history SET version = (
+            SELECT ranked.rn FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY resume_id ORDER BY version, id
+                ) AS rn
+                FROM resume_history
+            ) AS ranked
+            WHERE ranked.id = resume_history.id
+        )
+        """
+    ))
+
+    with op.batch_alter_table('resumes', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_resumes_user_id_id', ['user_id', 'id'], unique=False
+        )
+
+    with op.batch_alter_table('resume_history', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_resume_history_resume_id_version',
+            ['resume_id', 'version'], unique=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('resume_history', schema=None) as batch_op:
+        batch_op.drop_index('ix_resume_history_resume_id_version')
+
+    with op.batch_alter_table('resumes', schema=None) as batch_op:
+        batch_op.drop_index('ix_resumes_user_id_id')
@@ -0,0 +1,42 @@
+"""resume current_version counter
+
+Revision ID: 9c1e7a52b3d4
+Revises: 44f93d8de45e
+Create Date: 2026-10-18 11:32:07.204611
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c1e7a52b3d4'
+down_revision: Union[str, Sequence[str], None] = '44f93d8de45e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('resumes', schema=None) as batch_op:
+        batch_op.add_column(sa.Column(
+            'current_version', sa.Integer(), server_default='0',
+            nullable=False
+        ))
+
+    op.execute(sa.text(
+        """
+        UPDATE resumes SET current_version = COALESCE((
+            SELECT MAX(resume_history.version) FROM resume_history
+            WHERE resume_history.resume_id = resumes.id
+        ), 0)
+        """
+    ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('resumes', schema=None) as batch_op:
+        batch_op.drop_column('current_version')
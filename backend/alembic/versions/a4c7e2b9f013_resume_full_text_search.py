@@ -0,0 +1,114 @@
+"""resume full text search
+
+Revision ID: a4c7e2b9f013
+Revises: e6f1a9c2d874
+Create Date: 2026-10-18 15:20:11.482905
+
+"""
+import lzma
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c7e2b9f013'
+down_revision: Union[str, Sequence[str], None] = 'e6f1a9c2d874'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+SEARCH_CONFIG = 'simple'
+
+# DDL and codec are copied from the application code as of this revision,
+# so later changes there cannot alter what this migration does.
+POSTGRES_DDL = (
+    "CREATE TABLE resume_search ("
+    "resume_id INTEGER PRIMARY KEY REFERENCES resumes (id) ON DELETE CASCADE, "
+    "user_id INTEGER NOT NULL, "
+    "document TSVECTOR NOT NULL)",
+    "CREATE INDEX ix_resume_search_document "
+    "ON resume_search USING gin (document)",
+)
+SQLITE_DDL = (
+    "CREATE VIRTUAL TABLE resume_search USING fts5("
+    "user_id UNINDEXED, title, content, "
+    "tokenize = 'unicode61 remove_diacritics 2')",
+)
+
+
+def decompress_text(blob):
+    tag, payload = blob[0], blob[1:]
+    if tag == 1:
+        payload = zlib.decompress(payload)
+    elif tag == 2:
+        payload = lzma.decompress(payload)
+    elif tag != 0:
+        raise ValueError(f'Unknown content codec tag: {tag}')
+    return payload.decode('utf-8')
+
+
+resumes = sa.table(
+    'resumes',
+    sa.column('id', sa.Integer()),
+    sa.column('title', sa.String()),
+    sa.column('user_id', sa.Integer()),
+    sa.column('content_id', sa.Integer()),
+)
+content_blobs = sa.table(
+    'content_blobs',
+    sa.column('id', sa.Integer()),
+    sa.column('content', sa.LargeBinary()),
+)
+
+POSTGRES_INSERT = sa.text(
+    "INSERT INTO resume_search (resume_id, user_id, document) "
+    "VALUES (:resume_id, :user_id, "
+    "setweight(to_tsvector(CAST(:config AS regconfig), :title), 'A') || "
+    "setweight(to_tsvector(CAST(:config AS regconfig), :content), 'B'))"
+)
+SQLITE_INSERT = sa.text(
+    "INSERT INTO resume_search (rowid, user_id, title, content) "
+    "VALUES (:resume_id, :user_id, :title, :content)"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    postgres = bind.dialect.name == 'postgresql'
+    for statement in POSTGRES_DDL if postgres else SQLITE_DDL:
+        op.execute(statement)
+
+    insert = POSTGRES_INSERT if postgres else SQLITE_INSERT
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(
+                resumes.c.id, resumes.c.user_id, resumes.c.title,
+                content_blobs.c.content,
+            ).join(content_blobs, content_blobs.c.id == resumes.c.content_id)
+            .where(resumes.c.id > last_id)
+            .order_by(resumes.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(insert, [
+            {
+                'resume_id': row.id,
+                'user_id': row.user_id,
+                'title': row.title,
+                'content': decompress_text(bytes(row.content)),
+                'config': SEARCH_CONFIG,
+            }
+            for row in rows
+        ])
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TABLE resume_search')
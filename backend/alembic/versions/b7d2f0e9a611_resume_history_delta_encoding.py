@@ -0,0 +1,156 @@
+"""resume history delta encoding
+
+Revision ID: b7d2f0e9a611
+Revises: 9c1e7a52b3d4
+Create Date: 2026-10-18 11:58:31.640215
+
+"""
+import json
+import os
+from difflib import SequenceMatcher
+from itertools import accumulate
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2f0e9a611'
+down_revision: Union[str, Sequence[str], None] = '9c1e7a52b3d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+KEYFRAME_INTERVAL = 16
+
+
+# The delta codec is copied from app.core.delta as of this revision, so
+# later changes to the application code cannot alter what it writes.
+def _split_lines(text):
+    lines = text.splitlines(keepends=True)
+    offsets = [0, *accumulate(len(line) for line in lines)]
+    return lines, offsets
+
+
+def make_delta(base, target):
+    prefix = len(os.path.commonprefix([base, target]))
+    max_suffix = min(len(base), len(target)) - prefix
+    suffix = 0
+    while suffix < max_suffix and base[-1 - suffix] == target[-1 - suffix]:
+        suffix += 1
+
+    ops = []
+
+    def copy(start, end):
+        if start == end:
+            return
+        if ops and isinstance(ops[-1], list) and ops[-1][1] == start:
+            ops[-1][1] = end
+        else:
+            ops.append([start, end])
+
+    def insert(text):
+        if not text:
+            return
+        if ops and isinstance(ops[-1], str):
+            ops[-1] += text
+        else:
+            ops.append(text)
+
+    copy(0, prefix)
+    base_mid = base[prefix:len(base) - suffix]
+    target_mid = target[prefix:len(target) - suffix]
+    base_lines, base_offsets = _split_lines(base_mid)
+    target_lines, _ = _split_lines(target_mid)
+    matcher = SequenceMatcher(None, base_lines, target_lines)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            copy(prefix + base_offsets[i1], prefix + base_offsets[i2])
+        elif tag in ("replace", "insert"):
+            insert("".join(target_lines[j1:j2]))
+    copy(len(base) - suffix, len(base))
+    return json.dumps(ops, ensure_ascii=False, separators=(",", ":"))
+
+
+def apply_delta(base, delta):
+    return "".join(
+        op if isinstance(op, str) else base[op[0]:op[1]]
+        for op in json.loads(delta)
+    )
+
+
+resume_history = sa.table(
+    'resume_history',
+    sa.column('id', sa.Integer()),
+    sa.column('resume_id', sa.Integer()),
+    sa.column('version', sa.Integer()),
+    sa.column('content', sa.String()),
+    sa.column('is_delta', sa.Boolean()),
+)
+
+
+def _histories_by_resume(bind):
+    resume_ids = bind.execute(
+        sa.select(resume_history.c.resume_id).distinct()
+    ).scalars().all()
+    for resume_id in resume_ids:
+        yield bind.execute(
+            sa.select(
+                resume_history.c.id, resume_history.c.version,
+                resume_history.c.content, resume_history.c.is_delta,
+            ).where(resume_history.c.resume_id == resume_id)
+            .order_by(resume_history.c.version)
+        ).all()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('resume_history', schema=None) as batch_op:
+        batch_op.add_column(sa.Column(
+            'is_delta', sa.Boolean(), server_default=sa.false(),
+            nullable=False
+        ))
+
+    bind = op.get_bind()
+    update = resume_history.update().where(
+        resume_history.c.id == sa.bindparam('row_id')
+    ).values(content=sa.bindparam('payload'), is_delta=True)
+    for rows in _histories_by_resume(bind):
+        changes = []
+        keyframe_version, previous = None, None
+        for row in rows:
+            if (
+                previous is not None
+                and row.version == previous.version + 1
+                and row.version - keyframe_version < KEYFRAME_INTERVAL
+            ):
+                delta = make_delta(previous.content, row.content)
+                if len(delta) < len(row.content):
+                    changes.append({'row_id': row.id, 'payload': delta})
+                    previous = row
+                    continue
+            keyframe_version, previous = row.version, row
+        if changes:
+            bind.execute(update, changes)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    update = resume_history.update().where(
+        resume_history.c.id == sa.bindparam('row_id')
+    ).values(content=sa.bindparam('payload'))
+    for rows in _histories_by_resume(bind):
+        changes = []
+        content = None
+        for row in rows:
+            if row.is_delta:
+                content = apply_delta(content, row.content)
+                changes.append({'row_id': row.id, 'payload': content})
+            else:
+                content = row.content
+        if changes:
+            bind.execute(update, changes)
+
+    with op.batch_alter_table('resume_history', schema=None) as batch_op:
+        batch_op.drop_column('is_delta')
@@ -0,0 +1,181 @@
+"""resume minhash signatures
+
+Revision ID: c81d5f3e7a26
+Revises: a4c7e2b9f013
+Create Date: 2026-10-18 16:05:37.210484
+
+"""
+import hashlib
+import lzma
+import re
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81d5f3e7a26'
+down_revision: Union[str, Sequence[str], None] = 'a4c7e2b9f013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# MinHash and codec are copied from the application code as of this
+# revision, so later changes there cannot alter the signatures written.
+NUM_PERM = 128
+BANDS = 16
+SHINGLE_SIZE = 3
+SEED = 20261018
+MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+
+_WORD = re.compile(r'\w+')
+_rng = np.random.default_rng(SEED)
+_A = _rng.integers(1, MERSENNE_PRIME, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, MERSENNE_PRIME, size=NUM_PERM, dtype=np.uint64)
+_MIX = np.array(
+    [0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 1], dtype=np.uint64
+)[-SHINGLE_SIZE:]
+
+
+def decompress_text(blob):
+    tag, payload = blob[0], blob[1:]
+    if tag == 1:
+        payload = zlib.decompress(payload)
+    elif tag == 2:
+        payload = lzma.decompress(payload)
+    elif tag != 0:
+        raise ValueError(f'Unknown content codec tag: {tag}')
+    return payload.decode('utf-8')
+
+
+def minhash_signature(text):
+    words = np.fromiter(
+        (zlib.crc32(word.encode()) for word in _WORD.findall(text.lower())),
+        dtype=np.uint64,
+    )
+    if len(words) < SHINGLE_SIZE:
+        hashes = np.unique(words)
+    else:
+        windows = np.lib.stride_tricks.sliding_window_view(words, SHINGLE_SIZE)
+        hashes = np.unique((windows * _MIX).sum(axis=1))
+    hashes = hashes % MERSENNE_PRIME
+    if not len(hashes):
+        return None
+    permuted = (np.outer(hashes, _A) + _B) % MERSENNE_PRIME
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+def band_keys(signature):
+    return [
+        int.from_bytes(
+            hashlib.blake2b(band.tobytes(), digest_size=8).digest(),
+            'big', signed=True,
+        )
+        for band in signature.reshape(BANDS, -1)
+    ]
+
+
+resumes = sa.table(
+    'resumes',
+    sa.column('id', sa.Integer()),
+    sa.column('user_id', sa.Integer()),
+    sa.column('content_id', sa.Integer()),
+)
+content_blobs = sa.table(
+    'content_blobs',
+    sa.column('id', sa.Integer()),
+    sa.column('content', sa.LargeBinary()),
+)
+resume_signatures = sa.table(
+    'resume_signatures',
+    sa.column('resume_id', sa.Integer()),
+    sa.column('signature', sa.LargeBinary()),
+)
+resume_lsh_buckets = sa.table(
+    'resume_lsh_buckets',
+    sa.column('resume_id', sa.Integer()),
+    sa.column('user_id', sa.Integer()),
+    sa.column('band', sa.SmallInteger()),
+    sa.column('bucket', sa.BigInteger()),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('resume_signatures',
+    sa.Column('resume_id', sa.Integer(), nullable=False),
+    sa.Column('signature', sa.LargeBinary(), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['resume_id'], ['resumes.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('resume_id')
+    )
+    with op.batch_alter_table('resume_signatures', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_resume_signatures_id'), ['id'], unique=False)
+
+    op.create_table('resume_lsh_buckets',
+    sa.Column('resume_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('band', sa.SmallInteger(), nullable=False),
+    sa.Column('bucket', sa.BigInteger(), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['resume_id'], ['resumes.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('resume_lsh_buckets', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_resume_lsh_buckets_id'), ['id'], unique=False)
+        batch_op.create_index('ix_resume_lsh_buckets_lookup', ['user_id', 'band', 'bucket'], unique=False)
+        batch_op.create_index(batch_op.f('ix_resume_lsh_buckets_resume_id'), ['resume_id'], unique=False)
+
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(resumes.c.id, resumes.c.user_id, content_blobs.c.content)
+            .join(content_blobs, content_blobs.c.id == resumes.c.content_id)
+            .where(resumes.c.id > last_id)
+            .order_by(resumes.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        signatures, buckets = [], []
+        for row in rows:
+            signature = minhash_signature(decompress_text(bytes(row.content)))
+            if signature is None:
+                continue
+            signatures.append({
+                'resume_id': row.id,
+                'signature': signature.astype('<u4').tobytes(),
+            })
+            buckets.extend(
+                {
+                    'resume_id': row.id,
+                    'user_id': row.user_id,
+                    'band': band,
+                    'bucket': bucket,
+                }
+                for band, bucket in enumerate(band_keys(signature))
+            )
+        if signatures:
+            bind.execute(resume_signatures.insert(), signatures)
+            bind.execute(resume_lsh_buckets.insert(), buckets)
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('resume_lsh_buckets', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_resume_lsh_buckets_resume_id'))
+        batch_op.drop_index('ix_resume_lsh_buckets_lookup')
+        batch_op.drop_index(batch_op.f('ix_resume_lsh_buckets_id'))
+
+    op.drop_table('resume_lsh_buckets')
+    with op.batch_alter_table('resume_signatures', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_resume_signatures_id'))
+
+    op.drop_table('resume_signatures')
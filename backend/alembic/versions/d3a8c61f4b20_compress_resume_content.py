@@ -0,0 +1,114 @@
+"""compress resume content
+
+Revision ID: d3a8c61f4b20
+Revises: b7d2f0e9a611
+Create Date: 2026-10-18 13:12:07.318406
+
+"""
+import lzma
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a8c61f4b20'
+down_revision: Union[str, Sequence[str], None] = 'b7d2f0e9a611'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CODEC = 'zlib'
+THRESHOLD = 512
+BATCH_SIZE = 500
+TABLES = ('resumes', 'resume_history')
+
+# The codec is copied from app.core.compression as of this revision, so
+# later changes to the application code cannot alter what it writes.
+RAW, ZLIB, LZMA = 0, 1, 2
+
+
+def compress_text(text, codec, threshold):
+    data = text.encode('utf-8')
+    tag = {'none': RAW, 'zlib': ZLIB, 'lzma': LZMA}[codec]
+    if tag != RAW and len(data) >= threshold:
+        if tag == ZLIB:
+            packed = zlib.compress(data, 6)
+        else:
+            packed = lzma.compress(data, preset=6)
+        if len(packed) < len(data):
+            return bytes([tag]) + packed
+    return bytes([RAW]) + data
+
+
+def decompress_text(blob):
+    tag, payload = blob[0], blob[1:]
+    if tag == ZLIB:
+        payload = zlib.decompress(payload)
+    elif tag == LZMA:
+        payload = lzma.decompress(payload)
+    elif tag != RAW:
+        raise ValueError(f'Unknown content codec tag: {tag}')
+    return payload.decode('utf-8')
+
+
+def _convert(bind, table_name, source_type, target_type, convert) -> None:
+    table = sa.table(
+        table_name,
+        sa.column('id', sa.Integer()),
+        sa.column('content', source_type),
+        sa.column('content_new', target_type),
+    )
+    update = table.update().where(
+        table.c.id == sa.bindparam('row_id')
+    ).values(content_new=sa.bindparam('payload'))
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(table.c.id, table.c.content)
+            .where(table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(update, [
+            {'row_id': row.id, 'payload': convert(row.content)}
+            for row in rows
+        ])
+        last_id = rows[-1].id
+
+
+def _swap_column(table_name, source_type, target_type, convert) -> None:
+    with op.batch_alter_table(table_name, schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column('content_new', target_type, nullable=True)
+        )
+
+    _convert(op.get_bind(), table_name, source_type, target_type, convert)
+
+    with op.batch_alter_table(table_name, schema=None) as batch_op:
+        batch_op.drop_column('content')
+        batch_op.alter_column(
+            'content_new', new_column_name='content',
+            existing_type=target_type, nullable=False
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name in TABLES:
+        _swap_column(
+            table_name, sa.String(), sa.LargeBinary(),
+            lambda text: compress_text(text, CODEC, THRESHOLD),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in TABLES:
+        _swap_column(
+            table_name, sa.LargeBinary(), sa.String(),
+            lambda blob: decompress_text(bytes(blob)),
+        )
@@ -0,0 +1,173 @@
+"""content blob store
+
+Revision ID: e6f1a9c2d874
+Revises: d3a8c61f4b20
+Create Date: 2026-10-18 14:02:45.906113
+
+"""
+import hashlib
+import lzma
+import zlib
+from collections import Counter
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6f1a9c2d874'
+down_revision: Union[str, Sequence[str], None] = 'd3a8c61f4b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+TABLES = ('resumes', 'resume_history')
+
+content_blobs = sa.table(
+    'content_blobs',
+    sa.column('id', sa.Integer()),
+    sa.column('digest', sa.String()),
+    sa.column('content', sa.LargeBinary()),
+    sa.column('size', sa.Integer()),
+    sa.column('refcount', sa.Integer()),
+)
+
+
+# Codec and digest are copied from the application code as of this
+# revision, so later changes there cannot alter what this migration does.
+def decompress_text(blob):
+    tag, payload = blob[0], blob[1:]
+    if tag == 1:
+        payload = zlib.decompress(payload)
+    elif tag == 2:
+        payload = lzma.decompress(payload)
+    elif tag != 0:
+        raise ValueError(f'Unknown content codec tag: {tag}')
+    return payload.decode('utf-8')
+
+
+def content_digest(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def _fk_name(table_name: str) -> str:
+    return f'fk_{table_name}_content_id_content_blobs'
+
+
+def _move_content(bind, table_name, blob_ids, refcounts) -> None:
+    # Stored bytes are copied as-is; only the digest needs the plain text.
+    table = sa.table(
+        table_name,
+        sa.column('id', sa.Integer()),
+        sa.column('content', sa.LargeBinary()),
+        sa.column('content_id', sa.Integer()),
+    )
+    update = table.update().where(
+        table.c.id == sa.bindparam('row_id')
+    ).values(content_id=sa.bindparam('blob_id'))
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(table.c.id, table.c.content)
+            .where(table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        changes = []
+        for row in rows:
+            stored = bytes(row.content)
+            text = decompress_text(stored)
+            digest = content_digest(text)
+            if digest not in blob_ids:
+                blob_ids[digest] = bind.execute(
+                    content_blobs.insert().values(
+                        digest=digest, content=stored,
+                        size=len(text.encode('utf-8')),
+                        refcount=0,
+                    ).returning(content_blobs.c.id)
+                ).scalar_one()
+            refcounts[blob_ids[digest]] += 1
+            changes.append({'row_id': row.id, 'blob_id': blob_ids[digest]})
+        bind.execute(update, changes)
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('content_blobs',
+    sa.Column('digest', sa.String(length=64), nullable=False),
+    sa.Column('content', sa.LargeBinary(), nullable=False),
+    sa.Column('size', sa.Integer(), nullable=False),
+    sa.Column('refcount', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('digest')
+    )
+    with op.batch_alter_table('content_blobs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_content_blobs_id'), ['id'], unique=False)
+
+    for table_name in TABLES:
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column('content_id', sa.Integer(), nullable=True)
+            )
+
+    bind = op.get_bind()
+    blob_ids, refcounts = {}, Counter()
+    for table_name in TABLES:
+        _move_content(bind, table_name, blob_ids, refcounts)
+    if refcounts:
+        bind.execute(
+            content_blobs.update().where(
+                content_blobs.c.id == sa.bindparam('blob_id')
+            ).values(refcount=sa.bindparam('references')),
+            [
+                {'blob_id': blob_id, 'references': references}
+                for blob_id, references in refcounts.items()
+            ],
+        )
+
+    for table_name in TABLES:
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.drop_column('content')
+            batch_op.alter_column(
+                'content_id', existing_type=sa.Integer(), nullable=False
+            )
+            batch_op.create_foreign_key(
+                _fk_name(table_name), 'content_blobs', ['content_id'], ['id']
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in TABLES:
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column('content', sa.LargeBinary(), nullable=True)
+            )
+
+        table = sa.table(
+            table_name,
+            sa.column('content', sa.LargeBinary()),
+            sa.column('content_id', sa.Integer()),
+        )
+        op.execute(table.update().values(
+            content=sa.select(content_blobs.c.content)
+            .where(content_blobs.c.id == table.c.content_id)
+            .scalar_subquery()
+        ))
+
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.drop_constraint(_fk_name(table_name), type_='foreignkey')
+            batch_op.drop_column('content_id')
+            batch_op.alter_column(
+                'content', existing_type=sa.LargeBinary(), nullable=False
+            )
+
+    with op.batch_alter_table('content_blobs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_content_blobs_id'))
+
+    op.drop_table('content_blobs')
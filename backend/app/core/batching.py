@@ -0,0 +1,81 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """Groups items submitted close together into one call of ``func``.
+
+    A batch is sent once it holds ``max_size`` items or ``max_wait``
+    seconds after its first item arrived, whichever comes first. ``func``
+    must return one result per item, in order; if it raises, or returns
+    the wrong number of results, every item in that batch gets an error.
+    """
+
+    def __init__(
+        self, func: Callable[[list[T]], Awaitable[list[R]]],
+        max_size: int, max_wait: float
+    ):
+        self.func = func
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self.batches = 0
+        self.items = 0
+        self._pending: list[tuple[T, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._running: set[asyncio.Task] = set()
+
+    async def submit(self, item: T) -> R:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    async def submit_many(self, items: list[T]) -> list[R]:
+        return list(await asyncio.gather(*(self.submit(i) for i in items)))
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: list[tuple[T, asyncio.Future]]) -> None:
+        self.batches += 1
+        self.items += len(batch)
+        try:
+            results = await self.func([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"Batch of {len(batch)} items returned "
+                    f"{len(results)} results"
+                )
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        batches = self.batches
+        return {
+            "max_size": self.max_size,
+            "max_wait": self.max_wait,
+            "pending": len(self._pending),
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": self.items / batches if batches else 0.0,
+        }
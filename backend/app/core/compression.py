@@ -0,0 +1,37 @@
+import lzma
+import zlib
+
+RAW = 0
+ZLIB = 1
+LZMA = 2
+
+CODECS = {"none": RAW, "zlib": ZLIB, "lzma": LZMA}
+
+
+def compress_text(text: str, codec: str = "zlib", threshold: int = 0) -> bytes:
+    """Encode ``text`` as a one-byte codec tag followed by the payload.
+
+    Text shorter than ``threshold`` bytes, or that does not shrink, is
+    stored raw.
+    """
+    data = text.encode("utf-8")
+    tag = CODECS[codec]
+    if tag != RAW and len(data) >= threshold:
+        if tag == ZLIB:
+            packed = zlib.compress(data, 6)
+        else:
+            packed = lzma.compress(data, preset=6)
+        if len(packed) < len(data):
+            return bytes([tag]) + packed
+    return bytes([RAW]) + data
+
+
+def decompress_text(blob: bytes) -> str:
+    tag, payload = blob[0], blob[1:]
+    if tag == ZLIB:
+        payload = zlib.decompress(payload)
+    elif tag == LZMA:
+        payload = lzma.decompress(payload)
+    elif tag != RAW:
+        raise ValueError(f"Unknown content codec tag: {tag}")
+    return payload.decode("utf-8")
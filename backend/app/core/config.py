@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -8,6 +10,66 @@ class Settings(BaseSettings):
     ALGORITHM: str
     BACKEND_CORS_ORIGINS: list[str] = [""]
 
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    INTERNAL_METRICS_ENABLED: bool = False
+
+    # Page size for list endpoints when the client sends no ``limit``.
+    # Unset keeps the original unpaginated responses for older clients.
+    PAGINATION_DEFAULT_LIMIT: int | None = None
+
+    HISTORY_DELTA_ENABLED: bool = True
+    HISTORY_KEYFRAME_INTERVAL: int = 16
+
+    CONTENT_COMPRESSION: Literal["none", "zlib", "lzma"] = "zlib"
+    CONTENT_COMPRESSION_THRESHOLD: int = 512
+
+    EXPORT_BATCH_SIZE: int = 100
+    IMPORT_BATCH_SIZE: int = 500
+    IMPORT_MAX_LINE_BYTES: int = 1_000_000
+    IMPORT_MAX_BODY_BYTES: int = 100_000_000
+    IMPORT_MAX_ERRORS: int = 1000
+
+    SEARCH_CONFIG: str = "simple"
+
+    DIFF_CACHE_SIZE: int = 1024
+    DIFF_CACHE_TTL: float = 3600.0
+
+    IMPROVE_JOB_STORE: Literal["memory", "database"] = "memory"
+    IMPROVE_JOB_WORKERS: int = 4
+    IMPROVE_JOB_MAX_PENDING: int = 100
+    IMPROVE_JOB_CACHE_SIZE: int = 10_000
+    IMPROVE_JOB_TTL: float = 3600.0
+
+    IMPROVE_CACHE_SIZE: int = 10_000
+    IMPROVE_CACHE_TTL: float = 86_400.0
+    IMPROVE_CACHE_SHARED: bool = False
+
+    IMPROVE_ENGINE: str = "local"
+    # Rule dictionary for the "rules" engine. Unset uses the bundled
+    # starter set of about 60 rules, which is far from complete.
+    IMPROVE_RULES_PATH: str | None = None
+    IMPROVE_ENGINE_CONCURRENCY: int = 8
+    IMPROVE_ENGINE_TIMEOUT: float = 10.0
+    IMPROVE_ENGINE_FAILURE_THRESHOLD: int = 5
+    IMPROVE_ENGINE_RESET_TIMEOUT: float = 30.0
+
+    IMPROVE_BATCH_MAX_SIZE: int = 32
+    IMPROVE_BATCH_MAX_WAIT: float = 0.01
+
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    PASSWORD_HASH_TIMEOUT: float = 5.0
+
+    TOKEN_CACHE_SIZE: int = 10_000
+    PRINCIPAL_CACHE_SIZE: int = 10_000
+    PRINCIPAL_CACHE_TTL: float = 30.0
+
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8"
     )
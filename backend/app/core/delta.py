@@ -0,0 +1,63 @@
+import json
+import os
+from difflib import SequenceMatcher
+from itertools import accumulate
+
+
+def _split_lines(text: str) -> tuple[list[str], list[int]]:
+    lines = text.splitlines(keepends=True)
+    offsets = [0, *accumulate(len(line) for line in lines)]
+    return lines, offsets
+
+
+def make_delta(base: str, target: str) -> str:
+    """Encode ``target`` as copies from ``base`` plus inserted text.
+
+    The result is a JSON list where ``[start, end]`` copies
+    ``base[start:end]`` and a string is inserted literally. The shared
+    prefix and suffix are matched first, the remainder line by line.
+    """
+    prefix = len(os.path.commonprefix([base, target]))
+    max_suffix = min(len(base), len(target)) - prefix
+    suffix = 0
+    while suffix < max_suffix and base[-1 - suffix] == target[-1 - suffix]:
+        suffix += 1
+
+    ops: list[list[int] | str] = []
+
+    def copy(start: int, end: int) -> None:
+        if start == end:
+            return
+        if ops and isinstance(ops[-1], list) and ops[-1][1] == start:
+            ops[-1][1] = end
+        else:
+            ops.append([start, end])
+
+    def insert(text: str) -> None:
+        if not text:
+            return
+        if ops and isinstance(ops[-1], str):
+            ops[-1] += text
+        else:
+            ops.append(text)
+
+    copy(0, prefix)
+    base_mid = base[prefix:len(base) - suffix]
+    target_mid = target[prefix:len(target) - suffix]
+    base_lines, base_offsets = _split_lines(base_mid)
+    target_lines, _ = _split_lines(target_mid)
+    matcher = SequenceMatcher(None, base_lines, target_lines)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            copy(prefix + base_offsets[i1], prefix + base_offsets[i2])
+        elif tag in ("replace", "insert"):
+            insert("".join(target_lines[j1:j2]))
+    copy(len(base) - suffix, len(base))
+    return json.dumps(ops, ensure_ascii=False, separators=(",", ":"))
+
+
+def apply_delta(base: str, delta: str) -> str:
+    return "".join(
+        op if isinstance(op, str) else base[op[0]:op[1]]
+        for op in json.loads(delta)
+    )
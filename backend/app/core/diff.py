@@ -0,0 +1,143 @@
+import re
+from typing import Literal, Sequence
+
+Granularity = Literal["line", "word"]
+
+_WORD = re.compile(r"\s+|\S+\s*")
+
+
+def _tokens(text: str, granularity: Granularity) -> list[str]:
+    if granularity == "line":
+        return text.splitlines(keepends=True)
+    return _WORD.findall(text)
+
+
+def _middle_snake(
+    a: Sequence[str], alo: int, ahi: int,
+    b: Sequence[str], blo: int, bhi: int,
+) -> tuple[int, int, int, int]:
+    """Find the middle snake of the shortest edit script (Myers 1986, 4b).
+
+    Returns ``(x, y, u, v)`` relative to ``alo``/``blo``: the snake runs
+    from ``(x, y)`` to ``(u, v)``, and each side of it needs about half of
+    the edits. Only two diagonal vectors are kept, so memory is O(N + M).
+    """
+    n, m = ahi - alo, bhi - blo
+    delta = n - m
+    odd = delta % 2 == 1
+    limit = (n + m + 1) // 2
+    offset = limit + 1
+    forward = [0] * (2 * offset + 1)
+    backward = [0] * (2 * offset + 1)
+
+    for d in range(limit + 1):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and forward[offset + k - 1]
+                           < forward[offset + k + 1]):
+                x = forward[offset + k + 1]
+            else:
+                x = forward[offset + k - 1] + 1
+            y = x - k
+            start_x, start_y = x, y
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            forward[offset + k] = x
+            if odd and -(d - 1) <= delta - k <= d - 1:
+                if x + backward[offset + delta - k] >= n:
+                    return start_x, start_y, x, y
+
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and backward[offset + k - 1]
+                           < backward[offset + k + 1]):
+                x = backward[offset + k + 1]
+            else:
+                x = backward[offset + k - 1] + 1
+            y = x - k
+            start_x, start_y = x, y
+            while x < n and y < m and a[ahi - 1 - x] == b[bhi - 1 - y]:
+                x += 1
+                y += 1
+            backward[offset + k] = x
+            if not odd and -d <= delta - k <= d:
+                if x + forward[offset + delta - k] >= n:
+                    return n - x, m - y, n - start_x, m - start_y
+
+    raise AssertionError("no middle snake")
+
+
+def _diff(
+    a: Sequence[str], alo: int, ahi: int,
+    b: Sequence[str], blo: int, bhi: int,
+    ops: list[tuple[str, str]],
+) -> None:
+    prefix = []
+    while alo < ahi and blo < bhi and a[alo] == b[blo]:
+        prefix.append(a[alo])
+        alo += 1
+        blo += 1
+    suffix = []
+    while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+        ahi -= 1
+        bhi -= 1
+        suffix.append(a[ahi])
+
+    ops.extend(("equal", token) for token in prefix)
+    if alo == ahi:
+        ops.extend(("insert", token) for token in b[blo:bhi])
+    elif blo == bhi:
+        ops.extend(("delete", token) for token in a[alo:ahi])
+    else:
+        x, y, u, v = _middle_snake(a, alo, ahi, b, blo, bhi)
+        _diff(a, alo, alo + x, b, blo, blo + y, ops)
+        ops.extend(("equal", token) for token in a[alo + x:alo + u])
+        _diff(a, alo + u, ahi, b, blo + v, bhi, ops)
+    ops.extend(("equal", token) for token in reversed(suffix))
+
+
+def _merge(ops: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    merged: list[tuple[str, str]] = []
+    for op, text in ops:
+        if merged and merged[-1][0] == op:
+            merged[-1] = (op, merged[-1][1] + text)
+        else:
+            merged.append((op, text))
+    return merged
+
+
+def diff_tokens(a: Sequence[str], b: Sequence[str]) -> list[tuple[str, str]]:
+    """Shortest edit script from ``a`` to ``b`` as ``(op, token)`` pairs."""
+    ops: list[tuple[str, str]] = []
+    _diff(a, 0, len(a), b, 0, len(b), ops)
+    return ops
+
+
+def diff_text(
+    old: str, new: str, granularity: Granularity = "line"
+) -> list[tuple[str, str]]:
+    """Diff two texts into merged ``equal``/``delete``/``insert`` runs.
+
+    Joining the ``equal`` and ``delete`` runs gives back ``old``; joining
+    ``equal`` and ``insert`` gives ``new``. Word diffs are computed inside
+    changed line blocks only, which keeps their cost close to a line diff.
+    """
+    ops = diff_tokens(_tokens(old, "line"), _tokens(new, "line"))
+    if granularity == "line":
+        return _merge(ops)
+
+    words: list[tuple[str, str]] = []
+    deleted: list[str] = []
+    inserted: list[str] = []
+    for op, line in [*ops, ("equal", "")]:
+        if op == "delete":
+            deleted.append(line)
+        elif op == "insert":
+            inserted.append(line)
+        else:
+            words.extend(diff_tokens(
+                _tokens("".join(deleted), "word"),
+                _tokens("".join(inserted), "word"),
+            ))
+            deleted, inserted = [], []
+            words.append((op, line))
+    return _merge([(op, text) for op, text in words if text])
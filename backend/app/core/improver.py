@@ -0,0 +1,281 @@
+import asyncio
+import importlib
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from time import perf_counter
+from typing import Awaitable, Callable, TypeVar
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.resilience import CircuitBreaker, LatencyHistogram
+from app.core.rewriter import DEFAULT_RULES_PATH, PhraseRewriter, load_rules
+
+T = TypeVar("T")
+
+
+class ImprovementEngine(ABC):
+    """Turns resume text into improved text.
+
+    Subclasses implement ``improve`` and may override ``improve_many``
+    when they can handle a batch in one call, or ``stream`` when they
+    produce output incrementally; the streamed chunks must join to what
+    ``improve`` returns. Bump ``version`` whenever output changes, so
+    cached results are not reused across versions.
+    """
+
+    name = "base"
+    version = "0"
+
+    @abstractmethod
+    async def improve(self, content: str) -> str:
+        """Return the improved version of ``content``."""
+
+    async def improve_many(self, contents: list[str]) -> list[str]:
+        return [await self.improve(content) for content in contents]
+
+    async def stream(self, content: str) -> AsyncIterator[str]:
+        yield await self.improve(content)
+
+
+class LocalEngine(ImprovementEngine):
+    """Deterministic in-process engine, used by default and in tests."""
+
+    name = "local"
+    version = "suffix-1"
+
+    async def improve(self, content: str) -> str:
+        return content + " [Improved]"
+
+    async def stream(self, content: str) -> AsyncIterator[str]:
+        for line in content.splitlines(keepends=True):
+            yield line
+        yield " [Improved]"
+
+
+class RuleEngine(ImprovementEngine):
+    """Offline engine that rewrites weak phrases from a rule dictionary.
+
+    Rules load from ``IMPROVE_RULES_PATH`` and compile once when the
+    engine is built. The bundled list is only a starter set of about 60
+    rules; point the setting at a fuller dictionary for real use. The
+    version carries a digest of the rules, so editing them invalidates
+    cached results.
+    """
+
+    name = "rules"
+
+    def __init__(self, rules: dict[str, str] | None = None):
+        if rules is None:
+            rules = load_rules(
+                settings.IMPROVE_RULES_PATH or DEFAULT_RULES_PATH
+            )
+        self.rewriter = PhraseRewriter(rules)
+        self.version = f"trie-3.{self.rewriter.digest[:12]}"
+
+    async def improve(self, content: str) -> str:
+        return self.rewriter.rewrite(content)
+
+
+ENGINES: dict[str, type[ImprovementEngine]] = {
+    "local": LocalEngine,
+    "rules": RuleEngine,
+}
+
+
+def load_engine(spec: str) -> ImprovementEngine:
+    """Build an engine from a registered name or a ``module:Class`` path."""
+    if spec in ENGINES:
+        return ENGINES[spec]()
+    module_name, _, class_name = spec.partition(":")
+    if not class_name:
+        raise ValueError(f"Unknown improvement engine: {spec}")
+    engine_class = getattr(importlib.import_module(module_name), class_name)
+    return engine_class()
+
+
+class GuardedEngine:
+    """Wraps an engine with a concurrency cap, deadlines and a breaker.
+
+    At most ``concurrency`` calls run at once. ``timeout`` covers waiting
+    for a slot as well as the call itself, so a saturated engine sheds
+    load instead of queueing without bound. Timeouts and errors count
+    toward the circuit breaker; every failure surfaces as a 503.
+    """
+
+    def __init__(
+        self, engine: ImprovementEngine, concurrency: int, timeout: float,
+        breaker: CircuitBreaker
+    ):
+        self.engine = engine
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.breaker = breaker
+        self.latency = LatencyHistogram()
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.rejected = 0
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    @property
+    def name(self) -> str:
+        return self.engine.name
+
+    @property
+    def version(self) -> str:
+        return f"{self.engine.name}/{self.engine.version}"
+
+    async def improve(self, content: str) -> str:
+        return await self._call(self.engine.improve, content)
+
+    async def improve_many(self, contents: list[str]) -> list[str]:
+        return await self._call(self.engine.improve_many, contents)
+
+    async def stream(self, content: str) -> AsyncIterator[str]:
+        """Stream through the same guards as ``improve``.
+
+        A background task drains the engine into a buffer while it holds
+        the slot, so the slot is freed as soon as the engine is done, not
+        when a slow client has read everything. ``timeout`` covers the
+        wait for a slot and each chunk, so a long generation is fine as
+        long as it progresses.
+        """
+        if not self.breaker.allow():
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Improvement engine is unavailable"
+            )
+        # Only the half-open trial is let through outside "closed".
+        trial = self.breaker.state == "half_open"
+
+        buffer: asyncio.Queue[str | None] = asyncio.Queue()
+        producer = asyncio.create_task(self._drain(content, buffer, trial))
+        try:
+            while (chunk := await buffer.get()) is not None:
+                yield chunk
+        finally:
+            # A client that goes away stops the engine as well.
+            producer.cancel()
+            await asyncio.wait([producer])
+            error = None if producer.cancelled() else producer.exception()
+        if error is not None:
+            raise error
+
+    async def _drain(
+        self, content: str, buffer: asyncio.Queue[str | None], trial: bool
+    ) -> None:
+        start = perf_counter()
+        self.in_flight += 1
+        chunks = self.engine.stream(content)
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.timeout)
+            try:
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(
+                            anext(chunks), self.timeout
+                        )
+                    except StopAsyncIteration:
+                        break
+                    buffer.put_nowait(chunk)
+            finally:
+                self._semaphore.release()
+        except asyncio.CancelledError:
+            self.breaker.record_cancelled(trial)
+            raise
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            self.breaker.record_failure()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Improvement engine timed out"
+            )
+        except Exception:
+            self.failed += 1
+            self.breaker.record_failure()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Improvement engine failed"
+            )
+        finally:
+            await chunks.aclose()
+            self.in_flight -= 1
+            self.latency.observe(perf_counter() - start)
+            buffer.put_nowait(None)
+
+        self.completed += 1
+        self.breaker.record_success()
+
+    async def _call(self, func: Callable[..., Awaitable[T]], *args) -> T:
+        if not self.breaker.allow():
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Improvement engine is unavailable"
+            )
+        # Only the half-open trial is let through outside "closed".
+        trial = self.breaker.state == "half_open"
+
+        async def run() -> T:
+            async with self._semaphore:
+                return await func(*args)
+
+        start = perf_counter()
+        self.in_flight += 1
+        try:
+            result = await asyncio.wait_for(run(), self.timeout)
+        except asyncio.CancelledError:
+            self.breaker.record_cancelled(trial)
+            raise
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            self.breaker.record_failure()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Improvement engine timed out"
+            )
+        except Exception:
+            self.failed += 1
+            self.breaker.record_failure()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Improvement engine failed"
+            )
+        finally:
+            self.in_flight -= 1
+            self.latency.observe(perf_counter() - start)
+
+        self.completed += 1
+        self.breaker.record_success()
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "engine": self.version,
+            "concurrency": self.concurrency,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "rejected": self.rejected,
+            "breaker": self.breaker.stats(),
+            "latency": self.latency.stats(),
+        }
+
+
+def guarded(engine: ImprovementEngine) -> GuardedEngine:
+    return GuardedEngine(
+        engine,
+        concurrency=settings.IMPROVE_ENGINE_CONCURRENCY,
+        timeout=settings.IMPROVE_ENGINE_TIMEOUT,
+        breaker=CircuitBreaker(
+            failure_threshold=settings.IMPROVE_ENGINE_FAILURE_THRESHOLD,
+            reset_timeout=settings.IMPROVE_ENGINE_RESET_TIMEOUT,
+        ),
+    )
+
+
+improve_engine = guarded(load_engine(settings.IMPROVE_ENGINE))
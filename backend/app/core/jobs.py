@@ -0,0 +1,88 @@
+import asyncio
+from typing import Awaitable, Callable
+
+from fastapi import HTTPException, status
+
+Job = Callable[[], Awaitable[None]]
+
+
+class JobRunner:
+    """Runs submitted coroutines on a fixed number of worker tasks.
+
+    ``max_pending`` bounds queued plus running jobs; once it is reached
+    ``submit`` fails fast with 503 instead of growing the queue. Workers
+    start lazily on the running loop and are restarted if the loop changes.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[Job] | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    def _ensure_started(self) -> asyncio.Queue[Job]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self.shutdown()
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._tasks = [
+                loop.create_task(self._work()) for _ in range(self.workers)
+            ]
+        return self._queue
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await job()
+                self.completed += 1
+            except Exception:
+                self.failed += 1
+            finally:
+                self.pending -= 1
+                self._queue.task_done()
+
+    def submit(self, job: Job) -> None:
+        queue = self._ensure_started()
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Job queue is full"
+            )
+
+        self.pending += 1
+        self.peak_pending = max(self.peak_pending, self.pending)
+        queue.put_nowait(job)
+
+    async def join(self) -> None:
+        """Wait until every submitted job has finished."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "queued": max(0, self.pending - self.workers),
+            "peak_pending": self.peak_pending,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        self._queue = None
+        self._loop = None
+        self.pending = 0
@@ -0,0 +1,72 @@
+import hashlib
+import re
+import zlib
+
+import numpy as np
+
+# Changing any of these invalidates every stored signature.
+NUM_PERM = 128
+BANDS = 16
+SHINGLE_SIZE = 3
+SEED = 20261018
+
+# With a 31-bit prime every ``a * x + b`` stays below 2**63, so the
+# permutations never wrap around uint64 before the modulo.
+MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+
+_WORD = re.compile(r"\w+")
+_rng = np.random.default_rng(SEED)
+_A = _rng.integers(1, MERSENNE_PRIME, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, MERSENNE_PRIME, size=NUM_PERM, dtype=np.uint64)
+_MIX = np.array(
+    [0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 1], dtype=np.uint64
+)[-SHINGLE_SIZE:]
+
+
+def shingles(text: str) -> np.ndarray:
+    """Hash overlapping word n-grams of ``text`` into unique uint64 values."""
+    words = np.fromiter(
+        (zlib.crc32(word.encode()) for word in _WORD.findall(text.lower())),
+        dtype=np.uint64,
+    )
+    if len(words) < SHINGLE_SIZE:
+        return np.unique(words)
+    windows = np.lib.stride_tricks.sliding_window_view(words, SHINGLE_SIZE)
+    return np.unique((windows * _MIX).sum(axis=1))
+
+
+def signature(text: str) -> np.ndarray | None:
+    """MinHash signature of ``text`` as ``NUM_PERM`` uint32 values.
+
+    Returns None for text without any words: it has no shingles, so any
+    signature would make all such texts look identical.
+    """
+    hashes = shingles(text) % MERSENNE_PRIME
+    if not len(hashes):
+        return None
+    permuted = (np.outer(hashes, _A) + _B) % MERSENNE_PRIME
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+def band_keys(sig: np.ndarray) -> list[int]:
+    """One signed 64-bit bucket key per LSH band of ``sig``."""
+    return [
+        int.from_bytes(
+            hashlib.blake2b(band.tobytes(), digest_size=8).digest(),
+            "big", signed=True,
+        )
+        for band in sig.reshape(BANDS, -1)
+    ]
+
+
+def similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """Estimated Jaccard similarity of the texts behind two signatures."""
+    return float(np.count_nonzero(first == second)) / NUM_PERM
+
+
+def to_bytes(sig: np.ndarray) -> bytes:
+    return sig.astype("<u4").tobytes()
+
+
+def from_bytes(data: bytes) -> np.ndarray:
+    return np.frombuffer(data, dtype="<u4")
@@ -0,0 +1,48 @@
+import base64
+import json
+from typing import Any, Callable, Sequence
+
+from fastapi import HTTPException, status
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(key: int) -> str:
+    raw = json.dumps({"k": key}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str | None) -> int | None:
+    if cursor is None:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded))["k"]
+    except (ValueError, TypeError, KeyError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+    if not isinstance(key, int):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+    return key
+
+
+def fetch_limit(limit: int | None) -> int | None:
+    """Rows to fetch for a page: one extra to tell whether more follow."""
+    return None if limit is None else limit + 1
+
+
+def paginate(
+    rows: Sequence[Any], limit: int | None, key: Callable[[Any], int]
+) -> tuple[list[Any], str | None]:
+    """Split a ``limit + 1`` fetch into a page and the cursor after it."""
+    if limit is None:
+        return list(rows), None
+    page = list(rows[:limit])
+    if len(rows) > limit and page:
+        return page, encode_cursor(key(page[-1]))
+    return page, None
@@ -0,0 +1,129 @@
+import csv
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+
+from fastapi import HTTPException, status
+
+Record = dict | str
+
+_BOM = b"\xef\xbb\xbf"
+
+
+def _too_large(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail
+    )
+
+
+async def _lines(
+    chunks: AsyncIterable[bytes], max_line_bytes: int | None = None,
+    max_body_bytes: int | None = None
+) -> AsyncIterator[str]:
+    # Split on raw bytes so lengths are checked before anything is
+    # decoded; a newline byte never occurs inside a UTF-8 sequence.
+    buffer = b""
+    body_bytes = 0
+    first = True
+    async for chunk in chunks:
+        body_bytes += len(chunk)
+        if max_body_bytes is not None and body_bytes > max_body_bytes:
+            raise _too_large(
+                f"Import body is larger than {max_body_bytes} bytes"
+            )
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        if max_line_bytes is not None and (
+            len(buffer) > max_line_bytes
+            or any(len(line) > max_line_bytes for line in lines)
+        ):
+            raise _too_large(
+                f"Import line is longer than {max_line_bytes} bytes"
+            )
+        for line in lines:
+            if first:
+                line, first = line.removeprefix(_BOM), False
+            yield line.decode("utf-8", errors="replace")
+    if buffer:
+        if first:
+            buffer = buffer.removeprefix(_BOM)
+        yield buffer.decode("utf-8", errors="replace")
+
+
+async def iter_ndjson(
+    chunks: AsyncIterable[bytes], max_line_bytes: int | None = None,
+    max_body_bytes: int | None = None
+) -> AsyncIterator[tuple[int, Record]]:
+    """Yield ``(row, object)`` per non-blank line, or an error message.
+
+    Lines or bodies over the given limits abort the parse with a 413.
+    """
+    row = 0
+    async for line in _lines(chunks, max_line_bytes, max_body_bytes):
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield row, f"Invalid JSON: {exc.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield row, "Expected a JSON object"
+            continue
+        yield row, record
+
+
+async def _csv_records(
+    chunks: AsyncIterable[bytes], max_line_bytes: int | None,
+    max_body_bytes: int | None
+) -> AsyncIterator[str]:
+    # A newline only ends a record outside quotes, i.e. after an even
+    # number of quote characters.
+    record, quotes, size = [], 0, 0
+    async for line in _lines(chunks, max_line_bytes, max_body_bytes):
+        record.append(line)
+        quotes += line.count('"')
+        size += len(line.encode("utf-8")) + 1
+        # Quoted newlines can join many lines into one record, so the
+        # line limit applies to the record as a whole.
+        if max_line_bytes is not None and size > max_line_bytes:
+            raise _too_large(
+                f"Import record is longer than {max_line_bytes} bytes"
+            )
+        if quotes % 2 == 0:
+            yield "\n".join(record)
+            record, quotes, size = [], 0, 0
+    if record:
+        yield "\n".join(record)
+
+
+async def iter_csv(
+    chunks: AsyncIterable[bytes], max_line_bytes: int | None = None,
+    max_body_bytes: int | None = None
+) -> AsyncIterator[tuple[int, Record]]:
+    """Yield ``(row, object)`` per CSV data row keyed by the header row.
+
+    Records or bodies over the given limits abort the parse with a 413.
+    """
+    header = None
+    row = 0
+    async for text in _csv_records(chunks, max_line_bytes, max_body_bytes):
+        if not text.strip():
+            continue
+        try:
+            fields = next(csv.reader([text], strict=True))
+        except csv.Error as exc:
+            fields = exc
+        if header is None:
+            if isinstance(fields, csv.Error):
+                yield 0, f"Invalid CSV header: {fields}"
+                return
+            header = [name.strip() for name in fields]
+            continue
+        row += 1
+        if isinstance(fields, csv.Error):
+            yield row, f"Invalid CSV: {fields}"
+        elif len(fields) != len(header):
+            yield row, f"Expected {len(header)} fields, got {len(fields)}"
+        else:
+            yield row, dict(zip(header, fields))
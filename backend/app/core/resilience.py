@@ -0,0 +1,112 @@
+import bisect
+import time
+
+LATENCY_BUCKETS_MS = (
+    5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, float("inf")
+)
+
+
+class CircuitBreaker:
+    """Fails fast after ``failure_threshold`` consecutive failures.
+
+    Once open, calls are refused until ``reset_timeout`` seconds pass; then
+    a single trial call is let through, and its outcome closes the circuit
+    again or reopens it for another ``reset_timeout``.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened = 0
+        self._opened_at: float | None = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial:
+            self._trial = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+        self._trial = False
+
+    def record_cancelled(self, trial: bool) -> None:
+        """Forget a call that was abandoned before it finished.
+
+        A cancellation says nothing about the engine, so nothing is
+        counted. If the call was the half-open trial, which ``allow``
+        granted while ``state`` was ``"half_open"``, its slot is freed for
+        the next caller; an older call cancelled meanwhile leaves it alone.
+        """
+        if trial:
+            self._trial = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._trial or self.failures >= self.failure_threshold:
+            if self._opened_at is None or self._trial:
+                self.opened += 1
+            self._opened_at = time.monotonic()
+            self._trial = False
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened": self.opened,
+        }
+
+
+class LatencyHistogram:
+    """Counts observed latencies into fixed millisecond buckets."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.buckets, ms)] += 1
+        self.count += 1
+        self.total += ms
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile, in ms."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.buckets[-1]
+
+    def stats(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": self.total / self.count if self.count else 0.0,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": {
+                f"le_{bound:g}": count
+                for bound, count in zip(self.buckets, self.counts)
+            },
+        }
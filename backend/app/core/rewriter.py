@@ -0,0 +1,161 @@
+import hashlib
+import re
+from pathlib import Path
+
+DEFAULT_RULES_PATH = Path(__file__).with_name("improve_rules.tsv")
+
+# A phrase must not touch a word character, or a hyphen or apostrophe
+# joined to one, so "just-in-time" and "don't" stay whole words.
+_START = r"(?<!\w)(?<!\w[-'\u2019])"
+_END = r"(?!\w)(?![-'\u2019]\w)"
+
+# What a deleted phrase takes with it: a following comma and spaces.
+_DELETED_TAIL = re.compile(r",?([ \t]*)")
+_TRAILING_SPACES = re.compile(r"[ \t]+$")
+_LETTER = re.compile(r"[^\W\d_]")
+
+
+def _normalize(phrase: str) -> str:
+    return " ".join(phrase.lower().split())
+
+
+def _deletable(text: str, start: int, end: int) -> bool:
+    # Only delete a phrase that stands between spaces, with at most a comma
+    # after it; one touching a quote, bracket or full stop is left alone.
+    return (start == 0 or text[start - 1].isspace()) and (
+        end == len(text) or text[end].isspace() or text[end] == ","
+    )
+
+
+def _capitalize(text: str) -> tuple[str, bool]:
+    # Upper-case the first letter, skipping punctuation and spaces; report
+    # whether there was one.
+    letter = _LETTER.search(text)
+    if letter is None:
+        return text, False
+    i = letter.start()
+    return text[:i] + text[i].upper() + text[i + 1:], True
+
+
+def load_rules(path: str | Path = DEFAULT_RULES_PATH) -> dict[str, str]:
+    """Read ``phrase<TAB>replacement`` lines, skipping blanks and ``#``.
+
+    An empty replacement deletes the phrase. Later lines win over earlier
+    ones for the same phrase.
+    """
+    rules = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            phrase, _, replacement = line.partition("\t")
+            rules[phrase] = replacement.strip()
+    return rules
+
+
+def _trie_pattern(phrases: list[str]) -> str:
+    # Factor the phrases into a character trie so the combined pattern
+    # branches on one character at a time instead of trying every rule.
+    trie: dict = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [
+            (r"\s+" if char == " " else re.escape(char)) + build(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else (
+            "(?:" + "|".join(branches) + ")"
+        )
+        # Longer phrases are tried first, so the longest rule wins.
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class PhraseRewriter:
+    """Rewrites whole-word phrases from a rule dictionary in one pass.
+
+    All rules are compiled once into a single trie-shaped pattern, so the
+    scan costs the same whether there are ten rules or tens of thousands.
+    Matching ignores case and treats any run of whitespace as one space;
+    at each position the longest rule wins. Hyphenated and apostrophised
+    words count as one word, so a rule never matches inside them. A
+    capitalised match gets a capitalised replacement. Deleting a phrase
+    also drops the space next to it, or a comma and space after it, and
+    passes its capital on to the next letter; a phrase touching other
+    punctuation, such as quotes or a full stop, is not deleted.
+    """
+
+    def __init__(self, rules: dict[str, str]):
+        self.rules = {
+            _normalize(phrase): replacement
+            for phrase, replacement in rules.items() if phrase.strip()
+        }
+        self.digest = hashlib.sha256(
+            "\n".join(
+                f"{phrase}\t{self.rules[phrase]}"
+                for phrase in sorted(self.rules)
+            ).encode()
+        ).hexdigest()
+        self._pattern = re.compile(
+            _START + _trie_pattern(list(self.rules)) + _END
+        ) if self.rules else None
+
+    def rewrite(self, text: str) -> str:
+        if self._pattern is None:
+            return text
+
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # A few characters grow when lowercased; keep offsets aligned.
+            lowered = "".join(
+                lower if len(lower := char.lower()) == 1 else char
+                for char in text
+            )
+
+        pieces = []
+        pos = 0
+        capitalize = False
+        for match in self._pattern.finditer(lowered):
+            start, end = match.span()
+            if start < pos:
+                continue
+            phrase = match.group()
+            replacement = self.rules.get(phrase)
+            if replacement is None:
+                replacement = self.rules[" ".join(phrase.split())]
+            if not replacement and not _deletable(text, start, end):
+                continue
+
+            before = text[pos:start]
+            if capitalize:
+                before, done = _capitalize(before)
+                capitalize = not done
+            if not replacement:
+                tail = _DELETED_TAIL.match(text, end)
+                if not tail.group(1):
+                    before = _TRAILING_SPACES.sub("", before)
+                end = tail.end()
+                # Deleting a capitalised phrase passes the capital on.
+                capitalize = capitalize or text[start].isupper()
+            elif capitalize or text[start].isupper():
+                replacement = replacement[0].upper() + replacement[1:]
+                capitalize = False
+
+            pieces.append(before)
+            pieces.append(replacement)
+            pos = end
+
+        rest = text[pos:]
+        if capitalize:
+            rest, _ = _capitalize(rest)
+        pieces.append(rest)
+        return "".join(pieces)
@@ -0,0 +1,41 @@
+import html
+import re
+
+MAX_TERMS = 16
+SNIPPET_WIDTH = 200
+
+_WORD = re.compile(r"\w+")
+
+
+def search_terms(query: str) -> list[str]:
+    """Split a free-text query into unique lowercase words, in order."""
+    terms = dict.fromkeys(word.lower() for word in _WORD.findall(query))
+    return list(terms)[:MAX_TERMS]
+
+
+def highlight(text: str, terms: list[str], width: int = SNIPPET_WIDTH) -> str:
+    """Return an HTML-escaped snippet of ``text`` with terms in <mark>.
+
+    The snippet is centred on the first match; text without a match is
+    trimmed from the start.
+    """
+    pattern = re.compile(
+        r"\b(" + "|".join(map(re.escape, terms)) + r")\b", re.IGNORECASE
+    )
+    match = pattern.search(text)
+    start = 0
+    if match and len(text) > width:
+        start = max(0, min(match.start() - width // 2, len(text) - width))
+    end = start + width
+    snippet = text[start:end]
+
+    parts, position = [], 0
+    for found in pattern.finditer(snippet):
+        parts.append(html.escape(snippet[position:found.start()]))
+        parts.append(f"<mark>{html.escape(found.group())}</mark>")
+        position = found.end()
+    parts.append(html.escape(snippet[position:]))
+    return (
+        ("…" if start > 0 else "") + "".join(parts)
+        + ("…" if end < len(text) else "")
+    )
@@ -1,12 +1,24 @@
+import asyncio
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone, timedelta
+from typing import Any, Callable
+
 import jwt
 from fastapi import HTTPException, status
 from passlib.context import CryptContext
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+verified_tokens = TTLCache(maxsize=settings.TOKEN_CACHE_SIZE)
+principals = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE, ttl=settings.PRINCIPAL_CACHE_TTL
+)
+
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -16,6 +28,115 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+class PasswordHasher:
+    """Runs bcrypt in a process pool so it never blocks the event loop.
+
+    ``max_pending`` bounds in-flight plus queued calls; once it is reached
+    new calls fail fast with 503 instead of piling up behind the pool. A
+    call keeps its slot until the pool is done with it, even when the
+    caller has already timed out, so the bound reflects the real backlog.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, timeout: float):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service is busy"
+            )
+
+        loop = asyncio.get_running_loop()
+        try:
+            future = self._get_executor().submit(func, *args)
+        except BrokenProcessPool:
+            self._executor = None
+            raise
+        self.pending += 1
+        self.peak_pending = max(self.peak_pending, self.pending)
+        future.add_done_callback(
+            lambda _: self._release_threadsafe(loop)
+        )
+        try:
+            result = await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=self.timeout
+            )
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service timed out"
+            )
+        except BrokenProcessPool:
+            self._executor = None
+            raise
+
+        self.completed += 1
+        return result
+
+    def _release_threadsafe(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Runs on the pool's management thread once the work is finished
+        # or cancelled; hop back to the loop that owns the counter.
+        try:
+            loop.call_soon_threadsafe(self._release)
+        except RuntimeError:
+            self._release()
+
+    def _release(self) -> None:
+        self.pending -= 1
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "queued": max(0, self.pending - self.max_workers),
+            "peak_pending": self.peak_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    timeout=settings.PASSWORD_HASH_TIMEOUT,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    return await password_hasher.run(hash_password, password)
+
+
+async def verify_password_async(
+    plain_password: str, hashed_password: str
+) -> bool:
+    return await password_hasher.run(
+        verify_password, plain_password, hashed_password
+    )
+
+
 def create_jwt(data: dict) -> str:
     to_encode = data.copy()
     expires = datetime.now(timezone.utc) + timedelta(
@@ -42,3 +163,11 @@ def decode_jwt(token: str) -> dict:
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
         )
+
+
+def token_cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def invalidate_principal(user_id: int) -> None:
+    principals.delete(user_id)
@@ -1,11 +1,59 @@
+from time import perf_counter
+
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     create_async_engine, async_sessionmaker,
-    AsyncSession,
+    AsyncSession, AsyncEngine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.checkout_timeouts += 1
+            raise
+        finally:
+            waited = perf_counter() - start
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+
+def engine_options(database_url: str) -> dict:
+    options = {
+        "echo": settings.DB_ECHO,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if make_url(database_url).get_backend_name() != "sqlite":
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+    return options
+
+
+engine = create_async_engine(
+    settings.DATABASE_URL, **engine_options(settings.DATABASE_URL)
+)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -13,6 +61,28 @@ AsyncSessionLocal = async_sessionmaker(
     class_=AsyncSession
 )
 
+
+def pool_status(db_engine: AsyncEngine = engine) -> dict:
+    pool = db_engine.pool
+    status = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(0, pool.overflow()),
+            max_overflow=pool._max_overflow,
+        )
+    if isinstance(pool, InstrumentedQueuePool):
+        status.update(
+            checkouts=pool.checkouts,
+            checkout_timeouts=pool.checkout_timeouts,
+            wait_avg=pool.wait_total / pool.checkouts if pool.checkouts else 0.0,
+            wait_max=pool.wait_max,
+        )
+    return status
+
+
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
@@ -5,7 +5,10 @@ from fastapi.security import (
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import decode_jwt
+from app.core.config import settings
+from app.core.security import (
+    decode_jwt, token_cache_key, verified_tokens, principals,
+)
 from app.database import get_db
 from app.repositories.user_repo import UserRepository
 from app.schemas.user import UserResponse
@@ -20,6 +23,23 @@ def swagger_auth(
     return credentials
 
 
+def internal_metrics_enabled():
+    # The metrics expose pool, cache and engine internals and carry no
+    # authentication, so they stay hidden unless explicitly enabled.
+    if not settings.INTERNAL_METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+
+def decode_token(token: str) -> dict:
+    key = token_cache_key(token)
+    payload = verified_tokens.get(key)
+    if payload is None:
+        payload = decode_jwt(token)
+        if "exp" in payload:
+            verified_tokens.set(key, payload, expires_at=payload["exp"])
+    return payload
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
 ):
@@ -29,14 +49,22 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = decode_jwt(token)
+        payload = decode_token(token)
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
     except HTTPException:
         raise
 
+    user_id = payload.get("uid")
+    if user_id is not None:
+        principal = principals.get(user_id)
+        if principal is not None and principal.email == email:
+            return principal
+
     user = await UserRepository(db).get_by_email(email=email)
     if user is None:
         raise credentials_exception
-    return UserResponse.model_validate(user)
+    principal = UserResponse.model_validate(user)
+    principals.set(principal.id, principal)
+    return principal
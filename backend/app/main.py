@@ -1,10 +1,28 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.security import password_hasher
+from app.database import engine
+from app.dependencies import internal_metrics_enabled
 from app.routers.auth import router as auth_router
+from app.routers.internal import router as internal_router
 from app.routers.resume import router as resume_router
-app = FastAPI()
+from app.services.resume_service import improve_jobs
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    improve_jobs.shutdown()
+    password_hasher.shutdown()
+    await engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -12,7 +30,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(auth_router, prefix="/auth", tags=["auth"])
 app.include_router(resume_router, prefix="/resumes", tags=["resumes"])
+app.include_router(
+    internal_router, prefix="/internal", include_in_schema=False,
+    dependencies=[Depends(internal_metrics_enabled)],
+)
@@ -1,2 +1,7 @@
 from .user import User
-from .resume import Resume, ResumeHistory
\ No newline at end of file
+from .blob import ContentBlob
+from .resume import Resume, ResumeHistory
+from .similarity import ResumeSignature, ResumeBucket
+from . import search
+from .job import ImproveJob
+from .improve_result import ImproveResult
@@ -0,0 +1,25 @@
+import hashlib
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+from app.models.types import CompressedText
+
+
+def content_digest(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class ContentBlob(Base):
+    __tablename__ = "content_blobs"
+
+    digest: Mapped[str] = mapped_column(
+        String(64), unique=True, nullable=False
+    )
+    content: Mapped[str] = mapped_column(CompressedText, nullable=False)
+    # Size of the UTF-8 text in bytes, before compression.
+    size: Mapped[int] = mapped_column(nullable=False)
+    refcount: Mapped[int] = mapped_column(
+        nullable=False, default=0, server_default="0"
+    )
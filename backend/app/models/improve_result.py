@@ -0,0 +1,15 @@
+from datetime import datetime
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+from app.models.types import CompressedText
+
+
+class ImproveResult(Base):
+    __tablename__ = "improve_results"
+
+    id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    content: Mapped[str] = mapped_column(CompressedText, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(nullable=False, index=True)
@@ -1,42 +1,82 @@
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import ForeignKey, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import ForeignKey, Index, false, func, select
+from sqlalchemy.orm import (
+    Mapped, column_property, mapped_column, relationship
+)
 
 from app.models.base import Base
+from app.models.blob import ContentBlob
+
+
+def blob_content(content_id):
+    # Deferred so that loading a row neither joins nor decompresses its
+    # text; queries that return content ask for it with undefer().
+    return column_property(
+        select(ContentBlob.content)
+        .where(ContentBlob.id == content_id)
+        .correlate_except(ContentBlob)
+        .scalar_subquery(),
+        deferred=True, raiseload=True,
+    )
 
 
 class Resume(Base):
     __tablename__ = "resumes"
+    __table_args__ = (
+        Index("ix_resumes_user_id_id", "user_id", "id"),
+    )
 
     title: Mapped[str] = mapped_column(nullable=False)
-    content: Mapped[str] = mapped_column(nullable=False)
+    content_id: Mapped[int] = mapped_column(
+        ForeignKey("content_blobs.id"), nullable=False
+    )
+    content: Mapped[str] = blob_content(content_id)
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
+    current_version: Mapped[int] = mapped_column(
+        nullable=False, default=0, server_default="0"
+    )
 
-    user: Mapped["User"] = relationship("User", back_populates="resumes")
+    user: Mapped["User"] = relationship(
+        "User", back_populates="resumes", lazy="raise"
+    )
     histories: Mapped[List["ResumeHistory"]] = relationship(
         "ResumeHistory",
         back_populates="resume",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        passive_deletes=True,
+        lazy="raise"
     )
 
 
 class ResumeHistory(Base):
     __tablename__ = "resume_history"
+    __table_args__ = (
+        Index(
+            "ix_resume_history_resume_id_version",
+            "resume_id", "version", unique=True
+        ),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     resume_id: Mapped[int] = mapped_column(
         ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False
     )
     version: Mapped[int] = mapped_column(nullable=False)
-    content: Mapped[str] = mapped_column(nullable=False)
+    content_id: Mapped[int] = mapped_column(
+        ForeignKey("content_blobs.id"), nullable=False
+    )
+    content: Mapped[str] = blob_content(content_id)
+    is_delta: Mapped[bool] = mapped_column(
+        nullable=False, default=False, server_default=false()
+    )
     created_at: Mapped[datetime] = mapped_column(
         nullable=False, server_default=func.now()
     )
 
     resume: Mapped["Resume"] = relationship(
-        "Resume", back_populates="histories"
+        "Resume", back_populates="histories", lazy="raise"
     )
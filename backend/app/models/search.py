@@ -0,0 +1,34 @@
+from sqlalchemy import DDL, event
+
+from app.models.base import Base
+
+# The search index is dialect specific, so it is created with DDL rather
+# than mapped: a tsvector table with a GIN index on Postgres and an FTS5
+# virtual table (rowid = resume id) on SQLite.
+POSTGRES_DDL = (
+    "CREATE TABLE resume_search ("
+    "resume_id INTEGER PRIMARY KEY REFERENCES resumes (id) ON DELETE CASCADE, "
+    "user_id INTEGER NOT NULL, "
+    "document TSVECTOR NOT NULL)",
+    "CREATE INDEX ix_resume_search_document "
+    "ON resume_search USING gin (document)",
+)
+SQLITE_DDL = (
+    "CREATE VIRTUAL TABLE resume_search USING fts5("
+    "user_id UNINDEXED, title, content, "
+    "tokenize = 'unicode61 remove_diacritics 2')",
+)
+
+for statement in POSTGRES_DDL:
+    event.listen(
+        Base.metadata, "after_create",
+        DDL(statement).execute_if(dialect="postgresql")
+    )
+for statement in SQLITE_DDL:
+    event.listen(
+        Base.metadata, "after_create",
+        DDL(statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    Base.metadata, "before_drop", DDL("DROP TABLE IF EXISTS resume_search")
+)
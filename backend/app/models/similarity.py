@@ -0,0 +1,29 @@
+from sqlalchemy import BigInteger, ForeignKey, Index, LargeBinary, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class ResumeSignature(Base):
+    __tablename__ = "resume_signatures"
+
+    resume_id: Mapped[int] = mapped_column(
+        ForeignKey("resumes.id", ondelete="CASCADE"),
+        unique=True, nullable=False
+    )
+    signature: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+
+class ResumeBucket(Base):
+    __tablename__ = "resume_lsh_buckets"
+    __table_args__ = (
+        Index("ix_resume_lsh_buckets_lookup", "user_id", "band", "bucket"),
+    )
+
+    resume_id: Mapped[int] = mapped_column(
+        ForeignKey("resumes.id", ondelete="CASCADE"),
+        index=True, nullable=False
+    )
+    user_id: Mapped[int] = mapped_column(nullable=False)
+    band: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    bucket: Mapped[int] = mapped_column(BigInteger, nullable=False)
@@ -0,0 +1,26 @@
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+from app.core.compression import compress_text, decompress_text
+from app.core.config import settings
+
+
+class CompressedText(TypeDecorator):
+    """Text column stored as tagged, optionally compressed bytes."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: str | None, dialect) -> bytes | None:
+        if value is None:
+            return None
+        return compress_text(
+            value,
+            codec=settings.CONTENT_COMPRESSION,
+            threshold=settings.CONTENT_COMPRESSION_THRESHOLD,
+        )
+
+    def process_result_value(self, value: bytes | None, dialect) -> str | None:
+        if value is None:
+            return None
+        return decompress_text(bytes(value))
@@ -15,5 +15,6 @@ class User(Base):
         "Resume",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        passive_deletes=True,
+        lazy="raise"
     )
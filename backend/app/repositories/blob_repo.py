@@ -0,0 +1,74 @@
+from collections import Counter
+
+from sqlalchemy import bindparam, delete, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ContentBlob
+from app.models.blob import content_digest
+
+_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+class BlobRepository:
+    """Stores each distinct text once and counts the rows pointing at it."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def acquire(self, content: str) -> int:
+        return (await self.acquire_many([content]))[0]
+
+    async def acquire_many(self, contents: list[str]) -> list[int]:
+        """Take one reference per item with a single multi-row upsert."""
+        # Postgres refuses to upsert the same row twice in one statement,
+        # so repeated texts are folded into one row with a larger count.
+        counts = Counter(contents)
+        digests = {content: content_digest(content) for content in counts}
+        insert = _INSERTS[self.db.bind.dialect.name]
+        query = insert(ContentBlob).values([
+            {
+                "digest": digests[content],
+                "content": content,
+                "size": len(content.encode("utf-8")),
+                "refcount": references,
+            }
+            for content, references in counts.items()
+        ])
+        result = await self.db.execute(
+            query.on_conflict_do_update(
+                index_elements=[ContentBlob.digest],
+                set_={
+                    "refcount": ContentBlob.refcount + query.excluded.refcount
+                },
+            ).returning(ContentBlob.digest, ContentBlob.id)
+        )
+        blob_ids = dict(result.all())
+        return [blob_ids[digests[content]] for content in contents]
+
+    async def release(self, *blob_ids: int) -> None:
+        """Drop one reference per id and delete blobs nobody points at."""
+        counts = Counter(blob_ids)
+        if not counts:
+            return
+
+        blobs = ContentBlob.__table__
+        await self.db.execute(
+            update(blobs)
+            .where(blobs.c.id == bindparam("blob_id"))
+            .values(refcount=blobs.c.refcount - bindparam("references")),
+            [
+                {"blob_id": blob_id, "references": references}
+                for blob_id, references in counts.items()
+            ],
+        )
+        await self.purge(*counts)
+
+    async def purge(self, *blob_ids: int) -> None:
+        """Delete the given blobs if nothing references them any more."""
+        blobs = ContentBlob.__table__
+        await self.db.execute(
+            delete(blobs).where(
+                blobs.c.id.in_(blob_ids), blobs.c.refcount <= 0
+            )
+        )
@@ -0,0 +1,40 @@
+from datetime import datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ImproveResult
+
+_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+class ImproveResultRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get(self, key: str, now: datetime) -> str | None:
+        result = await self.db.execute(
+            select(ImproveResult.content).where(
+                ImproveResult.id == key, ImproveResult.expires_at > now
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def put(self, key: str, content: str, expires_at: datetime) -> None:
+        insert = _INSERTS[self.db.bind.dialect.name]
+        query = insert(ImproveResult).values(
+            id=key, content=content, expires_at=expires_at
+        )
+        await self.db.execute(query.on_conflict_do_update(
+            index_elements=[ImproveResult.id],
+            set_={
+                "content": query.excluded.content,
+                "expires_at": query.excluded.expires_at,
+            },
+        ))
+
+    async def purge_expired(self, now: datetime) -> None:
+        await self.db.execute(
+            delete(ImproveResult).where(ImproveResult.expires_at <= now)
+        )
@@ -0,0 +1,25 @@
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ImproveJob
+
+
+class ImproveJobRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, **values) -> None:
+        self.db.add(ImproveJob(**values))
+        await self.db.flush()
+
+    async def get(self, job_id: str) -> ImproveJob | None:
+        result = await self.db.execute(
+            select(ImproveJob).where(ImproveJob.id == job_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def update(self, job_id: str, **values) -> None:
+        await self.db.execute(
+            update(ImproveJob).where(ImproveJob.id == job_id).values(**values)
+        )
@@ -1,7 +1,17 @@
-from sqlalchemy import select
+from collections.abc import AsyncIterator
+
+from sqlalchemy import Row, select, delete, insert, update, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, undefer
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.models import Resume, ResumeHistory
+from app.core.config import settings
+from app.core.delta import make_delta, apply_delta
+from app.models import ContentBlob, Resume, ResumeHistory
+from app.models.blob import content_digest
+from app.repositories.blob_repo import BlobRepository
+from app.repositories.search_repo import SearchRepository
+from app.repositories.similarity_repo import SimilarityRepository
 from app.schemas.resume import ResumeCreate, ResumeUpdate
 
 
@@ -9,49 +19,242 @@ class ResumeRepository:
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.blobs = BlobRepository(db)
+        self.search = SearchRepository(db)
+        self.similarity = SimilarityRepository(db)
 
     async def create(self, resume_in: ResumeCreate, user_id: int) -> Resume:
         resume = Resume(
             title=resume_in.title,
+            content_id=await self.blobs.acquire(resume_in.content),
             content=resume_in.content,
             user_id=user_id,
         )
         self.db.add(resume)
-        await self.db.commit()
-        await self.db.refresh(resume)
+        await self.db.flush()
+        await self._index([{
+            "resume_id": resume.id,
+            "user_id": user_id,
+            "title": resume.title,
+            "content": resume.content,
+        }], replace=False)
         return resume
 
-    async def get_by_id(self, ID: int) -> Resume | None:
-        result = await self.db.execute(select(Resume).where(Resume.id == ID))
+    async def create_many(
+        self, resumes_in: list[ResumeCreate], user_id: int
+    ) -> None:
+        contents = [resume_in.content for resume_in in resumes_in]
+        content_ids = await self.blobs.acquire_many(contents)
+        result = await self.db.execute(
+            insert(Resume).returning(
+                Resume.id, Resume.title, Resume.content_id
+            ),
+            [
+                {
+                    "title": resume_in.title,
+                    "content_id": content_id,
+                    "user_id": user_id,
+                }
+                for resume_in, content_id in zip(resumes_in, content_ids)
+            ],
+        )
+        # RETURNING order is not guaranteed, so match text by blob id.
+        content_by_id = dict(zip(content_ids, contents))
+        await self._index([
+            {
+                "resume_id": resume_id,
+                "user_id": user_id,
+                "title": title,
+                "content": content_by_id[content_id],
+            }
+            for resume_id, title, content_id in result
+        ], replace=False)
+
+    async def get_by_id(
+        self, ID: int, with_content: bool = True
+    ) -> Resume | None:
+        query = select(Resume).where(Resume.id == ID).options(raiseload("*"))
+        if with_content:
+            query = query.options(undefer(Resume.content))
+        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_contents(self, resume_ids: list[int]) -> list[Row]:
+        result = await self.db.execute(
+            select(Resume.id, Resume.user_id, Resume.content)
+            .where(Resume.id.in_(resume_ids))
+        )
+        return list(result)
+
+    async def get_owner_id(self, resume_id: int) -> int | None:
+        result = await self.db.execute(
+            select(Resume.user_id).where(Resume.id == resume_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def list_by_user(
+        self, user_id: int, after_id: int | None = None,
+        limit: int | None = None
+    ) -> list[Resume]:
+        query = select(Resume).where(Resume.user_id == user_id)
+        if after_id is not None:
+            query = query.where(Resume.id > after_id)
+        query = query.order_by(Resume.id).limit(limit).options(
+            raiseload("*"), undefer(Resume.content)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars())
+
+    async def stream_by_user(
+        self, user_id: int, batch_size: int
+    ) -> AsyncIterator[list[Row]]:
+        result = await self.db.stream(
+            select(
+                Resume.id, Resume.title, Resume.content, Resume.user_id
+            ).where(Resume.user_id == user_id).order_by(Resume.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for rows in result.partitions():
+            yield rows
+
     async def update(
-        self, resume_id: int, resume_in: ResumeUpdate
+        self, resume_id: int, resume_in: ResumeUpdate,
+        owner_id: int | None = None
     ) -> Resume | None:
-        resume = await self.get_by_id(resume_id)
-        if not resume:
+        values = resume_in.model_dump(exclude_unset=True, exclude_none=True)
+        content = values.pop("content", None)
+        if not values and content is None:
+            resume = await self.get_by_id(resume_id)
+            if resume and owner_id is not None and resume.user_id != owner_id:
+                return None
+            return resume
+
+        criteria = [Resume.id == resume_id]
+        if owner_id is not None:
+            criteria.append(Resume.user_id == owner_id)
+        if content is not None:
+            old_content_id = await self._lock_content(content, *criteria)
+            if old_content_id is None:
+                return None
+            values["content_id"] = await self.blobs.acquire(content)
+
+        result = await self.db.execute(
+            update(Resume).where(*criteria).values(**values)
+            .returning(Resume, Resume.content)
+        )
+        row = result.one_or_none()
+        if content is not None:
+            await self.blobs.release(old_content_id)
+        if row is None:
             return None
 
-        resume.title = resume_in.title
-        resume.content = resume_in.content
-        await self.db.commit()
-        await self.db.refresh(resume)
+        # RETURNING an entity skips column_property expressions, so the
+        # blob text comes back as a separate column.
+        resume, resume_content = row
+        set_committed_value(resume, "content", resume_content)
+        entries = [{
+            "resume_id": resume.id,
+            "user_id": resume.user_id,
+            "title": resume.title,
+            "content": resume_content,
+        }]
+        # Signatures only depend on the content, so a rename skips them.
+        if content is None:
+            await self.search.index(entries)
+        else:
+            await self._index(entries)
         return resume
 
-    async def delete(self, resume_id: int) -> Resume | None:
-        resume = await self.get_by_id(resume_id)
+    async def store_next_version(
+        self, resume_id: int, content: str, owner_id: int
+    ) -> int | None:
+        criteria = (Resume.id == resume_id, Resume.user_id == owner_id)
+        old_content_id = await self._lock_content(content, *criteria)
+        if old_content_id is None:
+            return None
+        content_id = await self.blobs.acquire(content)
+
+        # The version and the content move together in one statement.
+        result = await self.db.execute(
+            update(Resume).where(*criteria).values(
+                content_id=content_id,
+                current_version=Resume.current_version + 1,
+            ).returning(Resume.current_version, Resume.title)
+        )
+        new_version, title = result.one()
+        await self.blobs.release(old_content_id)
+        await self._index([{
+            "resume_id": resume_id,
+            "user_id": owner_id,
+            "title": title,
+            "content": content,
+        }])
+        return new_version
+
+    async def delete(
+        self, resume_id: int, owner_id: int | None = None
+    ) -> Resume | None:
+        query = select(Resume).where(Resume.id == resume_id).options(
+            raiseload("*")
+        )
+        if owner_id is not None:
+            query = query.where(Resume.user_id == owner_id)
+        resume = (await self.db.execute(query)).scalar_one_or_none()
         if not resume:
             return None
 
+        result = await self.db.execute(
+            delete(ResumeHistory)
+            .where(ResumeHistory.resume_id == resume_id)
+            .returning(ResumeHistory.content_id)
+        )
+        history_content_ids = result.scalars().all()
         await self.db.delete(resume)
-        await self.db.commit()
+        await self.db.flush()
+        await self.blobs.release(resume.content_id, *history_content_ids)
+        await self._unindex([resume_id])
         return resume
 
+    async def _index(self, entries: list[dict], replace: bool = True) -> None:
+        await self.search.index(entries)
+        await self.similarity.index(entries, replace=replace)
+
+    async def _unindex(self, resume_ids: list[int]) -> None:
+        await self.search.remove(resume_ids)
+        await self.similarity.remove(resume_ids)
+
+    async def _lock_content(self, content: str, *criteria) -> int | None:
+        """Lock the resume row, then its blob and the blob for ``content``.
+
+        The resume row is locked first and the blob rows after it in id
+        order, so two edits that swap each other's texts queue up instead
+        of deadlocking. Returns the current blob id, or None when no
+        resume matches ``criteria``.
+        """
+        blobs = ContentBlob.__table__
+        current = select(Resume.content_id).where(
+            *criteria
+        ).with_for_update().scalar_subquery()
+        result = await self.db.execute(
+            select(blobs.c.id, current.label("current_id"))
+            .where(or_(
+                blobs.c.id == current,
+                blobs.c.digest == content_digest(content),
+            ))
+            .order_by(blobs.c.id)
+            .with_for_update(of=blobs)
+        )
+        return next(
+            (row.current_id for row in result if row.current_id is not None),
+            None,
+        )
+
 
 class ResumeHistoryRepository:
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.blobs = BlobRepository(db)
 
     async def get_max_version(self, resume_id: int) -> int:
         result = await self.db.execute(
@@ -61,15 +264,122 @@ class ResumeHistoryRepository:
         )
         return result.scalar() or 0
 
+    async def list_by_resume(
+        self, resume_id: int, after_version: int | None = None,
+        limit: int | None = None
+    ) -> list[ResumeHistory]:
+        query = select(ResumeHistory).where(
+            ResumeHistory.resume_id == resume_id
+        )
+        if after_version is not None:
+            query = query.where(ResumeHistory.version > after_version)
+        query = query.order_by(ResumeHistory.version).limit(limit).options(
+            raiseload("*"), undefer(ResumeHistory.content)
+        ).execution_options(populate_existing=True)
+        result = await self.db.execute(query)
+        histories = list(result.scalars())
+
+        base = None
+        if histories and histories[0].is_delta:
+            chain = await self._load_chain(
+                resume_id, histories[0].version - 1
+            )
+            base = chain[-1].content if chain else None
+        self._resolve(histories, base)
+        return histories
+
+    async def get_content(self, resume_id: int, version: int) -> str | None:
+        chain = await self._load_chain(resume_id, version)
+        if not chain or chain[-1].version != version:
+            return None
+        return chain[-1].content
+
+    async def stream_by_user(
+        self, user_id: int, batch_size: int
+    ) -> AsyncIterator[list[dict]]:
+        """Yield batches of a user's history rows with deltas resolved.
+
+        Rows arrive ordered by resume and version, so each delta applies to
+        the row just before it and only that one text is kept in memory.
+        """
+        result = await self.db.stream(
+            select(
+                ResumeHistory.id, ResumeHistory.resume_id,
+                ResumeHistory.version, ResumeHistory.content,
+                ResumeHistory.is_delta, ResumeHistory.created_at,
+            ).join(Resume, Resume.id == ResumeHistory.resume_id)
+            .where(Resume.user_id == user_id)
+            .order_by(ResumeHistory.resume_id, ResumeHistory.version)
+            .execution_options(yield_per=batch_size)
+        )
+        content = None
+        async for rows in result.partitions():
+            batch = []
+            for row in rows:
+                history = row._asdict()
+                if history.pop("is_delta"):
+                    history["content"] = apply_delta(content, row.content)
+                content = history["content"]
+                batch.append(history)
+            yield batch
+
     async def create(
         self, resume_id: int, content: str, new_version: int
     ) -> ResumeHistory:
+        payload, is_delta = content, False
+        if settings.HISTORY_DELTA_ENABLED and new_version > 1:
+            chain = await self._load_chain(resume_id, new_version - 1)
+            if (
+                chain and chain[-1].version == new_version - 1
+                and new_version - chain[0].version
+                < settings.HISTORY_KEYFRAME_INTERVAL
+            ):
+                delta = make_delta(chain[-1].content, content)
+                if len(delta) < len(content):
+                    payload, is_delta = delta, True
+
         resume_history = ResumeHistory(
             resume_id=resume_id,
-            content=content,
-            version=new_version
+            content_id=await self.blobs.acquire(payload),
+            content=payload,
+            version=new_version,
+            is_delta=is_delta,
         )
         self.db.add(resume_history)
-        await self.db.commit()
-        await self.db.refresh(resume_history)
+        await self.db.flush()
+        if is_delta:
+            set_committed_value(resume_history, "content", content)
         return resume_history
+
+    async def _load_chain(
+        self, resume_id: int, version: int
+    ) -> list[ResumeHistory]:
+        """Load and resolve the rows from the nearest keyframe to ``version``."""
+        keyframe = select(func.max(ResumeHistory.version)).where(
+            ResumeHistory.resume_id == resume_id,
+            ResumeHistory.version <= version,
+            ResumeHistory.is_delta.is_(False),
+        ).scalar_subquery()
+        result = await self.db.execute(
+            select(ResumeHistory).where(
+                ResumeHistory.resume_id == resume_id,
+                ResumeHistory.version >= keyframe,
+                ResumeHistory.version <= version,
+            ).order_by(ResumeHistory.version)
+            .options(raiseload("*"), undefer(ResumeHistory.content))
+            .execution_options(populate_existing=True)
+        )
+        chain = list(result.scalars())
+        self._resolve(chain, None)
+        return chain
+
+    @staticmethod
+    def _resolve(histories: list[ResumeHistory], base: str | None) -> None:
+        # Swap delta payloads for full text without marking rows dirty, so
+        # callers always see complete content and nothing is written back.
+        for history in histories:
+            if history.is_delta:
+                set_committed_value(
+                    history, "content", apply_delta(base, history.content)
+                )
+            base = history.content
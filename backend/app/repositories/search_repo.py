@@ -0,0 +1,98 @@
+from sqlalchemy import (
+    Row, cast, column, func, literal_column, select, table, text,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models import Resume
+
+_POSTGRES_UPSERT = text(
+    "INSERT INTO resume_search (resume_id, user_id, document) "
+    "VALUES (:resume_id, :user_id, "
+    "setweight(to_tsvector(CAST(:config AS regconfig), :title), 'A') || "
+    "setweight(to_tsvector(CAST(:config AS regconfig), :content), 'B')) "
+    "ON CONFLICT (resume_id) DO UPDATE "
+    "SET user_id = excluded.user_id, document = excluded.document"
+)
+_POSTGRES_DELETE = text("DELETE FROM resume_search WHERE resume_id = :resume_id")
+_SQLITE_INSERT = text(
+    "INSERT INTO resume_search (rowid, user_id, title, content) "
+    "VALUES (:resume_id, :user_id, :title, :content)"
+)
+_SQLITE_DELETE = text("DELETE FROM resume_search WHERE rowid = :resume_id")
+
+# Column weights: titles count double, as with setweight 'A' vs 'B'.
+TITLE_WEIGHT = 2.0
+CONTENT_WEIGHT = 1.0
+
+
+class SearchRepository:
+    """Keeps the full-text index of resumes in step with their content."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @property
+    def _postgres(self) -> bool:
+        return self.db.bind.dialect.name == "postgresql"
+
+    async def index(self, entries: list[dict]) -> None:
+        """Index ``resume_id``, ``user_id``, ``title`` and ``content``."""
+        if not entries:
+            return
+        if self._postgres:
+            await self.db.execute(_POSTGRES_UPSERT, [
+                {**entry, "config": settings.SEARCH_CONFIG}
+                for entry in entries
+            ])
+            return
+        await self.remove([entry["resume_id"] for entry in entries])
+        await self.db.execute(_SQLITE_INSERT, entries)
+
+    async def remove(self, resume_ids: list[int]) -> None:
+        if resume_ids:
+            await self.db.execute(
+                _POSTGRES_DELETE if self._postgres else _SQLITE_DELETE,
+                [{"resume_id": resume_id} for resume_id in resume_ids],
+            )
+
+    async def search(
+        self, user_id: int, terms: list[str], offset: int, limit: int
+    ) -> list[Row]:
+        """Return ``(id, title, content, score)`` rows, best match first."""
+        if self._postgres:
+            search = table(
+                "resume_search", column("resume_id"), column("user_id"),
+                column("document"),
+            )
+            tsquery = func.to_tsquery(
+                cast(settings.SEARCH_CONFIG, REGCONFIG), " & ".join(terms)
+            )
+            rank = func.ts_rank(search.c.document, tsquery)
+            query = select(
+                Resume.id, Resume.title, Resume.content, rank.label("score")
+            ).join(search, search.c.resume_id == Resume.id).where(
+                search.c.user_id == user_id,
+                search.c.document.op("@@")(tsquery),
+            ).order_by(rank.desc(), Resume.id)
+        else:
+            search = table("resume_search", column("rowid"), column("user_id"))
+            # bm25() is lower for better matches; the leading 0 weighs the
+            # unindexed user_id column.
+            rank = func.bm25(
+                literal_column("resume_search"),
+                0.0, TITLE_WEIGHT, CONTENT_WEIGHT,
+            )
+            query = select(
+                Resume.id, Resume.title, Resume.content,
+                (-rank).label("score"),
+            ).join(search, search.c.rowid == Resume.id).where(
+                search.c.user_id == user_id,
+                literal_column("resume_search").op("MATCH")(
+                    " AND ".join(f'"{term}"' for term in terms)
+                ),
+            ).order_by(rank, Resume.id)
+
+        result = await self.db.execute(query.offset(offset).limit(limit))
+        return list(result.all())
@@ -0,0 +1,105 @@
+from sqlalchemy import Row, and_, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core import minhash
+from app.models import Resume, ResumeBucket, ResumeSignature
+
+
+class SimilarityRepository:
+    """Stores MinHash signatures and LSH buckets for resume content."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def index(self, entries: list[dict], replace: bool = True) -> None:
+        """Sign ``resume_id``/``user_id``/``content`` entries and bucket them.
+
+        Entries whose content has no words are left unindexed, so they are
+        never reported as similar to anything.
+        """
+        if not entries:
+            return
+        if replace:
+            await self.remove([entry["resume_id"] for entry in entries])
+
+        signatures, buckets = [], []
+        for entry in entries:
+            signature = minhash.signature(entry["content"])
+            if signature is None:
+                continue
+            signatures.append({
+                "resume_id": entry["resume_id"],
+                "signature": minhash.to_bytes(signature),
+            })
+            buckets.extend(
+                {
+                    "resume_id": entry["resume_id"],
+                    "user_id": entry["user_id"],
+                    "band": band,
+                    "bucket": bucket,
+                }
+                for band, bucket in enumerate(minhash.band_keys(signature))
+            )
+        if signatures:
+            await self.db.execute(insert(ResumeSignature), signatures)
+            await self.db.execute(insert(ResumeBucket), buckets)
+
+    async def remove(self, resume_ids: list[int]) -> None:
+        if not resume_ids:
+            return
+        await self.db.execute(
+            delete(ResumeBucket).where(ResumeBucket.resume_id.in_(resume_ids))
+        )
+        await self.db.execute(
+            delete(ResumeSignature)
+            .where(ResumeSignature.resume_id.in_(resume_ids))
+        )
+
+    async def find_similar(
+        self, resume_id: int, threshold: float, limit: int
+    ) -> list[tuple[Row, float]]:
+        """Return ``((id, title), similarity)`` pairs, most similar first.
+
+        Only resumes sharing at least one LSH bucket with ``resume_id`` are
+        compared, so the cost follows the number of candidates rather than
+        the number of resumes.
+        """
+        own = aliased(ResumeBucket)
+        other = aliased(ResumeBucket)
+        candidates = select(other.resume_id).join(own, and_(
+            own.user_id == other.user_id,
+            own.band == other.band,
+            own.bucket == other.bucket,
+        )).where(own.resume_id == resume_id, other.resume_id != resume_id)
+        result = await self.db.execute(
+            select(ResumeSignature.resume_id, ResumeSignature.signature)
+            .where(
+                (ResumeSignature.resume_id == resume_id)
+                | ResumeSignature.resume_id.in_(candidates)
+            )
+        )
+        signatures = {
+            row.resume_id: minhash.from_bytes(row.signature) for row in result
+        }
+        target = signatures.pop(resume_id, None)
+        if target is None:
+            return []
+
+        scores = {
+            candidate: minhash.similarity(target, signature)
+            for candidate, signature in signatures.items()
+        }
+        matches = sorted(
+            (item for item in scores.items() if item[1] >= threshold),
+            key=lambda item: (-item[1], item[0]),
+        )[:limit]
+        if not matches:
+            return []
+
+        result = await self.db.execute(
+            select(Resume.id, Resume.title)
+            .where(Resume.id.in_([candidate for candidate, _ in matches]))
+        )
+        resumes = {row.id: row for row in result}
+        return [(resumes[candidate], score) for candidate, score in matches]
@@ -0,0 +1,34 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.blob_repo import BlobRepository
+from app.repositories.job_repo import ImproveJobRepository
+from app.repositories.resume_repo import (
+    ResumeRepository,
+    ResumeHistoryRepository,
+)
+from app.repositories.user_repo import UserRepository
+
+
+class UnitOfWork:
+    """Groups repository writes into one transaction.
+
+    Repositories only flush; the unit of work commits once when the block
+    exits cleanly and rolls back if it raises.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.users = UserRepository(db)
+        self.resumes = ResumeRepository(db)
+        self.histories = ResumeHistoryRepository(db)
+        self.blobs = BlobRepository(db)
+        self.jobs = ImproveJobRepository(db)
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.db.commit()
+        else:
+            await self.db.rollback()
@@ -1,7 +1,8 @@
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
-from app.core.security import hash_password
+from app.core.security import hash_password_async, invalidate_principal
 from app.models import User
 from app.schemas.user import UserCreate
 
@@ -11,15 +12,17 @@ class UserRepository:
         self.db = db
 
     async def get_by_email(self, email: str) -> User | None:
-        res = await self.db.execute(select(User).where(User.email == email))
+        res = await self.db.execute(
+            select(User).where(User.email == email).options(raiseload("*"))
+        )
         return res.scalar_one_or_none()
 
     async def create(self, user_in: UserCreate) -> User:
         user = User(
             email=str(user_in.email),
-            hashed_password=hash_password(user_in.password),
+            hashed_password=await hash_password_async(user_in.password),
         )
         self.db.add(user)
-        await self.db.commit()
-        await self.db.refresh(user)
+        await self.db.flush()
+        invalidate_principal(user.id)
         return user
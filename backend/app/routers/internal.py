@@ -0,0 +1,27 @@
+from fastapi import APIRouter
+
+from app.core.improver import improve_engine
+from app.core.security import password_hasher, verified_tokens, principals
+from app.database import pool_status
+from app.services.improve_cache import improve_cache
+from app.services.resume_service import (
+    improve_batcher, improve_flights, improve_jobs, version_diffs,
+)
+
+router = APIRouter()
+
+
+@router.get("/metrics", status_code=200)
+async def metrics():
+    return {
+        "db_pool": pool_status(),
+        "password_hasher": password_hasher.stats(),
+        "token_cache": verified_tokens.stats(),
+        "principal_cache": principals.stats(),
+        "diff_cache": version_diffs.stats(),
+        "improve_jobs": improve_jobs.stats(),
+        "improve_cache": improve_cache.stats(),
+        "improve_coalescing": improve_flights.stats(),
+        "improve_batching": improve_batcher.stats(),
+        "improve_engine": improve_engine.stats(),
+    }
@@ -1,13 +1,21 @@
-from fastapi import APIRouter
+from typing import Literal
+
+from fastapi import APIRouter, Query, Request, Response
 from fastapi.params import Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER,
+)
 from app.database import get_db
 from app.dependencies import get_current_user, swagger_auth
 from app.models import User
 from app.schemas.resume import (
     ResumeResponse, ResumeCreate, ResumeUpdate,
-    ResumeImprove, ResumeHistoryResponse,
+    ResumeImprove, ResumeHistoryResponse, ResumeImportResult,
+    ResumeSearchResult, SimilarResume, ResumeDiff, ImproveJobResponse,
+    ResumeBatchImprove,
 )
 from app.schemas.user import UserResponse
 from app.services.resume_service import ResumeService
@@ -26,15 +34,85 @@ async def create_resume(
     return await ResumeService.create_resume(resume_in, db, user.id)
 
 
+@router.post(
+    "/import", response_model=ResumeImportResult, status_code=200,
+    dependencies=[Depends(swagger_auth)]
+)
+async def import_resumes(
+    request: Request, db: AsyncSession = Depends(get_db),
+    user: UserResponse = Depends(get_current_user)
+):
+    return await ResumeService.import_resumes(
+        request.stream(), request.headers.get("content-type", ""),
+        db, user.id
+    )
+
+
+@router.post(
+    "/improve/batch", response_class=StreamingResponse, status_code=200,
+    dependencies=[Depends(swagger_auth)]
+)
+async def improve_resumes_batch(
+    batch_in: ResumeBatchImprove, db: AsyncSession = Depends(get_db),
+    user: UserResponse = Depends(get_current_user)
+):
+    return StreamingResponse(
+        ResumeService.improve_resumes_batch(batch_in, user, db.bind),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.get(
     "/", response_model=list[ResumeResponse], status_code=200,
     dependencies=[Depends(swagger_auth)]
 )
 async def get_resumes(
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
     db: AsyncSession = Depends(get_db),
     user: UserResponse = Depends(get_current_user)
 ):
-    return await ResumeService.get_resumes(str(user.email), db)
+    page = await ResumeService.get_resumes(
+        str(user.email), db, limit=limit, cursor=cursor
+    )
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
+
+
+@router.get(
+    "/search", response_model=list[ResumeSearchResult], status_code=200,
+    dependencies=[Depends(swagger_auth)]
+)
+async def search_resumes(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
+    user: UserResponse = Depends(get_current_user)
+):
+    page = await ResumeService.search_resumes(
+        user.id, q, db, limit=limit, cursor=cursor
+    )
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
+
+
+@router.get(
+    "/export", response_class=StreamingResponse, status_code=200,
+    dependencies=[Depends(swagger_auth)]
+)
+async def export_resumes(
+    db: AsyncSession = Depends(get_db),
+    user: UserResponse = Depends(get_current_user)
+):
+    return StreamingResponse(
+        ResumeService.export_resumes(user.id, db.bind),
+        media_type="application/x-ndjson",
+    )
 
 
 @router.get(
@@ -88,13 +166,119 @@ async def improve_resume(
     )
 
 
+@router.post(
+    "/{resume_id}/improve/stream", response_class=StreamingResponse,
+    status_code=200, dependencies=[Depends(swagger_auth)]
+)
+async def stream_improve_resume(
+    resume_id: int, resume_in: ResumeImprove,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    return StreamingResponse(
+        await ResumeService.stream_improve_resume(
+            resume_id, resume_in, db, current_user
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/{resume_id}/improve/jobs", response_model=ImproveJobResponse,
+    status_code=202, dependencies=[Depends(swagger_auth)]
+)
+async def submit_improve_job(
+    resume_id: int, resume_in: ResumeImprove, response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    job = await ResumeService.submit_improve_job(
+        resume_id, resume_in, db, current_user
+    )
+    response.headers["Location"] = (
+        f"/resumes/{resume_id}/improve/jobs/{job.id}"
+    )
+    return job
+
+
+@router.get(
+    "/{resume_id}/improve/jobs/{job_id}", response_model=ImproveJobResponse,
+    dependencies=[Depends(swagger_auth)]
+)
+async def get_improve_job(
+    resume_id: int, job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    return await ResumeService.get_improve_job(
+        resume_id, job_id, current_user, db
+    )
+
+
+@router.get(
+    "/{resume_id}/improve/jobs/{job_id}/result",
+    response_model=ResumeImprove, dependencies=[Depends(swagger_auth)]
+)
+async def get_improve_job_result(
+    resume_id: int, job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    return await ResumeService.get_improve_job_result(
+        resume_id, job_id, current_user, db
+    )
+
+
 @router.get(
     "/{resume_id}/history", response_model=list[ResumeHistoryResponse],
     dependencies=[Depends(swagger_auth)]
 )
 async def get_resume_history(
     resume_id: int,
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    page = await ResumeService.get_resume_history(
+        resume_id, current_user, db, limit=limit, cursor=cursor
+    )
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
+
+
+@router.get(
+    "/{resume_id}/similar", response_model=list[SimilarResume],
+    dependencies=[Depends(swagger_auth)]
+)
+async def find_similar_resumes(
+    resume_id: int,
+    threshold: float = Query(0.5, ge=0.0, le=1.0),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    return await ResumeService.get_resume_history(resume_id, current_user, db)
+    return await ResumeService.find_similar_resumes(
+        resume_id, current_user, db, threshold=threshold, limit=limit
+    )
+
+
+@router.get(
+    "/{resume_id}/diff", response_model=ResumeDiff,
+    dependencies=[Depends(swagger_auth)]
+)
+async def diff_resume_versions(
+    resume_id: int,
+    from_version: int = Query(..., alias="from", ge=1),
+    to_version: int = Query(..., alias="to", ge=1),
+    granularity: Literal["line", "word"] = "line",
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    return await ResumeService.diff_resume_versions(
+        resume_id, from_version, to_version, current_user, db,
+        granularity=granularity
+    )
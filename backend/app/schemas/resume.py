@@ -1,6 +1,7 @@
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 class ResumeCreate(BaseModel):
@@ -40,3 +41,84 @@ class ResumeHistoryResponse(BaseModel):
     @field_serializer("created_at")
     def serialize_created_at(self, value: datetime) -> str:
         return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+class ResumePage(BaseModel):
+    items: list[ResumeResponse]
+    next_cursor: str | None = None
+
+
+class ResumeHistoryPage(BaseModel):
+    items: list[ResumeHistoryResponse]
+    next_cursor: str | None = None
+
+
+class ResumeImportError(BaseModel):
+    row: int
+    detail: str
+
+
+class ResumeImportResult(BaseModel):
+    created: int
+    errors: list[ResumeImportError]
+
+
+class ResumeSearchResult(BaseModel):
+    id: int
+    title: str
+    highlight: str
+    score: float
+
+
+class ResumeSearchPage(BaseModel):
+    items: list[ResumeSearchResult]
+    next_cursor: str | None = None
+
+
+class SimilarResume(BaseModel):
+    id: int
+    title: str
+    similarity: float
+
+
+class DiffOp(BaseModel):
+    op: Literal["equal", "insert", "delete"]
+    text: str
+
+
+class ResumeDiff(BaseModel):
+    resume_id: int
+    from_version: int
+    to_version: int
+    granularity: Literal["line", "word"]
+    ops: list[DiffOp]
+
+
+class ImproveJobResponse(BaseModel):
+    id: str
+    resume_id: int
+    user_id: int
+    status: Literal["queued", "running", "succeeded", "failed"]
+    version: int | None = None
+    error: str | None = None
+    created_at: datetime
+    finished_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ResumeBatchImproveItem(BaseModel):
+    resume_id: int
+    content: str | None = None
+
+
+class ResumeBatchImprove(BaseModel):
+    items: list[ResumeBatchImproveItem] = Field(min_length=1, max_length=1000)
+
+
+class ResumeBatchImproveResult(BaseModel):
+    index: int
+    resume_id: int
+    version: int | None = None
+    content: str | None = None
+    error: str | None = None
@@ -2,7 +2,8 @@ from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.security import create_jwt, verify_password
+from app.core.security import create_jwt, verify_password_async
+from app.repositories.unit_of_work import UnitOfWork
 from app.repositories.user_repo import UserRepository
 from app.schemas.auth import TokenWithUser
 from app.schemas.user import UserCreate, UserResponse, UserLogin
@@ -15,8 +16,9 @@ class AuthService:
         if await user_repo.get_by_email(str(user_in.email)):
             raise HTTPException(status_code=400, detail="User already exists")
 
-        user = await user_repo.create(user_in)
-        token = create_jwt({"sub": str(user.email)})
+        async with UnitOfWork(db) as uow:
+            user = await uow.users.create(user_in)
+        token = create_jwt({"sub": str(user.email), "uid": user.id})
         return TokenWithUser(
             user=UserResponse.model_validate(user),
             access_token=token,
@@ -28,10 +30,12 @@ class AuthService:
     async def login(user_in: UserLogin, db: AsyncSession) -> TokenWithUser:
         user_repo = UserRepository(db)
         user = await user_repo.get_by_email(str(user_in.email))
-        if not user or not verify_password(user_in.password, str(user.hashed_password)):
+        if not user or not await verify_password_async(
+            user_in.password, str(user.hashed_password)
+        ):
             raise HTTPException(status_code=400, detail="Invalid credentials")
 
-        token = create_jwt({"sub": str(user.email)})
+        token = create_jwt({"sub": str(user.email), "uid": user.id})
         return TokenWithUser(
             user=UserResponse.model_validate(user),
             access_token=token,
@@ -0,0 +1,80 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.repositories.improve_result_repo import ImproveResultRepository
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class ImproveCache:
+    """Improvement results keyed by engine version and input content.
+
+    Lookups try the in-process LRU first and then, when ``shared`` is set,
+    the ``improve_results`` table that every app worker can see. Writes
+    to the table go through the caller's session and commit with it;
+    every ``PURGE_EVERY`` writes also drop rows that have expired.
+    """
+
+    PURGE_EVERY = 1000
+
+    def __init__(self, maxsize: int, ttl: float, shared: bool = False):
+        self.ttl = ttl
+        self.shared = shared
+        self.local = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.shared_hits = 0
+        self.shared_misses = 0
+        self._writes = 0
+
+    @staticmethod
+    def key(content: str, engine_version: str) -> str:
+        digest = hashlib.sha256(engine_version.encode())
+        digest.update(b"\0")
+        digest.update(content.encode())
+        return digest.hexdigest()
+
+    async def get(self, key: str, db: AsyncSession) -> str | None:
+        result = self.local.get(key)
+        if result is not None or not self.shared:
+            return result
+
+        result = await ImproveResultRepository(db).get(key, _utcnow())
+        if result is None:
+            self.shared_misses += 1
+            return None
+        self.shared_hits += 1
+        self.local.set(key, result)
+        return result
+
+    async def set(self, key: str, result: str, db: AsyncSession) -> None:
+        self.local.set(key, result)
+        if self.shared:
+            repo = ImproveResultRepository(db)
+            now = _utcnow()
+            await repo.put(key, result, now + timedelta(seconds=self.ttl))
+            self._writes += 1
+            if self._writes % self.PURGE_EVERY == 0:
+                await repo.purge_expired(now)
+
+    def clear(self) -> None:
+        self.local.clear()
+
+    def stats(self) -> dict:
+        return {
+            **self.local.stats(),
+            "shared": self.shared,
+            "shared_hits": self.shared_hits,
+            "shared_misses": self.shared_misses,
+        }
+
+
+improve_cache = ImproveCache(
+    maxsize=settings.IMPROVE_CACHE_SIZE,
+    ttl=settings.IMPROVE_CACHE_TTL,
+    shared=settings.IMPROVE_CACHE_SHARED,
+)
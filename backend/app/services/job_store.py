@@ -0,0 +1,102 @@
+from abc import ABC, abstractmethod
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.repositories.job_repo import ImproveJobRepository
+from app.repositories.unit_of_work import UnitOfWork
+from app.schemas.resume import ImproveJobResponse
+
+
+class ImproveJobStore(ABC):
+    """Where improve job state lives between submission and polling.
+
+    Every call gets the caller's session so a database-backed store can
+    share it; the in-memory store ignores it.
+    """
+
+    @abstractmethod
+    async def create(self, job: ImproveJobResponse, db: AsyncSession) -> None:
+        """Record a newly submitted job."""
+
+    @abstractmethod
+    async def get(
+        self, job_id: str, db: AsyncSession
+    ) -> ImproveJobResponse | None:
+        """Return the job, or None when it is unknown or has expired."""
+
+    @abstractmethod
+    async def update(self, job_id: str, db: AsyncSession, **values) -> None:
+        """Apply ``values`` to the job, if it still exists."""
+
+    def clear(self) -> None:
+        pass
+
+
+class InMemoryJobStore(ImproveJobStore):
+    """Keeps jobs in this process only; finished jobs expire after a TTL.
+
+    Queued and running jobs are held outside the cache until they finish,
+    so neither the size bound nor the TTL can drop a job a client is still
+    waiting on. The job runner's queue limit keeps that set bounded.
+    """
+
+    FINISHED = ("succeeded", "failed")
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.active: dict[str, ImproveJobResponse] = {}
+        self.jobs = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def create(self, job: ImproveJobResponse, db: AsyncSession) -> None:
+        self._put(job)
+
+    async def get(
+        self, job_id: str, db: AsyncSession
+    ) -> ImproveJobResponse | None:
+        return self.active.get(job_id) or self.jobs.get(job_id)
+
+    async def update(self, job_id: str, db: AsyncSession, **values) -> None:
+        job = self.active.get(job_id) or self.jobs.get(job_id)
+        if job is not None:
+            self._put(job.model_copy(update=values))
+
+    def clear(self) -> None:
+        self.active.clear()
+        self.jobs.clear()
+
+    def _put(self, job: ImproveJobResponse) -> None:
+        if job.status in self.FINISHED:
+            self.active.pop(job.id, None)
+            self.jobs.set(job.id, job)
+        else:
+            self.active[job.id] = job
+
+
+class DatabaseJobStore(ImproveJobStore):
+    """Keeps jobs in ``improve_jobs`` so any app worker can report them."""
+
+    async def create(self, job: ImproveJobResponse, db: AsyncSession) -> None:
+        async with UnitOfWork(db) as uow:
+            await uow.jobs.create(**job.model_dump())
+
+    async def get(
+        self, job_id: str, db: AsyncSession
+    ) -> ImproveJobResponse | None:
+        job = await ImproveJobRepository(db).get(job_id)
+        return ImproveJobResponse.model_validate(job) if job else None
+
+    async def update(self, job_id: str, db: AsyncSession, **values) -> None:
+        async with UnitOfWork(db) as uow:
+            await uow.jobs.update(job_id, **values)
+
+
+def make_job_store(kind: str) -> ImproveJobStore:
+    if kind == "database":
+        return DatabaseJobStore()
+    return InMemoryJobStore(
+        maxsize=settings.IMPROVE_JOB_CACHE_SIZE, ttl=settings.IMPROVE_JOB_TTL
+    )
+
+
+improve_job_store = make_job_store(settings.IMPROVE_JOB_STORE)
@@ -1,37 +1,325 @@
+import asyncio
+import json
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from datetime import datetime, timezone
+from functools import partial
+
 from fastapi import HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
-from app.models import User
+from app.core.cache import TTLCache
+from app.core import improver
+from app.core.batching import MicroBatcher
+from app.core.config import settings
+from app.core.diff import Granularity, diff_text
+from app.core.jobs import JobRunner
+from app.core.singleflight import SingleFlight
+from app.core.pagination import (
+    DEFAULT_PAGE_SIZE, decode_cursor, fetch_limit, paginate,
+)
+from app.core.records import iter_csv, iter_ndjson
+from app.core.search import highlight, search_terms
+from app.models import ResumeHistory, User
+from app.models.blob import content_digest
 from app.repositories.resume_repo import (
     ResumeRepository,
     ResumeHistoryRepository,
 )
+from app.repositories.search_repo import SearchRepository
+from app.repositories.similarity_repo import SimilarityRepository
+from app.repositories.unit_of_work import UnitOfWork
 from app.repositories.user_repo import UserRepository
 from app.schemas.resume import (
     ResumeCreate, ResumeResponse, ResumeUpdate,
-    ResumeImprove, ResumeHistoryResponse,
+    ResumeImprove, ResumeHistoryResponse, ResumePage, ResumeHistoryPage,
+    ResumeImportError, ResumeImportResult, ResumeSearchResult,
+    ResumeSearchPage, SimilarResume, ResumeDiff, DiffOp, ImproveJobResponse,
+    ResumeBatchImprove, ResumeBatchImproveResult,
+)
+from app.services.improve_cache import ImproveCache, improve_cache
+from app.services.job_store import improve_job_store
+
+IMPORT_FORMATS = {
+    "application/x-ndjson": iter_ndjson,
+    "application/jsonl": iter_ndjson,
+    "text/csv": iter_csv,
+}
+
+# History rows never change, so a diff between two versions stays valid
+# until the resume itself is deleted.
+version_diffs = TTLCache(
+    maxsize=settings.DIFF_CACHE_SIZE, ttl=settings.DIFF_CACHE_TTL
+)
+
+improve_flights = SingleFlight()
+
+improve_jobs = JobRunner(
+    workers=settings.IMPROVE_JOB_WORKERS,
+    max_pending=settings.IMPROVE_JOB_MAX_PENDING,
+)
+
+
+async def _improve_batch(contents: list[str]) -> list[str]:
+    return await improver.improve_engine.improve_many(contents)
+
+
+# Shared by every batch request, so concurrent batches fill the same
+# engine calls.
+improve_batcher = MicroBatcher(
+    _improve_batch,
+    max_size=settings.IMPROVE_BATCH_MAX_SIZE,
+    max_wait=settings.IMPROVE_BATCH_MAX_WAIT,
 )
 
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _ndjson(kind: str, items: Iterable[BaseModel]) -> str:
+    return "".join(
+        json.dumps({"type": kind, **item.model_dump(mode="json")},
+                   ensure_ascii=False) + "\n"
+        for item in items
+    )
+
+
+def _validation_detail(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+async def _save_batch(
+    batch: list[tuple[int, ResumeCreate]], db: AsyncSession, user_id: int
+) -> list[ResumeImportError]:
+    try:
+        async with UnitOfWork(db) as uow:
+            await uow.resumes.create_many(
+                [resume_in for _, resume_in in batch], user_id
+            )
+    except SQLAlchemyError:
+        return [
+            ResumeImportError(row=row, detail="Could not be saved")
+            for row, _ in batch
+        ]
+    return []
+
+
+async def _improve(
+    resume_id: int, resume_improve: ResumeImprove, db: AsyncSession,
+    current_user: User
+) -> ResumeHistory:
+    # Double-clicks and retries send the same body concurrently; they share
+    # one improvement and one history version. The user is part of the key
+    # so a coalesced caller never skips its own ownership check.
+    key = (resume_id, current_user.id, content_digest(resume_improve.content))
+    return await improve_flights.do(key, partial(
+        _improve_once, resume_id, resume_improve, db, current_user
+    ))
+
+
+async def _improve_once(
+    resume_id: int, resume_improve: ResumeImprove, db: AsyncSession,
+    current_user: User
+) -> ResumeHistory:
+    # Check ownership before the engine runs or the cache is filled, so a
+    # foreign or missing resume costs one lookup, not an improvement. The
+    # reads get a session of their own: closing it rolls the read back and
+    # returns the connection to the pool while the engine runs, without a
+    # COMMIT and without expiring anything the caller loaded into ``db``.
+    async with AsyncSession(db.bind) as read_db:
+        owner_id = await ResumeRepository(read_db).get_owner_id(resume_id)
+        if owner_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Resume not found"
+            )
+
+        if owner_id != current_user.id:
+            raise HTTPException(
+                status_code=403, detail="Not allowed to improve this resume"
+            )
+
+        key = ImproveCache.key(
+            resume_improve.content, improver.improve_engine.version
+        )
+        improve_content = await improve_cache.get(key, read_db)
+    cached = improve_content is not None
+    if not cached:
+        improve_content = await improver.improve_engine.improve(
+            resume_improve.content
+        )
+
+    return await _store_improvement(
+        resume_id, improve_content, db, current_user,
+        cache_key=None if cached else key
+    )
+
+
+async def _store_improvement(
+    resume_id: int, improve_content: str, db: AsyncSession,
+    current_user: User, cache_key: str | None = None
+) -> ResumeHistory:
+    async with UnitOfWork(db) as uow:
+        if cache_key is not None:
+            await improve_cache.set(cache_key, improve_content, db)
+        new_version = await uow.resumes.store_next_version(
+            resume_id, improve_content, owner_id=current_user.id
+        )
+        if new_version is not None:
+            resume_history = await uow.histories.create(
+                resume_id, improve_content, new_version
+            )
+
+    if new_version is None:
+        if await ResumeRepository(db).get_owner_id(resume_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Resume not found"
+            )
+        raise HTTPException(
+            status_code=403, detail="Not allowed to improve this resume"
+        )
+    return resume_history
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _stream_improvement(
+    resume_id: int, resume_improve: ResumeImprove, current_user: User,
+    bind: AsyncEngine
+) -> AsyncIterator[str]:
+    # No session is open while the engine streams; the history version is
+    # written in a short session of its own once the text is complete.
+    engine = improver.improve_engine
+    key = ImproveCache.key(resume_improve.content, engine.version)
+    async with AsyncSession(bind) as db:
+        improve_content = await improve_cache.get(key, db)
+    cached = improve_content is not None
+
+    if cached:
+        yield _sse("delta", {"content": improve_content})
+    else:
+        chunks = []
+        try:
+            async for chunk in engine.stream(resume_improve.content):
+                chunks.append(chunk)
+                yield _sse("delta", {"content": chunk})
+        except HTTPException as exc:
+            yield _sse("error", {"detail": exc.detail})
+            return
+        improve_content = "".join(chunks)
+
+    try:
+        async with AsyncSession(bind, expire_on_commit=False) as db:
+            history = await _store_improvement(
+                resume_id, improve_content, db, current_user,
+                cache_key=None if cached else key
+            )
+    except HTTPException as exc:
+        yield _sse("error", {"detail": exc.detail})
+        return
+    yield _sse("done", {"version": history.version})
+
+
+async def _run_improve_job(
+    job_id: str, resume_id: int, resume_improve: ResumeImprove,
+    current_user: User, bind: AsyncEngine
+) -> None:
+    # Jobs outlive the request, so each one works in a session of its own.
+    async with AsyncSession(bind, expire_on_commit=False) as db:
+        await improve_job_store.update(job_id, db, status="running")
+        try:
+            history = await _improve(
+                resume_id, resume_improve, db, current_user
+            )
+        except HTTPException as exc:
+            await improve_job_store.update(
+                job_id, db, status="failed", error=exc.detail,
+                finished_at=_utcnow()
+            )
+            return
+        except Exception:
+            await db.rollback()
+            await improve_job_store.update(
+                job_id, db, status="failed", error="Improvement failed",
+                finished_at=_utcnow()
+            )
+            raise
+        await improve_job_store.update(
+            job_id, db, status="succeeded", version=history.version,
+            finished_at=_utcnow()
+        )
+
+
 class ResumeService:
     @staticmethod
     async def create_resume(
         resume_in: ResumeCreate, db: AsyncSession, user_id: int
     ) -> ResumeResponse:
-        resume = await ResumeRepository(db).create(resume_in, user_id)
+        async with UnitOfWork(db) as uow:
+            resume = await uow.resumes.create(resume_in, user_id)
         return ResumeResponse.model_validate(resume)
 
     @staticmethod
     async def get_resumes(
-        email: str, db: AsyncSession
-    ) -> list[ResumeResponse]:
+        email: str, db: AsyncSession,
+        limit: int | None = None, cursor: str | None = None
+    ) -> ResumePage:
+        after_id = decode_cursor(cursor)
+        if limit is None:
+            limit = settings.PAGINATION_DEFAULT_LIMIT
         user = await UserRepository(db).get_by_email(email)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
             )
-        return [ResumeResponse.model_validate(resume) for resume in
-                user.resumes]
+        resumes = await ResumeRepository(db).list_by_user(
+            user.id, after_id=after_id, limit=fetch_limit(limit)
+        )
+        page, next_cursor = paginate(resumes, limit, key=lambda r: r.id)
+        return ResumePage(
+            items=[ResumeResponse.model_validate(resume) for resume in page],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    async def search_resumes(
+        user_id: int, query: str, db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+    ) -> ResumeSearchPage:
+        # Ranked results have no stable key, so the cursor is an offset.
+        offset = max(decode_cursor(cursor) or 0, 0)
+        terms = search_terms(query)
+        if not terms:
+            return ResumeSearchPage(items=[])
+
+        rows = await SearchRepository(db).search(
+            user_id, terms, offset=offset, limit=limit + 1
+        )
+        page, next_cursor = paginate(
+            list(enumerate(rows, start=offset + 1)), limit,
+            key=lambda item: item[0]
+        )
+        return ResumeSearchPage(
+            items=[
+                ResumeSearchResult(
+                    id=row.id,
+                    title=row.title,
+                    highlight=highlight(row.content, terms),
+                    score=row.score,
+                )
+                for _, row in page
+            ],
+            next_cursor=next_cursor,
+        )
 
     @staticmethod
     async def get_resume(
@@ -59,34 +347,40 @@ class ResumeService:
         db: AsyncSession,
         current_user: User
     ) -> ResumeResponse:
-        resume = await ResumeRepository(db).update(resume_id, resume_in)
-        if not resume:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Resume not found"
+        async with UnitOfWork(db) as uow:
+            resume = await uow.resumes.update(
+                resume_id, resume_in, owner_id=current_user.id
             )
+        if resume:
+            return ResumeResponse.model_validate(resume)
 
-        if resume.user_id != current_user.id:
+        if await ResumeRepository(db).get_owner_id(resume_id) is None:
             raise HTTPException(
-                status_code=403, detail="Not allowed to edit this resume"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Resume not found"
             )
-        return ResumeResponse.model_validate(resume)
+        raise HTTPException(
+            status_code=403, detail="Not allowed to edit this resume"
+        )
 
     @staticmethod
     async def delete_resume(
         resume_id: int, db: AsyncSession, current_user: User
     ):
-        resume_repo = ResumeRepository(db)
-        resume = await resume_repo.get_by_id(resume_id)
-        if not resume:
-            raise HTTPException(status_code=404, detail="Resume not found")
-
-        if resume.user_id != current_user.id:
+        # The row is read once, without its text, and only when it is ours.
+        async with UnitOfWork(db) as uow:
+            resume = await uow.resumes.delete(
+                resume_id, owner_id=current_user.id
+            )
+        if resume is None:
+            if await ResumeRepository(db).get_owner_id(resume_id) is None:
+                raise HTTPException(
+                    status_code=404, detail="Resume not found"
+                )
             raise HTTPException(
                 status_code=403, detail="Not allowed to delete this resume"
             )
-
-        await resume_repo.delete(resume_id)
+        version_diffs.delete_where(lambda key: key[0] == resume_id)
 
     @staticmethod
     async def improve_resume(
@@ -96,48 +390,375 @@ class ResumeService:
         db: AsyncSession,
         current_user: User
     ) -> ResumeImprove:
-        resume_repo = ResumeRepository(db)
-        resume = await resume_repo.get_by_id(resume_id)
-        if not resume:
+        resume_history = await _improve(
+            resume_id, resume_improve, db, current_user
+        )
+        return ResumeImprove.model_validate(resume_history)
+
+    @staticmethod
+    async def stream_improve_resume(
+        resume_id: int, resume_improve: ResumeImprove, db: AsyncSession,
+        current_user: User
+    ) -> AsyncIterator[str]:
+        """Check access now, then return the SSE stream of the improvement.
+
+        The stream emits ``delta`` events with partial content, then one
+        ``done`` event with the stored version, or an ``error`` event.
+        """
+        owner_id = await ResumeRepository(db).get_owner_id(resume_id)
+        if owner_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Resume not found"
             )
 
-        if resume.user_id != current_user.id:
+        if owner_id != current_user.id:
             raise HTTPException(
                 status_code=403, detail="Not allowed to improve this resume"
             )
 
-        improve_content = resume_improve.content + " [Improved]"
-        resume_history_repo = ResumeHistoryRepository(db)
-        new_version = await resume_history_repo.get_max_version(resume_id) + 1
-        resume_history = await resume_history_repo.create(
-            resume_id, improve_content, new_version
+        return _stream_improvement(
+            resume_id, resume_improve, current_user, db.bind
         )
 
-        await resume_repo.update(
-            resume_id, ResumeUpdate(
-                title=resume.title, content=improve_content
+    @staticmethod
+    async def submit_improve_job(
+        resume_id: int, resume_improve: ResumeImprove, db: AsyncSession,
+        current_user: User
+    ) -> ImproveJobResponse:
+        owner_id = await ResumeRepository(db).get_owner_id(resume_id)
+        if owner_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Resume not found"
+            )
+
+        if owner_id != current_user.id:
+            raise HTTPException(
+                status_code=403, detail="Not allowed to improve this resume"
             )
+
+        job = ImproveJobResponse(
+            id=uuid.uuid4().hex,
+            resume_id=resume_id,
+            user_id=current_user.id,
+            status="queued",
+            created_at=_utcnow(),
         )
+        await improve_job_store.create(job, db)
+        try:
+            improve_jobs.submit(partial(
+                _run_improve_job, job.id, resume_id, resume_improve,
+                current_user, db.bind
+            ))
+        except HTTPException as exc:
+            await improve_job_store.update(
+                job.id, db, status="failed", error=exc.detail,
+                finished_at=_utcnow()
+            )
+            raise
+        return job
 
-        return ResumeImprove.model_validate(resume_history)
+    @staticmethod
+    async def get_improve_job(
+        resume_id: int, job_id: str, current_user: User, db: AsyncSession
+    ) -> ImproveJobResponse:
+        job = await improve_job_store.get(job_id, db)
+        if job is None or job.resume_id != resume_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found"
+            )
+
+        if job.user_id != current_user.id:
+            raise HTTPException(
+                status_code=403, detail="Not allowed to access this job"
+            )
+
+        return job
 
     @staticmethod
-    async def get_resume_history(resume_id: int, current_user: User, db: AsyncSession) -> list[
-        ResumeHistoryResponse]:
-        resume = await ResumeRepository(db).get_by_id(resume_id)
-        if not resume:
+    async def get_improve_job_result(
+        resume_id: int, job_id: str, current_user: User, db: AsyncSession
+    ) -> ResumeImprove:
+        job = await ResumeService.get_improve_job(
+            resume_id, job_id, current_user, db
+        )
+        if job.status != "succeeded":
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=job.error or f"Job is {job.status}"
+            )
+
+        content = await ResumeHistoryRepository(db).get_content(
+            resume_id, job.version
+        )
+        if content is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Version not found"
+            )
+        return ResumeImprove(content=content)
+
+    @staticmethod
+    async def find_similar_resumes(
+        resume_id: int, current_user: User, db: AsyncSession,
+        threshold: float = 0.5, limit: int = DEFAULT_PAGE_SIZE
+    ) -> list[SimilarResume]:
+        owner_id = await ResumeRepository(db).get_owner_id(resume_id)
+        if owner_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Resume not found"
             )
 
-        if resume.user_id != current_user.id:
+        if owner_id != current_user.id:
+            raise HTTPException(
+                status_code=403, detail="Not allowed to access this resume"
+            )
+
+        matches = await SimilarityRepository(db).find_similar(
+            resume_id, threshold=threshold, limit=limit
+        )
+        return [
+            SimilarResume(id=row.id, title=row.title, similarity=score)
+            for row, score in matches
+        ]
+
+    @staticmethod
+    async def get_resume_history(
+        resume_id: int, current_user: User, db: AsyncSession,
+        limit: int | None = None, cursor: str | None = None
+    ) -> ResumeHistoryPage:
+        after_version = decode_cursor(cursor)
+        if limit is None:
+            limit = settings.PAGINATION_DEFAULT_LIMIT
+        owner_id = await ResumeRepository(db).get_owner_id(resume_id)
+        if owner_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Resume not found"
+            )
+
+        if owner_id != current_user.id:
             raise HTTPException(
                 status_code=403, detail="Not allowed to improve this resume"
             )
 
-        return [ResumeHistoryResponse.model_validate(history) for history in
-                resume.histories]
+        histories = await ResumeHistoryRepository(db).list_by_resume(
+            resume_id, after_version=after_version,
+            limit=fetch_limit(limit)
+        )
+        page, next_cursor = paginate(histories, limit, key=lambda h: h.version)
+        return ResumeHistoryPage(
+            items=[ResumeHistoryResponse.model_validate(history)
+                   for history in page],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    async def diff_resume_versions(
+        resume_id: int, from_version: int, to_version: int,
+        current_user: User, db: AsyncSession,
+        granularity: Granularity = "line"
+    ) -> ResumeDiff:
+        owner_id = await ResumeRepository(db).get_owner_id(resume_id)
+        if owner_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Resume not found"
+            )
+
+        if owner_id != current_user.id:
+            raise HTTPException(
+                status_code=403, detail="Not allowed to access this resume"
+            )
+
+        key = (resume_id, from_version, to_version, granularity)
+        diff = version_diffs.get(key)
+        if diff is not None:
+            return diff
+
+        repo = ResumeHistoryRepository(db)
+        old = await repo.get_content(resume_id, from_version)
+        new = await repo.get_content(resume_id, to_version)
+        if old is None or new is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Version not found"
+            )
+
+        diff = ResumeDiff(
+            resume_id=resume_id,
+            from_version=from_version,
+            to_version=to_version,
+            granularity=granularity,
+            ops=[
+                DiffOp(op=op, text=text)
+                for op, text in diff_text(old, new, granularity)
+            ],
+        )
+        version_diffs.set(key, diff)
+        return diff
+
+    @staticmethod
+    async def export_resumes(
+        user_id: int, bind: AsyncEngine
+    ) -> AsyncIterator[str]:
+        # The request's session is closed before a streamed body is sent,
+        # so the export reads through a session of its own.
+        batch_size = settings.EXPORT_BATCH_SIZE
+        async with AsyncSession(bind) as db:
+            resumes = ResumeRepository(db).stream_by_user(user_id, batch_size)
+            async for rows in resumes:
+                yield _ndjson(
+                    "resume", (ResumeResponse.model_validate(r) for r in rows)
+                )
+
+            histories = ResumeHistoryRepository(db).stream_by_user(
+                user_id, batch_size
+            )
+            async for rows in histories:
+                yield _ndjson(
+                    "history",
+                    (ResumeHistoryResponse.model_validate(h) for h in rows)
+                )
+
+    @staticmethod
+    async def improve_resumes_batch(
+        batch_in: ResumeBatchImprove, current_user: User, bind: AsyncEngine
+    ) -> AsyncIterator[str]:
+        """Improve many resumes, yielding one NDJSON result per item.
+
+        Items that fail the ownership check are reported first. The rest
+        go through the shared micro-batcher with no session open, and their
+        history versions are then written in a single transaction.
+
+        That write waits for every micro-batch of the request, so the
+        successful results only arrive once the slowest one has finished.
+        This is deliberate. The batch either saves entirely or reports
+        "Could not be saved" for every item. And repeated items for one
+        resume are versioned in request order, not in whatever order
+        their micro-batches happened to complete.
+        """
+        items = batch_in.items
+        async with AsyncSession(bind) as db:
+            resumes = {
+                row.id: row for row in await ResumeRepository(db).get_contents(
+                    list({item.resume_id for item in items})
+                )
+            }
+            work = []
+            for index, item in enumerate(items):
+                resume = resumes.get(item.resume_id)
+                if resume is None or resume.user_id != current_user.id:
+                    yield ResumeBatchImproveResult(
+                        index=index, resume_id=item.resume_id,
+                        error="Resume not found" if resume is None
+                        else "Not allowed to improve this resume",
+                    ).model_dump_json(exclude_none=True) + "\n"
+                    continue
+                content = (
+                    resume.content if item.content is None else item.content
+                )
+                key = ImproveCache.key(
+                    content, improver.improve_engine.version
+                )
+                work.append({
+                    "index": index,
+                    "resume_id": item.resume_id,
+                    "content": content,
+                    "key": key,
+                    "cached": await improve_cache.get(key, db),
+                })
+
+        misses = [entry for entry in work if entry["cached"] is None]
+        improved = await asyncio.gather(
+            *(improve_batcher.submit(entry["content"]) for entry in misses),
+            return_exceptions=True,
+        )
+        for entry, result in zip(misses, improved):
+            entry["result"] = result
+        for entry in work:
+            entry.setdefault("result", entry["cached"])
+
+        results = [
+            ResumeBatchImproveResult(
+                index=entry["index"], resume_id=entry["resume_id"]
+            )
+            for entry in work
+        ]
+        try:
+            async with AsyncSession(bind) as db, UnitOfWork(db) as uow:
+                for entry, result in zip(work, results):
+                    if isinstance(entry["result"], Exception):
+                        result.error = "Improvement failed"
+                        continue
+                    if entry["cached"] is None:
+                        await improve_cache.set(
+                            entry["key"], entry["result"], db
+                        )
+                    version = await uow.resumes.store_next_version(
+                        entry["resume_id"], entry["result"],
+                        owner_id=current_user.id
+                    )
+                    if version is None:
+                        result.error = "Resume not found"
+                        continue
+                    await uow.histories.create(
+                        entry["resume_id"], entry["result"], version
+                    )
+                    result.version = version
+                    result.content = entry["result"]
+        except SQLAlchemyError:
+            for result in results:
+                result.version = result.content = None
+                result.error = result.error or "Could not be saved"
+
+        for result in results:
+            yield result.model_dump_json(exclude_none=True) + "\n"
+
+    @staticmethod
+    async def import_resumes(
+        chunks: AsyncIterable[bytes], content_type: str,
+        db: AsyncSession, user_id: int
+    ) -> ResumeImportResult:
+        parse = IMPORT_FORMATS.get(content_type.split(";")[0].strip().lower())
+        if parse is None:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Unsupported import format"
+            )
+
+        rows, errors, batch = 0, [], []
+        async for row, record in parse(
+            chunks, max_line_bytes=settings.IMPORT_MAX_LINE_BYTES,
+            max_body_bytes=settings.IMPORT_MAX_BODY_BYTES,
+        ):
+            rows += 1
+            if isinstance(record, str):
+                errors.append(ResumeImportError(row=row, detail=record))
+            else:
+                try:
+                    batch.append((row, ResumeCreate.model_validate(record)))
+                except ValidationError as exc:
+                    errors.append(ResumeImportError(
+                        row=row, detail=_validation_detail(exc)
+                    ))
+            if len(errors) > settings.IMPORT_MAX_ERRORS:
+                # Batches before this point are already committed.
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"Import stopped at row {row}: more than "
+                           f"{settings.IMPORT_MAX_ERRORS} invalid rows"
+                )
+            if len(batch) >= settings.IMPORT_BATCH_SIZE:
+                errors.extend(await _save_batch(batch, db, user_id))
+                batch = []
+        if batch:
+            errors.extend(await _save_batch(batch, db, user_id))
+
+        errors.sort(key=lambda error: error.row)
+        return ResumeImportResult(
+            created=rows - len(errors), errors=errors
+        )
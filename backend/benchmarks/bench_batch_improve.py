@@ -0,0 +1,96 @@
+"""Compare improving resumes one request at a time with the batch path.
+
+The engine is the local one plus a fixed per-call overhead (``--call-ms``)
+standing in for the round trip to a model, so the effect of
+micro-batching shows up without a real model.
+
+    python -m benchmarks.bench_batch_improve --resumes 200 --call-ms 5
+"""
+import asyncio
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core import improver
+from app.models import User
+from app.repositories.resume_repo import ResumeRepository
+from app.schemas.resume import (
+    ResumeBatchImprove, ResumeCreate, ResumeImprove,
+)
+from app.services.improve_cache import improve_cache
+from app.services.resume_service import ResumeService, improve_batcher
+from benchmarks.common import base_parser, bench_engine, report, Timer
+
+
+class RoundTripEngine(improver.ImprovementEngine):
+    def __init__(self, call_ms: float):
+        self.call_ms = call_ms
+        self.calls = 0
+        self.local = improver.LocalEngine()
+
+    async def improve(self, content: str) -> str:
+        return (await self.improve_many([content]))[0]
+
+    async def improve_many(self, contents: list[str]) -> list[str]:
+        self.calls += 1
+        await asyncio.sleep(self.call_ms / 1000)
+        return [await self.local.improve(content) for content in contents]
+
+
+async def main() -> None:
+    parser = base_parser(__doc__)
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--call-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    async with bench_engine(args.url) as engine:
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        async with sessions() as db:
+            user = User(email="bench@example.com", hashed_password="x")
+            db.add(user)
+            await db.flush()
+            await ResumeRepository(db).create_many([
+                ResumeCreate(title=f"Resume {i}", content=f"Resume {i}")
+                for i in range(args.resumes)
+            ], user.id)
+            await db.commit()
+            ids = [r.id for r in await ResumeRepository(db).list_by_user(
+                user.id
+            )]
+
+        engine_impl = RoundTripEngine(args.call_ms)
+        improver.improve_engine = improver.guarded(engine_impl)
+        async with sessions() as db:
+            with Timer() as single:
+                for resume_id in ids:
+                    await ResumeService.improve_resume(
+                        resume_id, ResumeImprove(content=f"One {resume_id}"),
+                        db, user
+                    )
+        single_calls, engine_impl.calls = engine_impl.calls, 0
+        improve_cache.clear()
+
+        batch_in = ResumeBatchImprove(items=[
+            {"resume_id": resume_id, "content": f"Batch {resume_id}"}
+            for resume_id in ids
+        ])
+        with Timer() as batch:
+            async for _ in ResumeService.improve_resumes_batch(
+                batch_in, user, engine
+            ):
+                pass
+
+    for label, timer, engine_calls in (
+        ("one request per resume", single, single_calls),
+        ("batch endpoint", batch, engine_impl.calls),
+    ):
+        report(label, [
+            ("resumes", len(ids)),
+            ("engine calls", engine_calls),
+            ("total ms", timer.elapsed * 1000),
+            ("resumes / sec", len(ids) / timer.elapsed),
+        ])
+    report("micro-batcher", list(improve_batcher.stats().items()))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
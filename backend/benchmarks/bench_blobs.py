@@ -0,0 +1,69 @@
+"""Measure how much the content blob store deduplicates.
+
+Every user creates a copy of the same template resume and improves it a
+few times. Reports the text written by the API against the bytes that
+end up in content_blobs.
+
+    python -m benchmarks.bench_blobs --users 100 --improves 3
+"""
+import asyncio
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models import ContentBlob, User
+from app.schemas.resume import ResumeCreate, ResumeImprove
+from app.services.resume_service import ResumeService
+from benchmarks.bench_history_delta import resume_versions
+from benchmarks.common import base_parser, bench_engine, report, Timer
+
+
+async def main() -> None:
+    parser = base_parser(__doc__)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--improves", type=int, default=3)
+    parser.add_argument("--size", type=int, default=20_000)
+    args = parser.parse_args()
+
+    template = resume_versions(1, args.size)[0]
+    written = 0
+    async with bench_engine(args.url) as engine:
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        async with sessions() as db:
+            with Timer() as timer:
+                for index in range(args.users):
+                    user = User(
+                        email=f"bench-{index}@example.com",
+                        hashed_password="x",
+                    )
+                    db.add(user)
+                    await db.commit()
+                    resume = await ResumeService.create_resume(
+                        ResumeCreate(title="Copy", content=template),
+                        db, user.id
+                    )
+                    written += len(template)
+                    for _ in range(args.improves):
+                        improved = await ResumeService.improve_resume(
+                            resume.id, ResumeImprove(content=template),
+                            db, user
+                        )
+                        # Resume.content and the history row.
+                        written += 2 * len(improved.content)
+
+            blobs, stored = (await db.execute(
+                select(func.count(), func.sum(func.length(ContentBlob.content)))
+            )).one()
+
+    report("content blobs", [
+        ("resumes", args.users),
+        ("improves / resume", args.improves),
+        ("text written KB", written / 1024),
+        ("blobs", blobs),
+        ("stored KB", stored / 1024),
+        ("ms / resume", timer.elapsed / args.users * 1000),
+    ])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
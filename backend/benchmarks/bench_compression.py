@@ -0,0 +1,72 @@
+"""Compare stored size and latency of resume content codecs.
+
+Writes the same set of ~20 KB resumes with each codec, then reports
+stored bytes and the latency of reading them back.
+
+    python -m benchmarks.bench_compression --resumes 200
+"""
+import asyncio
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.models import Resume, User
+from app.repositories.resume_repo import ResumeRepository
+from app.schemas.resume import ResumeCreate
+from benchmarks.bench_history_delta import resume_versions
+from benchmarks.common import base_parser, bench_engine, report, Timer
+
+
+async def run(engine, contents: list[str], codec: str) -> None:
+    settings.CONTENT_COMPRESSION = codec
+    # Identical text is stored once, so keep each run's blobs distinct.
+    contents = [f"{codec}\n{content}" for content in contents]
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as db:
+        user = User(email=f"bench-{codec}@example.com", hashed_password="x")
+        db.add(user)
+        await db.flush()
+        repo = ResumeRepository(db)
+        with Timer() as write_timer:
+            for content in contents:
+                await repo.create(
+                    ResumeCreate(title="Bench", content=content), user.id
+                )
+            await db.commit()
+
+        stored = (await db.execute(
+            select(func.sum(func.length(Resume.content)))
+            .where(Resume.user_id == user.id)
+        )).scalar()
+
+    async with sessions() as db:
+        with Timer() as read_timer:
+            resumes = await ResumeRepository(db).list_by_user(user.id)
+    assert [resume.content for resume in resumes] == contents
+
+    raw = sum(len(content.encode()) for content in contents)
+    report(codec, [
+        ("resumes", len(contents)),
+        ("raw KB", raw / 1024),
+        ("stored KB", stored / 1024),
+        ("ratio", raw / stored),
+        ("write ms / resume", write_timer.elapsed / len(contents) * 1000),
+        ("read ms / resume", read_timer.elapsed / len(contents) * 1000),
+    ])
+
+
+async def main() -> None:
+    parser = base_parser(__doc__)
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--size", type=int, default=20_000)
+    args = parser.parse_args()
+
+    contents = resume_versions(args.resumes, args.size)
+    async with bench_engine(args.url) as engine:
+        for codec in ("none", "zlib", "lzma"):
+            await run(engine, contents, codec)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+"""Measure version diffs, uncached and from the diff cache.
+
+Stores a chain of edited ~20 KB resume versions, then diffs random
+version pairs through the service twice: the first pass computes every
+diff, the second is answered from the cache.
+
+    python -m benchmarks.bench_diff --versions 50
+"""
+import asyncio
+import random
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models import User
+from app.repositories.resume_repo import (
+    ResumeRepository,
+    ResumeHistoryRepository,
+)
+from app.schemas.resume import ResumeCreate
+from app.services.resume_service import ResumeService, version_diffs
+from benchmarks.bench_history_delta import resume_versions
+from benchmarks.common import base_parser, bench_engine, report, Timer
+
+
+async def main() -> None:
+    parser = base_parser(__doc__)
+    parser.add_argument("--versions", type=int, default=50)
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--pairs", type=int, default=100)
+    parser.add_argument("--granularity", choices=["line", "word"],
+                        default="word")
+    args = parser.parse_args()
+
+    versions = resume_versions(args.versions, args.size)
+    rng = random.Random(5)
+    pairs = [
+        tuple(sorted(rng.sample(range(1, args.versions + 1), 2)))
+        for _ in range(args.pairs)
+    ]
+    async with bench_engine(args.url) as engine:
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        async with sessions() as db:
+            user = User(email="bench@example.com", hashed_password="x")
+            db.add(user)
+            await db.flush()
+            resume = await ResumeRepository(db).create(
+                ResumeCreate(title="Bench", content=versions[0]), user.id
+            )
+            repo = ResumeHistoryRepository(db)
+            for version, content in enumerate(versions, start=1):
+                await repo.create(resume.id, content, version)
+            await db.commit()
+
+        timings = {}
+        for label in ("computed", "cached"):
+            async with sessions() as db:
+                with Timer() as timer:
+                    for first, second in pairs:
+                        await ResumeService.diff_resume_versions(
+                            resume.id, first, second, user, db,
+                            granularity=args.granularity
+                        )
+            timings[label] = timer.elapsed / len(pairs) * 1000
+
+    report(f"{args.granularity} diff", [
+        ("versions", args.versions),
+        ("pairs", len(pairs)),
+        ("computed ms / diff", timings["computed"]),
+        ("cached ms / diff", timings["cached"]),
+        ("cache hit rate", version_diffs.hit_rate),
+    ])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
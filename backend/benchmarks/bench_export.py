@@ -0,0 +1,91 @@
+"""Compare peak memory of the streaming export with paging everything in.
+
+Seeds one user with resumes that each carry a long history, then exports
+it twice: through ResumeService.export_resumes, and by loading every
+resume and its full history the way /resumes/ plus /history would.
+
+    python -m benchmarks.bench_export --resumes 10 --versions 40
+"""
+import asyncio
+import tracemalloc
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models import User
+from app.repositories.resume_repo import (
+    ResumeRepository,
+    ResumeHistoryRepository,
+)
+from app.schemas.resume import ResumeCreate
+from app.services.resume_service import ResumeService
+from benchmarks.bench_history_delta import resume_versions
+from benchmarks.common import base_parser, bench_engine, report, Timer
+
+
+async def seed(sessions, resumes: int, versions: list[str]) -> int:
+    async with sessions() as db:
+        user = User(email="bench@example.com", hashed_password="x")
+        db.add(user)
+        await db.flush()
+        for index in range(resumes):
+            resume = await ResumeRepository(db).create(
+                ResumeCreate(title=f"Resume {index}", content=versions[0]),
+                user.id
+            )
+            for version, content in enumerate(versions, start=1):
+                await ResumeHistoryRepository(db).create(
+                    resume.id, f"{index}\n{content}", version
+                )
+        await db.commit()
+        return user.id
+
+
+async def streamed(engine, user_id: int) -> int:
+    exported = 0
+    async for chunk in ResumeService.export_resumes(user_id, engine):
+        exported += len(chunk)
+    return exported
+
+
+async def materialised(sessions, user_id: int) -> int:
+    async with sessions() as db:
+        resumes = await ResumeRepository(db).list_by_user(user_id)
+        histories = [
+            await ResumeHistoryRepository(db).list_by_resume(resume.id)
+            for resume in resumes
+        ]
+        return sum(len(r.content) for r in resumes) + sum(
+            len(h.content) for rows in histories for h in rows
+        )
+
+
+async def measure(name: str, export) -> None:
+    tracemalloc.start()
+    with Timer() as timer:
+        exported = await export
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    report(name, [
+        ("exported MB", exported / 2**20),
+        ("peak MB", peak / 2**20),
+        ("seconds", timer.elapsed),
+    ])
+
+
+async def main() -> None:
+    parser = base_parser(__doc__)
+    parser.add_argument("--resumes", type=int, default=10)
+    parser.add_argument("--versions", type=int, default=40)
+    parser.add_argument("--size", type=int, default=20_000)
+    args = parser.parse_args()
+
+    versions = resume_versions(args.versions, args.size)
+    async with bench_engine(args.url) as engine:
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        user_id = await seed(sessions, args.resumes, versions)
+        await measure("streamed NDJSON", streamed(engine, user_id))
+        await measure("materialised lists", materialised(sessions, user_id))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+"""Compare full-content and delta-encoded resume history.
+
+Stores the same sequence of edited versions of a ~20 KB resume both
+ways, then reports stored bytes and the latency of reading single
+versions back.
+
+    python -m benchmarks.bench_history_delta --versions 200
+"""
+import asyncio
+import random
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.models import ResumeHistory, User
+from app.repositories.resume_repo import (
+    ResumeRepository,
+    ResumeHistoryRepository,
+)
+from app.schemas.resume import ResumeCreate
+from benchmarks.common import base_parser, bench_engine, report, Timer
+
+
+def resume_versions(count: int, size: int) -> list[str]:
+    rng = random.Random(42)
+    words = ["led", "built", "shipped", "designed", "scaled", "migrated",
+             "python", "postgres", "services", "teams", "latency", "cost"]
+    lines = [
+        " ".join(rng.choice(words) for _ in range(12))
+        for _ in range(size // 70)
+    ]
+    versions = []
+    for _ in range(count):
+        index = rng.randrange(len(lines))
+        lines[index] = " ".join(rng.choice(words) for _ in range(12))
+        versions.append("\n".join(lines) + " [Improved]")
+    return versions
+
+
+async def run(engine, versions: list[str], delta: bool, reads: int) -> None:
+    settings.HISTORY_DELTA_ENABLED = delta
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as db:
+        user = User(email=f"bench-{delta}@example.com", hashed_password="x")
+        db.add(user)
+        await db.flush()
+        resume = await ResumeRepository(db).create(
+            ResumeCreate(title="Bench", content=versions[0]), user.id
+        )
+        repo = ResumeHistoryRepository(db)
+        with Timer() as write_timer:
+            for version, content in enumerate(versions, start=1):
+                await repo.create(resume.id, content, version)
+        await db.commit()
+
+        stored = (await db.execute(
+            select(func.sum(func.length(ResumeHistory.content)))
+            .where(ResumeHistory.resume_id == resume.id)
+        )).scalar()
+
+    latencies = []
+    for _ in range(reads):
+        version = random.randint(1, len(versions))
+        async with sessions() as db:
+            with Timer() as timer:
+                rows = await ResumeHistoryRepository(db).list_by_resume(
+                    resume.id, after_version=version - 1, limit=1
+                )
+            assert rows[0].content == versions[version - 1]
+            latencies.append(timer.elapsed * 1000)
+
+    report("delta + keyframes" if delta else "full content", [
+        ("versions", len(versions)),
+        ("keyframe interval", settings.HISTORY_KEYFRAME_INTERVAL),
+        ("stored KB", stored / 1024),
+        ("write ms / version", write_timer.elapsed / len(versions) * 1000),
+        ("read ms avg", sum(latencies) / len(latencies)),
+        ("read ms max", max(latencies)),
+    ])
+
+
+async def main() -> None:
+    parser = base_parser(__doc__)
+    parser.add_argument("--versions", type=int, default=200)
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--reads", type=int, default=200)
+    args = parser.parse_args()
+
+    versions = resume_versions(args.versions, args.size)
+    async with bench_engine(args.url) as engine:
+        await run(engine, versions, delta=False, reads=args.reads)
+        await run(engine, versions, delta=True, reads=args.reads)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
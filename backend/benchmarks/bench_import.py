@@ -0,0 +1,70 @@
+"""Compare bulk NDJSON import with one POST /resumes/ per resume.
+
+    python -m benchmarks.bench_import --rows 5000
+"""
+import asyncio
+import json
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models import User
+from app.schemas.resume import ResumeCreate
+from app.services.resume_service import ResumeService
+from benchmarks.common import (
+    base_parser, bench_engine, report, StatementCounter, Timer,
+)
+
+
+def resume_rows(count: int, size: int) -> list[dict]:
+    return [
+        {"title": f"Resume {i}", "content": f"Resume {i}\n" + "x" * size}
+        for i in range(count)
+    ]
+
+
+async def ndjson(rows: list[dict], chunk_size: int = 64 * 1024):
+    data = "".join(json.dumps(row) + "\n" for row in rows).encode()
+    for start in range(0, len(data), chunk_size):
+        yield data[start:start + chunk_size]
+
+
+async def run(engine, rows: list[dict], bulk: bool) -> None:
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as db:
+        user = User(email=f"bench-{bulk}@example.com", hashed_password="x")
+        db.add(user)
+        await db.commit()
+        with StatementCounter(engine) as counter, Timer() as timer:
+            if bulk:
+                result = await ResumeService.import_resumes(
+                    ndjson(rows), "application/x-ndjson", db, user.id
+                )
+                assert result.created == len(rows)
+            else:
+                for row in rows:
+                    await ResumeService.create_resume(
+                        ResumeCreate(**row), db, user.id
+                    )
+
+    report("bulk import" if bulk else "one request per resume", [
+        ("rows", len(rows)),
+        ("statements", counter.statements),
+        ("commits", counter.commits),
+        ("rows / second", len(rows) / timer.elapsed),
+    ])
+
+
+async def main() -> None:
+    parser = base_parser(__doc__)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--size", type=int, default=2000)
+    args = parser.parse_args()
+
+    rows = resume_rows(args.rows, args.size)
+    async with bench_engine(args.url) as engine:
+        await run(engine, rows, bulk=False)
+        await run(engine, rows, bulk=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""Count database round trips and commits per improve.
+
+Compares the current ResumeService.improve_resume against the previous
+flow, where every repository call committed and refreshed on its own.
+
+    python -m benchmarks.bench_improve --improves 200
+"""
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
+
+from app.models import Resume, ResumeHistory, User
+from app.repositories.blob_repo import BlobRepository
+from app.repositories.search_repo import SearchRepository
+from app.repositories.similarity_repo import SimilarityRepository
+from app.schemas.resume import ResumeCreate, ResumeImprove
+from app.services.resume_service import ResumeService
+from benchmarks.common import (
+    base_parser, bench_engine, report, StatementCounter, Timer,
+)
+
+
+async def legacy_improve(
+    db: AsyncSession, resume_id: int, user: User, content: str
+) -> None:
+    # Does the same work as the service: history row, content swap with
+    # blob reference counting, and search and similarity reindexing.
+    blobs = BlobRepository(db)
+    resume = (await db.execute(
+        select(Resume).where(Resume.id == resume_id)
+        .options(selectinload(Resume.histories))
+    )).scalar_one()
+    assert resume.user_id == user.id
+    improved = content + " [Improved]"
+    version = (await db.execute(
+        select(ResumeHistory.version).where(
+            ResumeHistory.resume_id == resume_id
+        ).order_by(ResumeHistory.version.desc()).limit(1)
+    )).scalar() or 0
+    history = ResumeHistory(
+        resume_id=resume_id, version=version + 1,
+        content_id=await blobs.acquire(improved),
+    )
+    db.add(history)
+    await db.commit()
+    await db.refresh(history)
+    resume = (await db.execute(
+        select(Resume).where(Resume.id == resume_id)
+        .options(selectinload(Resume.histories))
+    )).scalar_one()
+    old_content_id = resume.content_id
+    resume.content_id = await blobs.acquire(improved)
+    resume.current_version = version + 1
+    await db.commit()
+    await db.refresh(resume)
+    await blobs.release(old_content_id)
+    await db.commit()
+    entries = [{
+        "resume_id": resume_id,
+        "user_id": user.id,
+        "title": resume.title,
+        "content": improved,
+    }]
+    await SearchRepository(db).index(entries)
+    await db.commit()
+    await SimilarityRepository(db).index(entries)
+    await db.commit()
+
+
+async def run(engine, improves: int, legacy: bool) -> None:
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as db:
+        user = User(email=f"bench-{legacy}@example.com", hashed_password="x")
+        db.add(user)
+        await db.commit()
+        resume = await ResumeService.create_resume(
+            ResumeCreate(title="Bench", content="Content"), db, user.id
+        )
+
+    with StatementCounter(engine) as counter, Timer() as timer:
+        for i in range(improves):
+            async with sessions() as db:
+                content = f"Content revision {i}"
+                if legacy:
+                    await legacy_improve(db, resume.id, user, content)
+                else:
+                    await ResumeService.improve_resume(
+                        resume.id, ResumeImprove(content=content), db, user
+                    )
+
+    report("per-commit repositories" if legacy else "unit of work", [
+        ("improves", improves),
+        ("statements / improve", counter.statements / improves),
+        ("commits / improve", counter.commits / improves),
+        ("ms / improve", timer.elapsed / improves * 1000),
+    ])
+
+
+async def main() -> None:
+    parser = base_parser(__doc__)
+    parser.add_argument("--improves", type=int, default=200)
+    args = parser.parse_args()
+
+    async with bench_engine(args.url) as engine:
+        await run(engine, args.improves, legacy=True)
+        await run(engine, args.improves, legacy=False)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
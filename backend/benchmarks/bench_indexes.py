@@ -0,0 +1,129 @@
+"""Seed a large dataset and compare owner/version lookups with and
+without the resume indexes.
+
+    python -m benchmarks.bench_indexes --users 200 --resumes 20 --versions 50
+"""
+import asyncio
+import random
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.models import Resume, ResumeHistory, User
+from app.repositories.blob_repo import BlobRepository
+from benchmarks.common import base_parser, bench_engine, report, Timer
+
+INDEXES = [
+    index
+    for table in (Resume.__table__, ResumeHistory.__table__)
+    for index in table.indexes
+    if len(index.columns) > 1
+]
+
+
+async def seed(
+    conn: AsyncConnection, users: int, resumes: int, versions: int
+) -> None:
+    await conn.execute(insert(User), [
+        {"id": u, "email": f"user{u}@example.com", "hashed_password": "x"}
+        for u in range(1, users + 1)
+    ])
+    # Every row shares one blob, holding one reference per row.
+    references = users * resumes * (versions + 1)
+    content_id = (await BlobRepository(AsyncSession(bind=conn)).acquire_many(
+        ["lorem ipsum " * 20] * references
+    ))[0]
+    resume_rows = [
+        {"id": r, "user_id": (r - 1) // resumes + 1, "title": f"Resume {r}",
+         "content_id": content_id}
+        for r in range(1, users * resumes + 1)
+    ]
+    await conn.execute(insert(Resume), resume_rows)
+    batch = []
+    for resume in resume_rows:
+        for version in range(1, versions + 1):
+            batch.append({
+                "resume_id": resume["id"], "version": version,
+                "content_id": content_id,
+            })
+        if len(batch) >= 10_000:
+            await conn.execute(insert(ResumeHistory), batch)
+            batch = []
+    if batch:
+        await conn.execute(insert(ResumeHistory), batch)
+
+
+def queries(users: int, resumes: int):
+    user_id = random.randint(1, users)
+    resume_id = random.randint(1, users * resumes)
+    return {
+        "max_version": select(ResumeHistory.version).where(
+            ResumeHistory.resume_id == resume_id
+        ).order_by(ResumeHistory.version.desc()).limit(1),
+        "owner_list": select(Resume.id, Resume.title).where(
+            Resume.user_id == user_id
+        ).order_by(Resume.id).limit(50),
+    }
+
+
+async def explain(conn: AsyncConnection, query) -> list[str]:
+    compiled = query.compile(
+        dialect=conn.dialect, compile_kwargs={"literal_binds": True}
+    )
+    prefix = (
+        "EXPLAIN QUERY PLAN" if conn.dialect.name == "sqlite"
+        else "EXPLAIN ANALYZE"
+    )
+    result = await conn.execute(text(f"{prefix} {compiled}"))
+    return [str(row[-1]) for row in result]
+
+
+async def measure(
+    conn: AsyncConnection, users: int, resumes: int, repeat: int, label: str
+) -> None:
+    for name, query in queries(users, resumes).items():
+        plan = await explain(conn, query)
+        with Timer() as timer:
+            for _ in range(repeat):
+                query = queries(users, resumes)[name]
+                await conn.execute(query)
+        report(f"{label}: {name}", [
+            ("avg ms", timer.elapsed / repeat * 1000),
+            *(("plan", line) for line in plan),
+        ])
+
+
+async def main() -> None:
+    parser = base_parser(__doc__)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--resumes", type=int, default=20)
+    parser.add_argument("--versions", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    async with bench_engine(args.url) as engine:
+        async with engine.begin() as conn:
+            for index in INDEXES:
+                await conn.run_sync(lambda c, i=index: i.drop(c))
+            with Timer() as timer:
+                await seed(conn, args.users, args.resumes, args.versions)
+            report("seed", [
+                ("resumes", args.users * args.resumes),
+                ("history rows", args.users * args.resumes * args.versions),
+                ("seconds", timer.elapsed),
+            ])
+
+        async with engine.begin() as conn:
+            await measure(
+                conn, args.users, args.resumes, args.repeat, "before"
+            )
+            for index in INDEXES:
+                await conn.run_sync(lambda c, i=index: i.create(c))
+            await conn.execute(text("ANALYZE"))
+            await measure(
+                conn, args.users, args.resumes, args.repeat, "after"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
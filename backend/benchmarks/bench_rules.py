@@ -0,0 +1,97 @@
+"""Measure rule-engine rewrite throughput in MB/s of resume text.
+
+Builds a dictionary of synthetic phrase rules on top of the bundled ones,
+then rewrites generated resume text with the compiled single-pass
+rewriter. A baseline applies one regex per rule to a slice of the rules
+and text, and scales the result up to the full rule set.
+
+    python -m benchmarks.bench_rules --rules 50000 --size 2000000
+"""
+import argparse
+import random
+import re
+import string
+
+from app.core.rewriter import PhraseRewriter, load_rules
+from benchmarks.common import report, Timer
+
+
+def synthetic_rules(count: int, rng: random.Random) -> dict[str, str]:
+    vocabulary = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+        for _ in range(max(count // 2, 100))
+    ]
+    rules = load_rules()
+    while len(rules) < count:
+        phrase = " ".join(rng.choices(vocabulary, k=rng.randint(1, 3)))
+        rules[phrase] = rng.choice(vocabulary)
+    return rules
+
+
+def resume_text(size: int, rules: dict[str, str], rng: random.Random) -> str:
+    words = ["led", "built", "shipped", "designed", "scaled", "migrated",
+             "python", "postgres", "services", "teams", "latency", "cost"]
+    phrases = list(rules)
+    lines = []
+    length = 0
+    while length < size:
+        line = [rng.choice(words) for _ in range(10)]
+        line.insert(rng.randrange(len(line)), rng.choice(phrases))
+        lines.append(" ".join(line).capitalize() + ".")
+        length += len(lines[-1]) + 1
+    return "\n".join(lines)[:size]
+
+
+def per_rule_rewrite(rules: dict[str, str], text: str) -> str:
+    for phrase, replacement in rules.items():
+        text = re.sub(
+            r"(?<!\w)(?<!\w[-'\u2019])" + re.escape(phrase)
+            + r"(?!\w)(?![-'\u2019]\w)", replacement, text,
+            flags=re.IGNORECASE,
+        )
+    return text
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rules", type=int, default=50_000)
+    parser.add_argument("--size", type=int, default=2_000_000)
+    parser.add_argument("--baseline-rules", type=int, default=500)
+    parser.add_argument("--baseline-size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    rules = synthetic_rules(args.rules, rng)
+    text = resume_text(args.size, rules, rng)
+    megabytes = len(text.encode()) / 1e6
+
+    with Timer() as compile_timer:
+        rewriter = PhraseRewriter(rules)
+    with Timer() as timer:
+        rewritten = rewriter.rewrite(text)
+    report("compiled rewriter", [
+        ("rules", len(rules)),
+        ("text MB", megabytes),
+        ("compile s", compile_timer.elapsed),
+        ("rewrite s", timer.elapsed),
+        ("MB/s", megabytes / timer.elapsed),
+        ("size change %", (len(rewritten) - len(text)) / len(text) * 100),
+    ])
+
+    sample = dict(list(rules.items())[:args.baseline_rules])
+    sample_text = text[:args.baseline_size]
+    with Timer() as timer:
+        per_rule_rewrite(sample, sample_text)
+    seconds_per_mb = (
+        timer.elapsed / (len(sample_text.encode()) / 1e6)
+        * len(rules) / len(sample)
+    )
+    report("one regex per rule (extrapolated)", [
+        ("rules timed", len(sample)),
+        ("text MB timed", len(sample_text.encode()) / 1e6),
+        ("MB/s", 1 / seconds_per_mb),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compare indexed full-text search with scanning every resume.
+
+The scan loads each of the user's resumes and filters in Python, which is
+the best an unindexed query can do now that content is compressed.
+
+    python -m benchmarks.bench_search --resumes 5000
+"""
+import asyncio
+import random
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models import User
+from app.repositories.resume_repo import ResumeRepository
+from app.schemas.resume import ResumeCreate
+from app.services.resume_service import ResumeService
+from benchmarks.common import base_parser, bench_engine, report, Timer
+
+WORDS = [
+    "python", "postgres", "kubernetes", "react", "golang", "terraform",
+    "kafka", "redis", "django", "fastapi", "spark", "airflow", "rust",
+    "typescript", "graphql", "docker", "aws", "gcp", "linux", "ml",
+]
+
+
+async def main() -> None:
+    parser = base_parser(__doc__)
+    parser.add_argument("--resumes", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    async with bench_engine(args.url) as engine:
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        async with sessions() as db:
+            user = User(email="bench@example.com", hashed_password="x")
+            db.add(user)
+            await db.flush()
+            await ResumeRepository(db).create_many([
+                ResumeCreate(
+                    title=f"Resume {i}",
+                    content=" ".join(rng.choices(WORDS, k=300)) + f" id{i}",
+                )
+                for i in range(args.resumes)
+            ], user.id)
+            await db.commit()
+
+        queries = [f"id{rng.randrange(args.resumes)}" for _ in range(args.queries)]
+        async with sessions() as db:
+            with Timer() as indexed:
+                for query in queries:
+                    page = await ResumeService.search_resumes(
+                        user.id, query, db
+                    )
+                    assert len(page.items) == 1
+
+        async with sessions() as db:
+            with Timer() as scan:
+                for query in queries:
+                    resumes = await ResumeRepository(db).list_by_user(user.id)
+                    hits = [r for r in resumes if query in r.content.split()]
+                    assert len(hits) == 1
+                    db.expunge_all()
+
+    report("search", [
+        ("resumes", args.resumes),
+        ("indexed ms / query", indexed.elapsed / len(queries) * 1000),
+        ("scan ms / query", scan.elapsed / len(queries) * 1000),
+    ])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
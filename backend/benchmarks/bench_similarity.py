@@ -0,0 +1,107 @@
+"""Compare LSH candidate lookup with comparing every pair of resumes.
+
+Seeds resumes in clusters of near-duplicates, then reports how fast
+signatures are computed and how long one "similar resumes" lookup takes
+through the LSH buckets versus scoring the resume against every other
+stored signature.
+
+    python -m benchmarks.bench_similarity --resumes 5000
+"""
+import asyncio
+import random
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core import minhash
+from app.models import ResumeSignature, User
+from app.repositories.resume_repo import ResumeRepository
+from app.repositories.similarity_repo import SimilarityRepository
+from app.schemas.resume import ResumeCreate
+from benchmarks.common import base_parser, bench_engine, report, Timer
+
+WORDS = [
+    "led", "built", "shipped", "designed", "scaled", "migrated", "python",
+    "postgres", "services", "teams", "latency", "cost", "kafka", "react",
+    "terraform", "kubernetes", "mentored", "owned", "reduced", "launched",
+]
+
+
+def resume_texts(count: int, cluster: int, size: int) -> list[str]:
+    rng = random.Random(11)
+    texts = []
+    while len(texts) < count:
+        base = rng.choices(WORDS, k=size)
+        for _ in range(min(cluster, count - len(texts))):
+            words = list(base)
+            for index in rng.sample(range(size), size // 20):
+                words[index] = rng.choice(WORDS)
+            texts.append(" ".join(words))
+    return texts
+
+
+async def main() -> None:
+    parser = base_parser(__doc__)
+    parser.add_argument("--resumes", type=int, default=5000)
+    parser.add_argument("--cluster", type=int, default=5)
+    parser.add_argument("--words", type=int, default=400)
+    parser.add_argument("--lookups", type=int, default=50)
+    args = parser.parse_args()
+
+    texts = resume_texts(args.resumes, args.cluster, args.words)
+    with Timer() as signing:
+        for text in texts:
+            minhash.signature(text)
+
+    rng = random.Random(3)
+    async with bench_engine(args.url) as engine:
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        async with sessions() as db:
+            user = User(email="bench@example.com", hashed_password="x")
+            db.add(user)
+            await db.flush()
+            with Timer() as indexing:
+                await ResumeRepository(db).create_many([
+                    ResumeCreate(title=f"Resume {i}", content=text)
+                    for i, text in enumerate(texts)
+                ], user.id)
+            await db.commit()
+            ids = list((await db.execute(
+                select(ResumeSignature.resume_id)
+            )).scalars())
+
+        targets = rng.sample(ids, min(args.lookups, len(ids)))
+        async with sessions() as db:
+            repo = SimilarityRepository(db)
+            with Timer() as lsh:
+                for resume_id in targets:
+                    await repo.find_similar(resume_id, threshold=0.5, limit=20)
+
+        async with sessions() as db:
+            with Timer() as pairwise:
+                for resume_id in targets:
+                    result = await db.execute(select(
+                        ResumeSignature.resume_id, ResumeSignature.signature
+                    ))
+                    signatures = {
+                        row.resume_id: minhash.from_bytes(row.signature)
+                        for row in result
+                    }
+                    target = signatures.pop(resume_id)
+                    matches = [
+                        other for other, signature in signatures.items()
+                        if minhash.similarity(target, signature) >= 0.5
+                    ]
+
+    report("similarity", [
+        ("resumes", args.resumes),
+        ("signatures / sec", len(texts) / signing.elapsed),
+        ("create_many ms / resume", indexing.elapsed / len(texts) * 1000),
+        ("lsh ms / lookup", lsh.elapsed / len(targets) * 1000),
+        ("pairwise ms / lookup", pairwise.elapsed / len(targets) * 1000),
+        ("matches (last pairwise)", len(matches)),
+    ])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+import argparse
+import os
+import tempfile
+import time
+from contextlib import asynccontextmanager
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
+
+from app.models.base import Base
+
+
+def base_parser(description: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--url", default=None,
+        help="database URL (defaults to a temporary SQLite file)"
+    )
+    return parser
+
+
+@asynccontextmanager
+async def bench_engine(url: str | None, drop_all: bool = True):
+    tmpdir = None
+    if url is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        url = f"sqlite+aiosqlite:///{os.path.join(tmpdir.name, 'bench.db')}"
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield engine
+    finally:
+        if drop_all:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+        if tmpdir is not None:
+            tmpdir.cleanup()
+
+
+class StatementCounter:
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine.sync_engine
+        self.statements = 0
+        self.commits = 0
+
+    def _on_execute(self, *args):
+        self.statements += 1
+
+    def _on_commit(self, *args):
+        self.commits += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        event.listen(self.engine, "commit", self._on_commit)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+        event.remove(self.engine, "commit", self._on_commit)
+
+
+class Timer:
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self.start
+
+
+def report(title: str, rows: list[tuple[str, object]]) -> None:
+    print(f"\n== {title}")
+    width = max(len(name) for name, _ in rows)
+    for name, value in rows:
+        if isinstance(value, float):
+            value = f"{value:,.3f}"
+        print(f"  {name.ljust(width)}  {value}")
@@ -1,13 +1,20 @@
 import pytest
-from sqlalchemy import delete
+from sqlalchemy import delete, text
 from sqlalchemy.ext.asyncio import (
     create_async_engine, AsyncSession,
     async_sessionmaker,
 )
 
+from app.core.security import verified_tokens, principals
 from app.main import app
+from app.services.improve_cache import improve_cache
+from app.services.job_store import improve_job_store
+from app.services.resume_service import version_diffs
 from app.database import get_db
-from app.models import Resume, ResumeHistory, User
+from app.models import (
+    ContentBlob, ImproveJob, ImproveResult, Resume, ResumeBucket,
+    ResumeHistory, ResumeSignature, User,
+)
 from app.models.base import Base
 from httpx import AsyncClient, ASGITransport
 
@@ -52,8 +59,24 @@ async def client(async_session):
 @pytest.fixture(scope="function", autouse=True)
 async def clean_database(async_session: AsyncSession):
     """Фикстура для очистки базы данных перед каждым тестом."""
+    await async_session.execute(delete(ImproveJob))
+    await async_session.execute(delete(ImproveResult))
+    await async_session.execute(delete(ResumeBucket))
+    await async_session.execute(delete(ResumeSignature))
     await async_session.execute(delete(Resume))
     await async_session.execute(delete(ResumeHistory))
     await async_session.execute(delete(User))
+    await async_session.execute(delete(ContentBlob))
+    await async_session.execute(text("DELETE FROM resume_search"))
     await async_session.commit()
     yield
+
+
+@pytest.fixture(scope="function", autouse=True)
+def clear_caches():
+    verified_tokens.clear()
+    principals.clear()
+    version_diffs.clear()
+    improve_job_store.clear()
+    improve_cache.clear()
+    yield
@@ -0,0 +1,94 @@
+import pytest
+from sqlalchemy import select
+
+from app.models import ContentBlob
+from app.repositories.blob_repo import BlobRepository
+from app.repositories.resume_repo import (
+    ResumeRepository,
+    ResumeHistoryRepository,
+)
+from app.schemas.resume import ResumeCreate, ResumeUpdate
+
+
+async def refcounts(db) -> dict[str, int]:
+    result = await db.execute(select(ContentBlob.content, ContentBlob.refcount))
+    return dict(result.all())
+
+
+@pytest.mark.asyncio
+async def test_blob_acquire_and_release(async_session):
+    repo = BlobRepository(async_session)
+
+    first = await repo.acquire("Same text")
+    second = await repo.acquire("Same text")
+    other = await repo.acquire("Other text")
+
+    assert first == second
+    assert first != other
+    assert await refcounts(async_session) == {"Same text": 2, "Other text": 1}
+
+    await repo.release(first, other)
+    assert await refcounts(async_session) == {"Same text": 1}
+
+    await repo.release(first)
+    assert await refcounts(async_session) == {}
+
+
+@pytest.mark.asyncio
+async def test_blob_size_counts_bytes(async_session):
+    blob_id = await BlobRepository(async_session).acquire("Résumé")
+
+    blob = await async_session.get(ContentBlob, blob_id)
+    assert blob.size == len("Résumé".encode("utf-8")) == 8
+
+
+@pytest.mark.asyncio
+async def test_resumes_share_identical_content(async_session):
+    repo = ResumeRepository(async_session)
+    resume_in = ResumeCreate(title="Copy", content="Shared content")
+    first = await repo.create(resume_in, user_id=1)
+    second = await repo.create(resume_in, user_id=1)
+
+    assert first.content_id == second.content_id
+    assert await refcounts(async_session) == {"Shared content": 2}
+
+    updated = await repo.update(
+        second.id, ResumeUpdate(content="Edited content")
+    )
+    assert updated.content == "Edited content"
+    assert updated.content_id != first.content_id
+    assert await refcounts(async_session) == {
+        "Shared content": 1, "Edited content": 1
+    }
+
+
+@pytest.mark.asyncio
+async def test_deleting_resume_collects_unreferenced_blobs(async_session):
+    resume_repo = ResumeRepository(async_session)
+    history_repo = ResumeHistoryRepository(async_session)
+    resume = await resume_repo.create(
+        ResumeCreate(title="Test", content="Version 1"), user_id=1
+    )
+    version = await resume_repo.store_next_version(
+        resume.id, "Version 1", owner_id=1
+    )
+    await history_repo.create(resume.id, "Version 1", version)
+    assert await refcounts(async_session) == {"Version 1": 2}
+
+    await resume_repo.delete(resume.id)
+
+    assert await refcounts(async_session) == {}
+
+
+@pytest.mark.asyncio
+async def test_swapping_contents_keeps_refcounts(async_session):
+    repo = ResumeRepository(async_session)
+    first = await repo.create(ResumeCreate(title="A", content="One"), 1)
+    second = await repo.create(ResumeCreate(title="B", content="Two"), 1)
+
+    await repo.update(first.id, ResumeUpdate(content="Two"))
+    assert await refcounts(async_session) == {"Two": 2}
+    await repo.update(second.id, ResumeUpdate(content="One"))
+    assert await refcounts(async_session) == {"One": 1, "Two": 1}
+    assert await repo.update(999, ResumeUpdate(content="One")) is None
+    assert await refcounts(async_session) == {"One": 1, "Two": 1}
@@ -1,5 +1,9 @@
 import pytest
+from sqlalchemy import select, text
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
 
+from app.core.config import settings
+from app.models import ResumeHistory
 from app.repositories.resume_repo import (
     ResumeRepository,
     ResumeHistoryRepository,
@@ -51,6 +55,29 @@ async def test_resume_repository_update(async_session):
     assert await repo.update(999, update_data) is None
 
 
+@pytest.mark.asyncio
+async def test_resume_repository_update_partial_and_owner(async_session):
+    repo = ResumeRepository(async_session)
+    resume_in = ResumeCreate(title="Test Resume", content="Sample content")
+    resume = await repo.create(resume_in, user_id=1)
+
+    updated = await repo.update(resume.id, ResumeUpdate(title="New title"))
+    assert updated.title == "New title"
+    assert updated.content == "Sample content"
+
+    updated = await repo.update(resume.id, ResumeUpdate())
+    assert updated.title == "New title"
+
+    not_owned = await repo.update(
+        resume.id, ResumeUpdate(content="Hijacked"), owner_id=2
+    )
+    assert not_owned is None
+    assert await repo.update(resume.id, ResumeUpdate(), owner_id=2) is None
+
+    fetched = await repo.get_by_id(resume.id)
+    assert fetched.content == "Sample content"
+
+
 @pytest.mark.asyncio
 async def test_resume_repository_delete(async_session):
     repo = ResumeRepository(async_session)
@@ -96,3 +123,102 @@ async def test_resume_history_repository_get_max_version_empty(async_session):
 
     max_version = await history_repo.get_max_version(resume_id=999)
     assert max_version == 0
+
+
+@pytest.mark.asyncio
+async def test_resume_history_version_is_unique_per_resume(async_session):
+    resume_repo = ResumeRepository(async_session)
+    history_repo = ResumeHistoryRepository(async_session)
+
+    resume_in = ResumeCreate(title="Test Resume", content="Sample content")
+    resume = await resume_repo.create(resume_in, user_id=1)
+    await history_repo.create(resume.id, "Version 1 content", 1)
+
+    with pytest.raises(IntegrityError):
+        await history_repo.create(resume.id, "Duplicate content", 1)
+    await async_session.rollback()
+
+
+@pytest.mark.asyncio
+async def test_resume_history_delta_storage(async_session, monkeypatch):
+    monkeypatch.setattr(settings, "HISTORY_KEYFRAME_INTERVAL", 4)
+    resume_repo = ResumeRepository(async_session)
+    history_repo = ResumeHistoryRepository(async_session)
+    resume = await resume_repo.create(
+        ResumeCreate(title="Test Resume", content="Sample"), user_id=1
+    )
+
+    contents = []
+    text = "Experienced developer\n" * 50
+    for version in range(1, 11):
+        text += f"Version {version} line\n"
+        contents.append(text)
+        created = await history_repo.create(resume.id, text, version)
+        assert created.content == text
+    await async_session.commit()
+    async_session.expunge_all()
+
+    rows = (await async_session.execute(
+        select(ResumeHistory.version, ResumeHistory.is_delta)
+        .where(ResumeHistory.resume_id == resume.id)
+        .order_by(ResumeHistory.version)
+    )).all()
+    keyframes = [version for version, is_delta in rows if not is_delta]
+    assert keyframes == [1, 5, 9]
+
+    histories = await history_repo.list_by_resume(resume.id)
+    assert [h.content for h in histories] == contents
+
+    page = await history_repo.list_by_resume(
+        resume.id, after_version=6, limit=2
+    )
+    assert [h.version for h in page] == [7, 8]
+    assert [h.content for h in page] == contents[6:8]
+    assert not async_session.dirty
+
+
+@pytest.mark.asyncio
+async def test_resume_content_is_stored_compressed(async_session):
+    content = "Built and shipped backend services.\n" * 200
+    repo = ResumeRepository(async_session)
+    resume = await repo.create(
+        ResumeCreate(title="Big", content=content), user_id=1
+    )
+    resume_id = resume.id
+    await ResumeHistoryRepository(async_session).create(resume_id, content, 1)
+
+    stored = (await async_session.execute(
+        text(
+            "SELECT content FROM content_blobs "
+            "JOIN resumes ON resumes.content_id = content_blobs.id "
+            "WHERE resumes.id = :id"
+        ), {"id": resume_id}
+    )).scalar_one()
+    assert stored[0] == 1
+    assert len(stored) < len(content) // 10
+
+    async_session.expire_all()
+    fetched = await repo.get_by_id(resume_id)
+    histories = await ResumeHistoryRepository(async_session).list_by_resume(
+        resume_id
+    )
+    assert fetched.content == content
+    assert histories[0].content == content
+
+
+@pytest.mark.asyncio
+async def test_resume_content_is_loaded_only_on_request(async_session):
+    repo = ResumeRepository(async_session)
+    resume = await repo.create(
+        ResumeCreate(title="Resume", content="Sample content"), user_id=1
+    )
+    resume_id = resume.id
+    async_session.expire_all()
+
+    bare = await repo.get_by_id(resume_id, with_content=False)
+    assert "content" not in bare.__dict__
+    with pytest.raises(InvalidRequestError):
+        bare.content
+
+    async_session.expire_all()
+    assert (await repo.get_by_id(resume_id)).content == "Sample content"
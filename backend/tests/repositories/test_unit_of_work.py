@@ -0,0 +1,58 @@
+import pytest
+from sqlalchemy import event
+
+from app.models.user import User
+from app.repositories.unit_of_work import UnitOfWork
+from app.schemas.resume import ResumeCreate, ResumeImprove
+from app.services.resume_service import ResumeService
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_commits_on_success(async_session):
+    async with UnitOfWork(async_session) as uow:
+        resume = await uow.resumes.create(
+            ResumeCreate(title="Test", content="Content"), user_id=1
+        )
+        assert async_session.in_transaction()
+
+    assert not async_session.in_transaction()
+    assert await uow.resumes.get_by_id(resume.id) is not None
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rolls_back_on_error(async_session):
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(async_session) as uow:
+            resume = await uow.resumes.create(
+                ResumeCreate(title="Test", content="Content"), user_id=1
+            )
+            resume_id = resume.id
+            raise RuntimeError("boom")
+
+    assert await uow.resumes.get_by_id(resume_id) is None
+
+
+@pytest.mark.asyncio
+async def test_improve_resume_commits_once(async_session):
+    user = User(email="test@example.com", hashed_password="test")
+    async_session.add(user)
+    await async_session.commit()
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Test", content="Content"), async_session, user.id
+    )
+
+    commits = []
+
+    def listener(conn):
+        commits.append(conn)
+
+    sync_engine = async_session.bind.sync_engine
+    event.listen(sync_engine, "commit", listener)
+    try:
+        await ResumeService.improve_resume(
+            resume.id, ResumeImprove(content="Improved"), async_session, user
+        )
+    finally:
+        event.remove(sync_engine, "commit", listener)
+
+    assert len(commits) == 1
@@ -0,0 +1,30 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+
+
+@pytest.mark.asyncio
+async def test_internal_metrics_disabled_by_default(client: AsyncClient):
+    response = await client.get("/internal/metrics")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_internal_metrics(client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(settings, "INTERNAL_METRICS_ENABLED", True)
+    response = await client.get("/internal/metrics")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert "pool" in body["db_pool"]
+    assert body["password_hasher"]["pending"] == 0
+    assert "hit_rate" in body["token_cache"]
+    assert "evictions" in body["principal_cache"]
+    assert "hit_rate" in body["diff_cache"]
+    assert body["improve_jobs"]["pending"] == 0
+    assert "shared_hits" in body["improve_cache"]
+    assert body["improve_coalescing"]["in_flight"] == 0
+    assert "avg_batch_size" in body["improve_batching"]
+    assert body["improve_engine"]["breaker"]["state"] == "closed"
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy import select
@@ -5,9 +7,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Resume
 from app.models.user import User
+from app.core.config import settings
 from app.schemas.resume import ResumeCreate
 from app.core.security import create_jwt
-from app.services.resume_service import ResumeService
+from app.core.batching import MicroBatcher
+from app.services import resume_service
+from app.services.resume_service import ResumeService, improve_jobs
 
 
 @pytest.fixture
@@ -183,3 +188,371 @@ async def test_get_resume_history(
     response = await client.get("/resumes/999/history", headers=headers)
     assert response.status_code == 404
     assert response.json()["detail"] == "Resume not found"
+
+
+@pytest.mark.asyncio
+async def test_get_resumes_pagination(
+    client: AsyncClient, async_session: AsyncSession, auth_header
+):
+    headers, user = auth_header
+    for i in range(3):
+        await ResumeService.create_resume(
+            ResumeCreate(title=f"Resume {i}", content="Content"),
+            async_session, user.id
+        )
+
+    response = await client.get(
+        "/resumes/", params={"limit": 2}, headers=headers
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = await client.get(
+        "/resumes/", params={"limit": 2, "cursor": cursor}, headers=headers
+    )
+    assert response.status_code == 200
+    assert [r["title"] for r in response.json()] == ["Resume 2"]
+    assert "X-Next-Cursor" not in response.headers
+
+    response = await client.get(
+        "/resumes/", params={"limit": 0}, headers=headers
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_resumes_default_limit(
+    client: AsyncClient, async_session: AsyncSession, auth_header,
+    monkeypatch
+):
+    headers, user = auth_header
+    for i in range(3):
+        await ResumeService.create_resume(
+            ResumeCreate(title=f"Resume {i}", content="Content"),
+            async_session, user.id
+        )
+
+    response = await client.get("/resumes/", headers=headers)
+    assert len(response.json()) == 3
+    assert "X-Next-Cursor" not in response.headers
+
+    monkeypatch.setattr(settings, "PAGINATION_DEFAULT_LIMIT", 2)
+    response = await client.get("/resumes/", headers=headers)
+    assert len(response.json()) == 2
+    assert "X-Next-Cursor" in response.headers
+
+
+@pytest.mark.asyncio
+async def test_export_resumes(
+    client: AsyncClient, async_session: AsyncSession, auth_header,
+    monkeypatch
+):
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    headers, user = auth_header
+    other = User(email="other@example.com", hashed_password="hashed")
+    async_session.add(other)
+    await async_session.commit()
+
+    content = "Experienced developer\n" * 50
+    first = await ResumeService.create_resume(
+        ResumeCreate(title="First", content=content), async_session, user.id
+    )
+    await ResumeService.create_resume(
+        ResumeCreate(title="Second", content="Short"), async_session, user.id
+    )
+    await ResumeService.create_resume(
+        ResumeCreate(title="Other", content="Hidden"), async_session, other.id
+    )
+    improved = []
+    for i in range(3):
+        content += f"Line {i}\n"
+        response = await client.post(
+            f"/resumes/{first.id}/improve", json={"content": content},
+            headers=headers
+        )
+        improved.append(response.json()["content"])
+
+    response = await client.get("/resumes/export", headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    records = [json.loads(line) for line in response.text.splitlines()]
+    resumes = [r for r in records if r["type"] == "resume"]
+    histories = [r for r in records if r["type"] == "history"]
+    assert [r["title"] for r in resumes] == ["First", "Second"]
+    assert resumes[0]["content"] == improved[-1]
+    assert [h["version"] for h in histories] == [1, 2, 3]
+    assert [h["content"] for h in histories] == improved
+    assert all(h["resume_id"] == first.id for h in histories)
+
+    response = await client.get("/resumes/export")
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_import_resumes_csv(
+    client: AsyncClient, async_session: AsyncSession, auth_header
+):
+    headers, user = auth_header
+    body = 'title,content\nFirst,"Line 1\nLine 2"\nSecond\n'
+
+    response = await client.post(
+        "/resumes/import", content=body.encode(),
+        headers={**headers, "Content-Type": "text/csv"}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "created": 1,
+        "errors": [{"row": 2, "detail": "Expected 2 fields, got 1"}],
+    }
+    response = await client.get("/resumes/", headers=headers)
+    assert [(r["title"], r["content"]) for r in response.json()] == [
+        ("First", "Line 1\nLine 2")
+    ]
+
+    response = await client.post(
+        "/resumes/import", content=b"<resumes/>",
+        headers={**headers, "Content-Type": "application/xml"}
+    )
+    assert response.status_code == 415
+
+
+@pytest.mark.asyncio
+async def test_search_resumes(
+    client: AsyncClient, async_session: AsyncSession, auth_header
+):
+    headers, user = auth_header
+    await client.post(
+        "/resumes/import",
+        content=b'{"title": "Backend", "content": "FastAPI and Postgres"}\n',
+        headers={**headers, "Content-Type": "application/x-ndjson"}
+    )
+
+    response = await client.get(
+        "/resumes/search", params={"q": "postgres"}, headers=headers
+    )
+
+    assert response.status_code == 200
+    [result] = response.json()
+    assert result["title"] == "Backend"
+    assert result["highlight"] == "FastAPI and <mark>Postgres</mark>"
+
+    response = await client.get("/resumes/search", headers=headers)
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_find_similar_resumes(
+    client: AsyncClient, async_session: AsyncSession, auth_header
+):
+    headers, user = auth_header
+    content = "Python backend developer building APIs. " * 20
+    first = await ResumeService.create_resume(
+        ResumeCreate(title="First", content=content), async_session, user.id
+    )
+    second = await ResumeService.create_resume(
+        ResumeCreate(title="Second", content=content), async_session, user.id
+    )
+
+    response = await client.get(
+        f"/resumes/{first.id}/similar", headers=headers
+    )
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"id": second.id, "title": "Second", "similarity": 1.0}
+    ]
+
+    response = await client.get(
+        f"/resumes/{first.id}/similar", params={"threshold": 2},
+        headers=headers
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_diff_resume_versions(
+    client: AsyncClient, async_session: AsyncSession, auth_header
+):
+    headers, user = auth_header
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Resume", content="v0"), async_session, user.id
+    )
+    for content in ("Python\nSQL", "Python\nGo"):
+        await client.post(
+            f"/resumes/{resume.id}/improve", json={"content": content},
+            headers=headers
+        )
+
+    response = await client.get(
+        f"/resumes/{resume.id}/diff", params={"from": 1, "to": 2},
+        headers=headers
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "resume_id": resume.id,
+        "from_version": 1,
+        "to_version": 2,
+        "granularity": "line",
+        "ops": [
+            {"op": "equal", "text": "Python\n"},
+            {"op": "delete", "text": "SQL [Improved]"},
+            {"op": "insert", "text": "Go [Improved]"},
+        ],
+    }
+
+    response = await client.get(
+        f"/resumes/{resume.id}/diff",
+        params={"from": 1, "to": 2, "granularity": "char"}, headers=headers
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_improve_job(
+    client: AsyncClient, async_session: AsyncSession, auth_header
+):
+    headers, user = auth_header
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Resume", content="Old"), async_session, user.id
+    )
+
+    response = await client.post(
+        f"/resumes/{resume.id}/improve/jobs", json={"content": "New"},
+        headers=headers
+    )
+
+    assert response.status_code == 202
+    job = response.json()
+    location = response.headers["Location"]
+    assert location == f"/resumes/{resume.id}/improve/jobs/{job['id']}"
+
+    await improve_jobs.join()
+    response = await client.get(location, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["status"] == "succeeded"
+
+    response = await client.get(f"{location}/result", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == {"content": "New [Improved]"}
+
+
+@pytest.mark.asyncio
+async def test_stream_improve_resume(
+    client: AsyncClient, async_session: AsyncSession, auth_header
+):
+    headers, user = auth_header
+    other = User(email="other@example.com", hashed_password="hashed")
+    async_session.add(other)
+    await async_session.commit()
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Resume", content="Old"), async_session, user.id
+    )
+    foreign = await ResumeService.create_resume(
+        ResumeCreate(title="Other", content="Other"), async_session, other.id
+    )
+
+    response = await client.post(
+        f"/resumes/{resume.id}/improve/stream",
+        json={"content": "Line 1\nLine 2"}, headers=headers
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    events = [
+        (
+            block.split("\n")[0].removeprefix("event: "),
+            json.loads(block.split("\n")[1].removeprefix("data: ")),
+        )
+        for block in response.text.strip().split("\n\n")
+    ]
+    assert events == [
+        ("delta", {"content": "Line 1\n"}),
+        ("delta", {"content": "Line 2"}),
+        ("delta", {"content": " [Improved]"}),
+        ("done", {"version": 1}),
+    ]
+
+    response = await client.get(
+        f"/resumes/{resume.id}/history", headers=headers
+    )
+    assert [h["content"] for h in response.json()] == [
+        "Line 1\nLine 2 [Improved]"
+    ]
+
+    response = await client.post(
+        f"/resumes/{foreign.id}/improve/stream", json={"content": "x"},
+        headers=headers
+    )
+    assert response.status_code == 403
+
+    response = await client.post(
+        "/resumes/999/improve/stream", json={"content": "x"},
+        headers=headers
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_improve_resumes_batch(
+    client: AsyncClient, async_session: AsyncSession, auth_header,
+    monkeypatch
+):
+    batcher = MicroBatcher(
+        resume_service._improve_batch, max_size=2, max_wait=0.01
+    )
+    monkeypatch.setattr(resume_service, "improve_batcher", batcher)
+    headers, user = auth_header
+    other = User(email="other@example.com", hashed_password="hashed")
+    async_session.add(other)
+    await async_session.commit()
+    first = await ResumeService.create_resume(
+        ResumeCreate(title="First", content="First"), async_session, user.id
+    )
+    second = await ResumeService.create_resume(
+        ResumeCreate(title="Second", content="Second"), async_session,
+        user.id
+    )
+    foreign = await ResumeService.create_resume(
+        ResumeCreate(title="Other", content="Other"), async_session, other.id
+    )
+
+    response = await client.post("/resumes/improve/batch", json={"items": [
+        {"resume_id": first.id, "content": "Edited"},
+        {"resume_id": second.id},
+        {"resume_id": foreign.id},
+        {"resume_id": first.id, "content": "Again"},
+        {"resume_id": 999},
+    ]}, headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    results = sorted(
+        (json.loads(line) for line in response.text.splitlines()),
+        key=lambda result: result["index"]
+    )
+    assert results == [
+        {"index": 0, "resume_id": first.id, "version": 1,
+         "content": "Edited [Improved]"},
+        {"index": 1, "resume_id": second.id, "version": 1,
+         "content": "Second [Improved]"},
+        {"index": 2, "resume_id": foreign.id,
+         "error": "Not allowed to improve this resume"},
+        {"index": 3, "resume_id": first.id, "version": 2,
+         "content": "Again [Improved]"},
+        {"index": 4, "resume_id": 999, "error": "Resume not found"},
+    ]
+    assert batcher.batches == 2
+    assert batcher.items == 3
+
+    response = await client.get(f"/resumes/{first.id}", headers=headers)
+    assert response.json()["content"] == "Again [Improved]"
+
+    response = await client.post(
+        "/resumes/improve/batch", json={"items": []}, headers=headers
+    )
+    assert response.status_code == 422
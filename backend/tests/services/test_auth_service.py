@@ -2,6 +2,7 @@ import pytest
 from fastapi import HTTPException
 from pydantic.v1 import EmailStr
 
+from app.core.security import decode_jwt
 from app.schemas.user import UserCreate, UserLogin
 from app.services.auth_service import AuthService
 
@@ -18,6 +19,7 @@ async def test_auth_service_register_success(async_session):
     assert result.access_token is not None
     assert result.token_type == "bearer"
     assert result.expires_in is not None
+    assert decode_jwt(result.access_token)["uid"] == result.user.id
 
 
 @pytest.mark.asyncio
@@ -1,8 +1,39 @@
+import asyncio
+import json
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import (
+    create_async_engine, async_sessionmaker, AsyncSession,
+)
+
+from app.core import improver
+from app.core.config import settings
+from app.models import Resume, ResumeHistory
+from app.models.base import Base
 from app.models.user import User
-from app.schemas.resume import ResumeCreate, ResumeUpdate, ResumeImprove
-from app.services.resume_service import ResumeService
+from app.schemas.resume import (
+    ImproveJobResponse, ResumeBatchImprove, ResumeCreate, ResumeUpdate,
+    ResumeImprove,
+)
+from app.services import resume_service
+from app.services.improve_cache import ImproveCache
+from app.services.job_store import DatabaseJobStore, InMemoryJobStore
+from app.services.resume_service import (
+    ResumeService, improve_flights, improve_jobs,
+)
+
+
+class RecordingEngine(improver.LocalEngine):
+    def __init__(self):
+        self.calls = []
+
+    async def improve(self, content):
+        self.calls.append(content)
+        return await super().improve(content)
 
 
 async def create_user(async_session, email="test@example.com") -> User:
@@ -35,8 +66,9 @@ async def test_get_resumes_success_and_not_found(async_session):
     await async_session.refresh(user)
 
     resumes = await ResumeService.get_resumes(user.email, async_session)
-    assert len(resumes) == 1
-    assert resumes[0].title == "Test Resume"
+    assert len(resumes.items) == 1
+    assert resumes.items[0].title == "Test Resume"
+    assert resumes.next_cursor is None
 
     with pytest.raises(HTTPException) as exc:
         await ResumeService.get_resumes(
@@ -88,10 +120,14 @@ async def test_update_resume_success_and_errors(async_session):
 
     with pytest.raises(HTTPException) as exc:
         await ResumeService.update_resume(
-            resume.id, update_data, async_session, other_user
+            resume.id, ResumeUpdate(content="Hijacked"), async_session,
+            other_user
         )
     assert exc.value.status_code == 403
 
+    fetched = await ResumeService.get_resume(resume.id, user, async_session)
+    assert fetched.content == "Updated content"
+
 
 @pytest.mark.asyncio
 async def test_delete_resume_success_and_errors(async_session):
@@ -115,6 +151,25 @@ async def test_delete_resume_success_and_errors(async_session):
     assert exc.value.status_code == 403
 
 
+@pytest.mark.asyncio
+async def test_delete_resume_reads_row_once_without_content(async_session):
+    user = await create_user(async_session)
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Test", content="Content"), async_session, user.id
+    )
+    async_session.expunge_all()
+
+    with capture_queries(async_session) as log:
+        await ResumeService.delete_resume(resume.id, async_session, user)
+
+    reads = [
+        s for s in log.statements
+        if s.startswith("SELECT") and "FROM resumes" in s
+    ]
+    assert len(reads) == 1
+    assert "content_blobs" not in reads[0]
+
+
 @pytest.mark.asyncio
 async def test_improve_resume_success_and_errors(async_session):
     user = await create_user(async_session)
@@ -155,7 +210,7 @@ async def test_get_resume_history_success_and_not_found(async_session):
     histories = await ResumeService.get_resume_history(
         resume.id, user, async_session
     )
-    assert histories == []
+    assert histories.items == []
 
     improve_data = ResumeImprove(content="Improved content")
     await ResumeService.improve_resume(
@@ -165,10 +220,790 @@ async def test_get_resume_history_success_and_not_found(async_session):
     histories = await ResumeService.get_resume_history(
         resume.id, user, async_session
     )
-    assert len(histories) == 1
-    assert histories[0].content == "Improved content [Improved]"
+    assert len(histories.items) == 1
+    assert histories.items[0].content == "Improved content [Improved]"
 
     with pytest.raises(HTTPException) as exc:
         await ResumeService.get_resume_history(999, user, async_session)
     assert exc.value.status_code == 404
     assert exc.value.detail == "Resume not found"
+
+
+class QueryLog:
+    def __init__(self):
+        self.statements = []
+        self.loaded_bytes = 0
+
+    def before_cursor_execute(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def on_load(self, target, context):
+        self.loaded_bytes += len(target.__dict__.get("content") or "")
+
+
+@contextmanager
+def capture_queries(async_session):
+    log = QueryLog()
+    sync_engine = async_session.bind.sync_engine
+    event.listen(
+        sync_engine, "before_cursor_execute", log.before_cursor_execute
+    )
+    event.listen(Base, "load", log.on_load, propagate=True)
+    try:
+        yield log
+    finally:
+        event.remove(
+            sync_engine, "before_cursor_execute", log.before_cursor_execute
+        )
+        event.remove(Base, "load", log.on_load)
+
+
+@pytest.mark.asyncio
+async def test_reads_load_only_requested_relationships(async_session):
+    user = await create_user(async_session)
+    content = "x" * 10_000
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Big", content=content), async_session, user.id
+    )
+    for _ in range(5):
+        await ResumeService.improve_resume(
+            resume.id, ResumeImprove(content=content), async_session, user
+        )
+    async_session.expunge_all()
+
+    with capture_queries(async_session) as log:
+        fetched = await ResumeService.get_resume(
+            resume.id, user, async_session
+        )
+    assert len(log.statements) == 1
+    assert "resume_history" not in log.statements[0]
+    assert log.loaded_bytes == len(fetched.content)
+    async_session.expunge_all()
+
+    with capture_queries(async_session) as log:
+        resumes = await ResumeService.get_resumes(user.email, async_session)
+    assert len(resumes.items) == 1
+    assert len(log.statements) == 2
+    assert not any("resume_history" in s for s in log.statements)
+    assert log.loaded_bytes == len(resumes.items[0].content)
+    async_session.expunge_all()
+
+    with capture_queries(async_session) as log:
+        histories = await ResumeService.get_resume_history(
+            resume.id, user, async_session
+        )
+    assert len(histories.items) == 5
+    assert len(log.statements) == 2
+    assert not any("users" in s for s in log.statements)
+    assert "content" not in log.statements[0]
+    assert log.loaded_bytes < sum(len(h.content) for h in histories.items)
+
+
+@pytest.mark.asyncio
+async def test_get_resumes_keyset_pagination(async_session):
+    user = await create_user(async_session)
+    other_user = await create_user(async_session, email="other@example.com")
+    created = []
+    for i in range(5):
+        resume = await ResumeService.create_resume(
+            ResumeCreate(title=f"Resume {i}", content="Content"),
+            async_session, user.id
+        )
+        created.append(resume.id)
+    await ResumeService.create_resume(
+        ResumeCreate(title="Other", content="Content"),
+        async_session, other_user.id
+    )
+
+    seen = []
+    cursor = None
+    while True:
+        page = await ResumeService.get_resumes(
+            user.email, async_session, limit=2, cursor=cursor
+        )
+        assert len(page.items) <= 2
+        seen.extend(resume.id for resume in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == created
+
+    with pytest.raises(HTTPException) as exc:
+        await ResumeService.get_resumes(
+            user.email, async_session, cursor="not-a-cursor"
+        )
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_resume_history_keyset_pagination(async_session):
+    user = await create_user(async_session)
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Test", content="Content"), async_session, user.id
+    )
+    for i in range(5):
+        await ResumeService.improve_resume(
+            resume.id, ResumeImprove(content=f"Version {i + 1}"),
+            async_session, user
+        )
+
+    first = await ResumeService.get_resume_history(
+        resume.id, user, async_session, limit=3
+    )
+    assert [h.version for h in first.items] == [1, 2, 3]
+    assert first.next_cursor is not None
+
+    second = await ResumeService.get_resume_history(
+        resume.id, user, async_session, limit=3, cursor=first.next_cursor
+    )
+    assert [h.version for h in second.items] == [4, 5]
+    assert second.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_update_resume_title_skips_similarity_index(async_session):
+    user = await create_user(async_session)
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Test", content="Content"), async_session, user.id
+    )
+    async_session.expunge_all()
+
+    with capture_queries(async_session) as log:
+        updated = await ResumeService.update_resume(
+            resume.id, ResumeUpdate(title="New title"), async_session, user
+        )
+
+    assert updated.title == "New title"
+    assert updated.content == "Content"
+    assert len(log.statements) == 3
+    assert log.statements[0].startswith("UPDATE resumes")
+    assert "RETURNING" in log.statements[0]
+    assert all("resume_search" in s for s in log.statements[1:])
+
+
+@pytest.mark.asyncio
+async def test_update_resume_content_single_resume_statement(async_session):
+    user = await create_user(async_session)
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Test", content="Content"), async_session, user.id
+    )
+    async_session.expunge_all()
+
+    with capture_queries(async_session) as log:
+        updated = await ResumeService.update_resume(
+            resume.id, ResumeUpdate(content="New content"), async_session,
+            user
+        )
+
+    assert updated.title == "Test"
+    assert updated.content == "New content"
+    resume_writes = [
+        s for s in log.statements if s.startswith("UPDATE resumes")
+    ]
+    assert len(resume_writes) == 1
+    assert "RETURNING" in resume_writes[0]
+    blob_tables = ("content_blobs", "resume_search", "resume_signatures",
+                   "resume_lsh_buckets")
+    assert all(
+        any(table in s for table in blob_tables)
+        for s in log.statements if s not in resume_writes
+    )
+
+
+@pytest.mark.asyncio
+async def test_improve_moves_version_and_content_in_one_update(
+    async_session
+):
+    user = await create_user(async_session)
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Test", content="Content"), async_session, user.id
+    )
+
+    with capture_queries(async_session) as log:
+        await ResumeService.improve_resume(
+            resume.id, ResumeImprove(content="New"), async_session, user
+        )
+
+    resume_writes = [
+        s for s in log.statements if s.startswith("UPDATE resumes")
+    ]
+    assert len(resume_writes) == 1
+    assert "content_id" in resume_writes[0]
+    assert "current_version" in resume_writes[0]
+    fetched = await ResumeService.get_resume(resume.id, user, async_session)
+    assert fetched.content == "New [Improved]"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_improves_get_unique_gap_free_versions(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'concurrency.db'}",
+        connect_args={"timeout": 30},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(
+        bind=engine, expire_on_commit=False, class_=AsyncSession
+    )
+
+    try:
+        async with sessions() as db:
+            user = await create_user(db)
+            resume = await ResumeService.create_resume(
+                ResumeCreate(title="Test", content="Content"), db, user.id
+            )
+
+        async def improve(i: int) -> int:
+            async with sessions() as db:
+                await ResumeService.improve_resume(
+                    resume.id, ResumeImprove(content=f"Content {i}"), db, user
+                )
+            return i
+
+        await asyncio.gather(*(improve(i) for i in range(20)))
+
+        async with sessions() as db:
+            versions = (await db.execute(
+                select(ResumeHistory.version)
+                .where(ResumeHistory.resume_id == resume.id)
+                .order_by(ResumeHistory.version)
+            )).scalars().all()
+            current_version = (await db.execute(
+                select(Resume.current_version).where(Resume.id == resume.id)
+            )).scalar_one()
+    finally:
+        await engine.dispose()
+
+    assert versions == list(range(1, 21))
+    assert current_version == 20
+
+
+async def ndjson_chunks(lines):
+    for line in lines:
+        yield (line + "\n").encode()
+
+
+@pytest.mark.asyncio
+async def test_import_resumes_in_batches(async_session, monkeypatch):
+    monkeypatch.setattr(settings, "IMPORT_BATCH_SIZE", 2)
+    user = await create_user(async_session)
+    lines = [
+        json.dumps({"title": f"Resume {i}", "content": "Same content"})
+        for i in range(5)
+    ]
+    lines.insert(2, '{"title": "Missing content"}')
+    lines.append("broken")
+
+    with capture_queries(async_session) as log:
+        result = await ResumeService.import_resumes(
+            ndjson_chunks(lines), "application/x-ndjson", async_session,
+            user.id
+        )
+
+    assert result.created == 5
+    assert [(e.row, e.detail) for e in result.errors] == [
+        (3, "content: Field required"),
+        (7, "Invalid JSON: Expecting value"),
+    ]
+    inserts = [s for s in log.statements if s.startswith("INSERT INTO resumes")]
+    assert len(inserts) == 3
+
+    resumes = (await async_session.execute(
+        select(Resume).where(Resume.user_id == user.id).order_by(Resume.id)
+    )).scalars().all()
+    assert [r.title for r in resumes] == [f"Resume {i}" for i in range(5)]
+    assert len({r.content_id for r in resumes}) == 1
+
+    with pytest.raises(HTTPException) as exc:
+        await ResumeService.import_resumes(
+            ndjson_chunks(lines), "application/xml", async_session, user.id
+        )
+    assert exc.value.status_code == 415
+
+
+@pytest.mark.asyncio
+async def test_import_resumes_limits(async_session, monkeypatch):
+    monkeypatch.setattr(settings, "IMPORT_MAX_ERRORS", 2)
+    user = await create_user(async_session)
+    lines = ["broken"] * 3 + ['{"title": "Late", "content": "x"}']
+
+    with pytest.raises(HTTPException) as exc:
+        await ResumeService.import_resumes(
+            ndjson_chunks(lines), "application/x-ndjson", async_session,
+            user.id
+        )
+    assert exc.value.status_code == 422
+    assert exc.value.detail.startswith("Import stopped at row 3")
+
+    monkeypatch.setattr(settings, "IMPORT_MAX_LINE_BYTES", 100)
+    lines = [json.dumps({"title": "Long", "content": "x" * 200})]
+    with pytest.raises(HTTPException) as exc:
+        await ResumeService.import_resumes(
+            ndjson_chunks(lines), "application/x-ndjson", async_session,
+            user.id
+        )
+    assert exc.value.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_search_resumes_ranked_and_kept_in_sync(async_session):
+    user = await create_user(async_session)
+    other_user = await create_user(async_session, email="other@example.com")
+    title_match = await ResumeService.create_resume(
+        ResumeCreate(title="Python developer", content="Builds services"),
+        async_session, user.id
+    )
+    content_match = await ResumeService.create_resume(
+        ResumeCreate(title="Engineer", content="Some Python scripting"),
+        async_session, user.id
+    )
+    unrelated = await ResumeService.create_resume(
+        ResumeCreate(title="Designer", content="Figma"),
+        async_session, user.id
+    )
+    await ResumeService.create_resume(
+        ResumeCreate(title="Python", content="Python"),
+        async_session, other_user.id
+    )
+
+    page = await ResumeService.search_resumes(user.id, "python", async_session)
+    assert [r.id for r in page.items] == [title_match.id, content_match.id]
+    assert page.items[0].score > page.items[1].score
+    assert page.items[1].highlight == "Some <mark>Python</mark> scripting"
+
+    first = await ResumeService.search_resumes(
+        user.id, "python", async_session, limit=1
+    )
+    second = await ResumeService.search_resumes(
+        user.id, "python", async_session, limit=1, cursor=first.next_cursor
+    )
+    assert [r.id for r in first.items + second.items] == [
+        title_match.id, content_match.id
+    ]
+    assert second.next_cursor is None
+
+    await ResumeService.update_resume(
+        unrelated.id, ResumeUpdate(title="Python designer"), async_session,
+        user
+    )
+    await ResumeService.improve_resume(
+        content_match.id, ResumeImprove(content="Rust only"), async_session,
+        user
+    )
+    await ResumeService.delete_resume(title_match.id, async_session, user)
+
+    page = await ResumeService.search_resumes(user.id, "python", async_session)
+    assert [r.id for r in page.items] == [unrelated.id]
+    page = await ResumeService.search_resumes(user.id, "rust", async_session)
+    assert [r.id for r in page.items] == [content_match.id]
+    page = await ResumeService.search_resumes(user.id, "?!", async_session)
+    assert page.items == []
+
+
+@pytest.mark.asyncio
+async def test_find_similar_resumes(async_session):
+    user = await create_user(async_session)
+    other_user = await create_user(async_session, email="other@example.com")
+    base = " ".join(
+        f"Built service {i} with Python and Postgres." for i in range(50)
+    )
+    original = await ResumeService.create_resume(
+        ResumeCreate(title="Original", content=base), async_session, user.id
+    )
+    copy = await ResumeService.create_resume(
+        ResumeCreate(title="Copy", content=base + " Mentors juniors."),
+        async_session, user.id
+    )
+    different = await ResumeService.create_resume(
+        ResumeCreate(title="Designer", content="Figma and branding " * 20),
+        async_session, user.id
+    )
+    await ResumeService.create_resume(
+        ResumeCreate(title="Foreign copy", content=base),
+        async_session, other_user.id
+    )
+
+    similar = await ResumeService.find_similar_resumes(
+        original.id, user, async_session
+    )
+    assert [s.id for s in similar] == [copy.id]
+    assert similar[0].similarity > 0.8
+
+    await ResumeService.update_resume(
+        different.id, ResumeUpdate(content=base), async_session, user
+    )
+    similar = await ResumeService.find_similar_resumes(
+        original.id, user, async_session
+    )
+    scores = {s.id: s.similarity for s in similar}
+    assert set(scores) == {different.id, copy.id}
+    assert scores[different.id] == 1.0
+
+    await ResumeService.delete_resume(copy.id, async_session, user)
+    similar = await ResumeService.find_similar_resumes(
+        original.id, user, async_session
+    )
+    assert [s.id for s in similar] == [different.id]
+
+    with pytest.raises(HTTPException) as exc:
+        await ResumeService.find_similar_resumes(999, user, async_session)
+    assert exc.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_find_similar_skips_resumes_without_words(async_session):
+    user = await create_user(async_session)
+    blank = await ResumeService.create_resume(
+        ResumeCreate(title="Blank", content=""), async_session, user.id
+    )
+    await ResumeService.create_resume(
+        ResumeCreate(title="Dashes", content="--- ..."),
+        async_session, user.id
+    )
+
+    similar = await ResumeService.find_similar_resumes(
+        blank.id, user, async_session, threshold=0.0
+    )
+
+    assert similar == []
+
+
+@pytest.mark.asyncio
+async def test_diff_resume_versions_cached(async_session):
+    user = await create_user(async_session)
+    other_user = await create_user(async_session, "other@example.com")
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Resume", content="v0"), async_session, user.id
+    )
+    for content in ("Led team\nBuilt APIs", "Led teams\nBuilt APIs"):
+        await ResumeService.improve_resume(
+            resume.id, ResumeImprove(content=content), async_session, user
+        )
+
+    diff = await ResumeService.diff_resume_versions(
+        resume.id, 1, 2, user, async_session, granularity="word"
+    )
+    assert [(op.op, op.text) for op in diff.ops] == [
+        ("equal", "Led "), ("delete", "team\n"), ("insert", "teams\n"),
+        ("equal", "Built APIs [Improved]"),
+    ]
+
+    with capture_queries(async_session) as log:
+        cached = await ResumeService.diff_resume_versions(
+            resume.id, 1, 2, user, async_session, granularity="word"
+        )
+    assert cached == diff
+    assert len(log.statements) == 1
+    assert "resume_history" not in log.statements[0]
+
+    with pytest.raises(HTTPException) as exc:
+        await ResumeService.diff_resume_versions(
+            resume.id, 1, 2, other_user, async_session
+        )
+    assert exc.value.status_code == 403
+
+    with pytest.raises(HTTPException) as exc:
+        await ResumeService.diff_resume_versions(
+            resume.id, 1, 3, user, async_session
+        )
+    assert exc.value.status_code == 404
+    assert exc.value.detail == "Version not found"
+
+    await ResumeService.delete_resume(resume.id, async_session, user)
+    with pytest.raises(HTTPException) as exc:
+        await ResumeService.diff_resume_versions(
+            resume.id, 1, 2, user, async_session, granularity="word"
+        )
+    assert exc.value.detail == "Resume not found"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("store", [
+    InMemoryJobStore(maxsize=10, ttl=60), DatabaseJobStore()
+])
+async def test_improve_job_runs_in_background(
+    async_session, monkeypatch, store
+):
+    monkeypatch.setattr(resume_service, "improve_job_store", store)
+    user = await create_user(async_session)
+    other_user = await create_user(async_session, "other@example.com")
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Resume", content="Old"), async_session, user.id
+    )
+
+    job = await ResumeService.submit_improve_job(
+        resume.id, ResumeImprove(content="New"), async_session, user
+    )
+    assert job.status == "queued"
+
+    await improve_jobs.join()
+    job = await ResumeService.get_improve_job(
+        resume.id, job.id, user, async_session
+    )
+    assert job.status == "succeeded"
+    assert job.version == 1
+    assert job.finished_at is not None
+    result = await ResumeService.get_improve_job_result(
+        resume.id, job.id, user, async_session
+    )
+    assert result.content == "New [Improved]"
+
+    with pytest.raises(HTTPException) as exc:
+        await ResumeService.get_improve_job(
+            resume.id, job.id, other_user, async_session
+        )
+    assert exc.value.status_code == 403
+
+    with pytest.raises(HTTPException) as exc:
+        await ResumeService.get_improve_job(
+            resume.id, "missing", user, async_session
+        )
+    assert exc.value.status_code == 404
+
+    with pytest.raises(HTTPException) as exc:
+        await ResumeService.submit_improve_job(
+            resume.id, ResumeImprove(content="New"), async_session,
+            other_user
+        )
+    assert exc.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_improve_job_failure_is_recorded(async_session, monkeypatch):
+    user = await create_user(async_session)
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Resume", content="Old"), async_session, user.id
+    )
+
+    async def fail(*args):
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    monkeypatch.setattr(resume_service, "_improve", fail)
+    job = await ResumeService.submit_improve_job(
+        resume.id, ResumeImprove(content="New"), async_session, user
+    )
+    with pytest.raises(HTTPException) as exc:
+        await ResumeService.get_improve_job_result(
+            resume.id, job.id, user, async_session
+        )
+    assert exc.value.status_code == 409
+    assert exc.value.detail == "Job is queued"
+
+    await improve_jobs.join()
+    job = await ResumeService.get_improve_job(
+        resume.id, job.id, user, async_session
+    )
+    assert job.status == "failed"
+    assert job.error == "Resume not found"
+    with pytest.raises(HTTPException) as exc:
+        await ResumeService.get_improve_job_result(
+            resume.id, job.id, user, async_session
+        )
+    assert exc.value.detail == "Resume not found"
+
+
+@pytest.mark.asyncio
+async def test_improve_checks_owner_before_engine(async_session, monkeypatch):
+    cache = ImproveCache(maxsize=10, ttl=60)
+    monkeypatch.setattr(resume_service, "improve_cache", cache)
+    engine = RecordingEngine()
+    monkeypatch.setattr(improver, "improve_engine", improver.guarded(engine))
+    user = await create_user(async_session)
+    other_user = await create_user(async_session, email="other@example.com")
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Resume", content="Old"), async_session, user.id
+    )
+
+    for resume_id, status_code in ((resume.id, 403), (999, 404)):
+        with pytest.raises(HTTPException) as exc:
+            await ResumeService.improve_resume(
+                resume_id, ResumeImprove(content="New"), async_session,
+                other_user
+            )
+        assert exc.value.status_code == status_code
+
+    assert engine.calls == []
+    assert cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_in_memory_job_store_keeps_unfinished_jobs():
+    store = InMemoryJobStore(maxsize=1, ttl=60)
+    jobs = [
+        ImproveJobResponse(
+            id=f"job-{i}", resume_id=1, user_id=1, status="queued",
+            created_at=datetime.now(timezone.utc),
+        )
+        for i in range(3)
+    ]
+    for job in jobs:
+        await store.create(job, None)
+    await store.update("job-0", None, status="running")
+
+    assert [(await store.get(job.id, None)).status for job in jobs] == [
+        "running", "queued", "queued"
+    ]
+
+    for job in jobs:
+        await store.update(job.id, None, status="succeeded")
+    assert await store.get("job-0", None) is None
+    assert (await store.get("job-2", None)).status == "succeeded"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache", [
+    ImproveCache(maxsize=10, ttl=60),
+    ImproveCache(maxsize=0, ttl=60, shared=True),
+])
+async def test_improve_reuses_cached_result(async_session, monkeypatch, cache):
+    monkeypatch.setattr(resume_service, "improve_cache", cache)
+    engine = RecordingEngine()
+    monkeypatch.setattr(improver, "improve_engine", improver.guarded(engine))
+    user = await create_user(async_session)
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Resume", content="Old"), async_session, user.id
+    )
+
+    for _ in range(3):
+        improved = await ResumeService.improve_resume(
+            resume.id, ResumeImprove(content="same text"), async_session, user
+        )
+        assert improved.content == "same text [Improved]"
+    assert engine.calls == ["same text"]
+
+    histories = await ResumeService.get_resume_history(
+        resume.id, user, async_session
+    )
+    assert [h.version for h in histories.items] == [1, 2, 3]
+
+    engine.version = "next"
+    await ResumeService.improve_resume(
+        resume.id, ResumeImprove(content="same text"), async_session, user
+    )
+    assert engine.calls == ["same text", "same text"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_improves_are_coalesced(
+    async_session, monkeypatch
+):
+    engine = RecordingEngine()
+    monkeypatch.setattr(improver, "improve_engine", improver.guarded(engine))
+    user = await create_user(async_session)
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Resume", content="Old"), async_session, user.id
+    )
+    coalesced = improve_flights.coalesced
+
+    results = await asyncio.gather(*(
+        ResumeService.improve_resume(
+            resume.id, ResumeImprove(content="Same"), async_session, user
+        )
+        for _ in range(5)
+    ))
+
+    assert {result.content for result in results} == {"Same [Improved]"}
+    assert engine.calls == ["Same"]
+    assert improve_flights.coalesced == coalesced + 4
+    histories = await ResumeService.get_resume_history(
+        resume.id, user, async_session
+    )
+    assert [h.version for h in histories.items] == [1]
+
+
+class BrokenStreamEngine(improver.LocalEngine):
+    async def stream(self, content):
+        yield "partial"
+        raise RuntimeError("engine went away")
+
+
+@pytest.mark.asyncio
+async def test_stream_improve_resume_failure_stores_nothing(
+    async_session, monkeypatch
+):
+    monkeypatch.setattr(
+        improver, "improve_engine", improver.guarded(BrokenStreamEngine())
+    )
+    user = await create_user(async_session)
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Resume", content="Old"), async_session, user.id
+    )
+
+    stream = await ResumeService.stream_improve_resume(
+        resume.id, ResumeImprove(content="New"), async_session, user
+    )
+    events = [event async for event in stream]
+
+    assert events == [
+        'event: delta\ndata: {"content": "partial"}\n\n',
+        'event: error\ndata: {"detail": "Improvement engine failed"}\n\n',
+    ]
+    histories = await ResumeService.get_resume_history(
+        resume.id, user, async_session
+    )
+    assert histories.items == []
+
+
+@pytest.mark.asyncio
+async def test_improve_resumes_batch_writes_in_one_transaction(
+    async_session
+):
+    user = await create_user(async_session)
+    resumes = [
+        await ResumeService.create_resume(
+            ResumeCreate(title=f"Resume {i}", content=f"Content {i}"),
+            async_session, user.id
+        )
+        for i in range(4)
+    ]
+    commits = []
+    on_commit = commits.append
+    sync_engine = async_session.bind.sync_engine
+    event.listen(sync_engine, "commit", on_commit)
+    try:
+        lines = [
+            json.loads(line)
+            async for line in ResumeService.improve_resumes_batch(
+                ResumeBatchImprove(items=[
+                    {"resume_id": resume.id} for resume in resumes
+                ]),
+                user, async_session.bind
+            )
+        ]
+    finally:
+        event.remove(sync_engine, "commit", on_commit)
+
+    assert len(commits) == 1
+    assert [line["version"] for line in lines] == [1] * 4
+    assert [line["content"] for line in lines] == [
+        f"Content {i} [Improved]" for i in range(4)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_improve_engine_failure_writes_nothing(
+    async_session, monkeypatch
+):
+    class BrokenEngine(improver.ImprovementEngine):
+        async def improve(self, content):
+            raise RuntimeError("model offline")
+
+    monkeypatch.setattr(
+        improver, "improve_engine", improver.guarded(BrokenEngine())
+    )
+    user = await create_user(async_session)
+    resume = await ResumeService.create_resume(
+        ResumeCreate(title="Resume", content="Old"), async_session, user.id
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        await ResumeService.improve_resume(
+            resume.id, ResumeImprove(content="New"), async_session, user
+        )
+
+    assert exc.value.status_code == 503
+    histories = await ResumeService.get_resume_history(
+        resume.id, user, async_session
+    )
+    assert histories.items == []
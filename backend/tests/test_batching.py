@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from app.core.batching import MicroBatcher
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_groups_by_size_and_wait():
+    batches = []
+
+    async def double(items):
+        batches.append(items)
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(double, max_size=3, max_wait=0.01)
+
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+    assert results == [0, 2, 4, 6, 8]
+    assert batches == [[0, 1, 2], [3, 4]]
+    assert batcher.stats()["avg_batch_size"] == 2.5
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_fails_the_whole_batch():
+    async def fail(items):
+        raise RuntimeError("engine down")
+
+    batcher = MicroBatcher(fail, max_size=10, max_wait=0.01)
+
+    results = await asyncio.gather(
+        batcher.submit(1), batcher.submit(2), return_exceptions=True
+    )
+
+    assert [str(result) for result in results] == ["engine down"] * 2
+    assert batcher.batches == 1
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_fails_a_short_batch():
+    async def drop_last(items):
+        return items[:-1]
+
+    batcher = MicroBatcher(drop_last, max_size=10, max_wait=0.01)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            batcher.submit(1), batcher.submit(2), return_exceptions=True
+        ),
+        timeout=1,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
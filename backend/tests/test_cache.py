@@ -0,0 +1,68 @@
+import time
+
+import pytest
+
+from app.core.cache import TTLCache
+
+
+def test_ttl_cache_hit_and_miss():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.hit_rate == 0.5
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+
+def test_ttl_cache_expires_at_absolute_time():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1, expires_at=time.time() - 1)
+    cache.set("b", 2, expires_at=time.time() + 60)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.expirations == 1
+    assert len(cache) == 1
+
+
+def test_ttl_cache_ttl_caps_expires_at():
+    cache = TTLCache(maxsize=2, ttl=-1)
+    cache.set("a", 1, expires_at=time.time() + 60)
+
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_requires_expiry_without_ttl():
+    cache = TTLCache(maxsize=2)
+
+    with pytest.raises(ValueError):
+        cache.set("a", 1)
+
+
+def test_ttl_cache_delete_and_stats():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.delete("a")
+    cache.delete("missing")
+
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert stats["size"] == 0
+    assert stats["maxsize"] == 2
+    assert stats["misses"] == 1
@@ -0,0 +1,30 @@
+import pytest
+
+from app.core.compression import compress_text, decompress_text
+
+TEXT = "Senior Python developer, built and shipped services.\n" * 100
+
+
+@pytest.mark.parametrize("codec", ["none", "zlib", "lzma"])
+@pytest.mark.parametrize("text", ["", "short", "Резюме ✓", TEXT])
+def test_compression_round_trip(codec, text):
+    assert decompress_text(compress_text(text, codec)) == text
+
+
+@pytest.mark.parametrize("codec, tag", [("zlib", 1), ("lzma", 2)])
+def test_compression_tags_large_text(codec, tag):
+    blob = compress_text(TEXT, codec, threshold=512)
+
+    assert blob[0] == tag
+    assert len(blob) < len(TEXT) // 10
+
+
+def test_compression_stores_small_text_raw():
+    blob = compress_text("short", "zlib", threshold=512)
+
+    assert blob == b"\x00short"
+
+
+def test_decompress_rejects_unknown_tag():
+    with pytest.raises(ValueError):
+        decompress_text(b"\x07data")
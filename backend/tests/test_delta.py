@@ -0,0 +1,32 @@
+import json
+
+import pytest
+
+from app.core.delta import make_delta, apply_delta
+
+
+@pytest.mark.parametrize("base, target", [
+    ("", ""),
+    ("", "new text"),
+    ("old text", ""),
+    ("aaa", "aa"),
+    ("aa", "aaa"),
+    ("line 1\nline 2\nline 3\n", "line 1\nline two\nline 3\n"),
+    ("Experienced developer", "Experienced developer [Improved]"),
+    ("first\nsecond\nthird", "zero\nfirst\nthird\nfourth"),
+])
+def test_delta_round_trip(base, target):
+    assert apply_delta(base, make_delta(base, target)) == target
+
+
+def test_delta_is_compact_for_small_edits():
+    base = "\n".join(f"Line {i}: built and shipped things" for i in range(500))
+    target = base.replace("Line 250:", "Line 250 (edited):") + " [Improved]"
+
+    delta = make_delta(base, target)
+
+    assert apply_delta(base, delta) == target
+    assert len(delta) < 200
+    assert all(
+        isinstance(op, str) or len(op) == 2 for op in json.loads(delta)
+    )
@@ -1,9 +1,15 @@
+import time
+
 import pytest
 from fastapi import HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials
 from unittest.mock import AsyncMock, MagicMock
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.dependencies import swagger_auth, get_current_user
+from app.core.security import (
+    create_jwt, decode_jwt, token_cache_key, verified_tokens,
+    principals, invalidate_principal,
+)
+from app.dependencies import swagger_auth, get_current_user, decode_token
 from app.schemas.user import UserResponse
 
 
@@ -122,3 +128,116 @@ async def test_get_current_user_user_not_found():
     assert exc.value.headers == {"WWW-Authenticate": "Bearer"}
     decode_jwt_mock.assert_called_once_with("testtoken123")
     user_repo_mock.assert_awaited_once_with(email="test@example.com")
+
+
+def test_decode_token_caches_verified_token():
+    """Тестирование кэша проверенных токенов: повторный токен не декодируется."""
+    token = create_jwt({"sub": "test@example.com"})
+    decode_jwt_mock = MagicMock(wraps=decode_jwt)
+    hits = verified_tokens.hits
+
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr("app.dependencies.decode_jwt", decode_jwt_mock)
+        first = decode_token(token)
+        second = decode_token(token)
+
+    assert first == second
+    assert first["sub"] == "test@example.com"
+    decode_jwt_mock.assert_called_once_with(token)
+    assert verified_tokens.hits == hits + 1
+
+
+def test_decode_token_expired_cache_entry_raises():
+    """Тестирование истёкшей записи кэша: токен снова проверяется и отклоняется."""
+    token = create_jwt({"sub": "test@example.com"})
+    verified_tokens.set(
+        token_cache_key(token), {"sub": "test@example.com"},
+        expires_at=time.time() - 1
+    )
+    expirations = verified_tokens.expirations
+    decode_jwt_mock = MagicMock(
+        side_effect=HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired"
+        )
+    )
+
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr("app.dependencies.decode_jwt", decode_jwt_mock)
+        with pytest.raises(HTTPException) as exc:
+            decode_token(token)
+
+    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+    assert exc.value.detail == "Token expired"
+    assert verified_tokens.expirations == expirations + 1
+
+
+def test_decode_token_invalid_token_not_cached():
+    """Тестирование некорректного токена: ошибка не попадает в кэш."""
+    with pytest.raises(HTTPException) as exc:
+        decode_token("invalid.token.string")
+
+    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+    assert exc.value.detail == "Invalid token"
+    assert len(verified_tokens) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_uses_principal_cache():
+    """Тестирование кэша пользователей: повторный запрос не обращается к базе."""
+    decode_jwt_mock = MagicMock(
+        return_value={"sub": "test@example.com", "uid": 1}
+    )
+
+    user = MagicMock()
+    user.id = 1
+    user.email = "test@example.com"
+    user_repo_mock = AsyncMock(return_value=user)
+
+    db = AsyncMock(spec=AsyncSession)
+
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr("app.dependencies.decode_jwt", decode_jwt_mock)
+        m.setattr(
+            "app.dependencies.UserRepository", MagicMock(
+                return_value=MagicMock(get_by_email=user_repo_mock)
+            )
+        )
+
+        first = await get_current_user(token="testtoken123", db=db)
+        second = await get_current_user(token="testtoken123", db=db)
+
+        invalidate_principal(1)
+        third = await get_current_user(token="testtoken123", db=db)
+
+    assert first == second == third
+    assert principals.get(1) == first
+    assert user_repo_mock.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_principal_email_mismatch():
+    """Тестирование кэша пользователей: несовпадение email ведёт к запросу в базу."""
+    principals.set(1, UserResponse(id=1, email="old@example.com"))
+    decode_jwt_mock = MagicMock(
+        return_value={"sub": "test@example.com", "uid": 1}
+    )
+
+    user = MagicMock()
+    user.id = 1
+    user.email = "test@example.com"
+    user_repo_mock = AsyncMock(return_value=user)
+
+    db = AsyncMock(spec=AsyncSession)
+
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr("app.dependencies.decode_jwt", decode_jwt_mock)
+        m.setattr(
+            "app.dependencies.UserRepository", MagicMock(
+                return_value=MagicMock(get_by_email=user_repo_mock)
+            )
+        )
+
+        result = await get_current_user(token="testtoken123", db=db)
+
+    assert result.email == "test@example.com"
+    user_repo_mock.assert_awaited_once_with(email="test@example.com")
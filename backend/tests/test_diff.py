@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from app.core.diff import diff_text, diff_tokens
+
+
+def lcs_length(a, b):
+    rows = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            rows[i + 1][j + 1] = (
+                rows[i][j] + 1 if x == y
+                else max(rows[i][j + 1], rows[i + 1][j])
+            )
+    return rows[-1][-1]
+
+
+def test_diff_tokens_is_a_shortest_edit_script():
+    rng = random.Random(1)
+    for _ in range(500):
+        a = rng.choices("abc", k=rng.randrange(20))
+        b = rng.choices("abc", k=rng.randrange(20))
+
+        ops = diff_tokens(a, b)
+
+        assert [t for op, t in ops if op != "insert"] == a
+        assert [t for op, t in ops if op != "delete"] == b
+        edits = sum(op != "equal" for op, _ in ops)
+        assert edits == len(a) + len(b) - 2 * lcs_length(a, b)
+
+
+@pytest.mark.parametrize("granularity", ["line", "word"])
+@pytest.mark.parametrize("old, new", [
+    ("", ""),
+    ("", "new text\n"),
+    ("old text\n", ""),
+    ("line 1\nline 2\nline 3\n", "line 1\nline two\nline 3\n"),
+    ("first\nsecond\nthird", "zero\nfirst\nthird\nfourth"),
+])
+def test_diff_text_round_trip(old, new, granularity):
+    ops = diff_text(old, new, granularity)
+
+    assert "".join(t for op, t in ops if op != "insert") == old
+    assert "".join(t for op, t in ops if op != "delete") == new
+    assert all(a[0] != b[0] for a, b in zip(ops, ops[1:]))
+
+
+def test_diff_text_granularity():
+    old = "Led a team of 5\nBuilt APIs\n"
+    new = "Led a team of 8\nBuilt APIs\nShipped\n"
+
+    assert diff_text(old, new, "line") == [
+        ("delete", "Led a team of 5\n"),
+        ("insert", "Led a team of 8\n"),
+        ("equal", "Built APIs\n"),
+        ("insert", "Shipped\n"),
+    ]
+    assert diff_text(old, new, "word") == [
+        ("equal", "Led a team of "),
+        ("delete", "5\n"),
+        ("insert", "8\n"),
+        ("equal", "Built APIs\n"),
+        ("insert", "Shipped\n"),
+    ]
@@ -0,0 +1,219 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.improver import (
+    GuardedEngine, ImprovementEngine, LocalEngine, RuleEngine, load_engine,
+)
+from app.core.resilience import CircuitBreaker
+
+
+class SlowEngine(ImprovementEngine):
+    name = "slow"
+
+    def __init__(self, delay=0.01, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.running = 0
+        self.peak = 0
+
+    async def improve(self, content):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("boom")
+            return content.upper()
+        finally:
+            self.running -= 1
+
+
+def guard(engine, concurrency=2, timeout=1.0, failure_threshold=2):
+    return GuardedEngine(
+        engine, concurrency=concurrency, timeout=timeout,
+        breaker=CircuitBreaker(
+            failure_threshold=failure_threshold, reset_timeout=60
+        ),
+    )
+
+
+def test_load_engine():
+    assert isinstance(load_engine("local"), LocalEngine)
+    assert isinstance(
+        load_engine("app.core.improver:LocalEngine"), LocalEngine
+    )
+    with pytest.raises(ValueError):
+        load_engine("missing")
+
+
+@pytest.mark.asyncio
+async def test_local_engine_is_deterministic():
+    engine = guard(LocalEngine())
+
+    assert await engine.improve("Text") == "Text [Improved]"
+    assert await engine.improve_many(["a", "b"]) == [
+        "a [Improved]", "b [Improved]"
+    ]
+    assert engine.version == "local/suffix-1"
+
+
+@pytest.mark.asyncio
+async def test_rule_engine():
+    engine = guard(RuleEngine({"was responsible for": "owned", "very": ""}))
+
+    assert await engine.improve(
+        "Was responsible for a very large team"
+    ) == "Owned a large team"
+    assert engine.version.startswith("rules/trie-3.")
+    assert RuleEngine({"very": ""}).version != RuleEngine({}).version
+    assert isinstance(load_engine("rules"), RuleEngine)
+
+
+@pytest.mark.asyncio
+async def test_guarded_engine_caps_concurrency():
+    slow = SlowEngine()
+    engine = guard(slow, concurrency=2)
+
+    results = await asyncio.gather(*(engine.improve("x") for _ in range(5)))
+
+    assert results == ["X"] * 5
+    assert slow.peak == 2
+    stats = engine.stats()
+    assert stats["completed"] == 5
+    assert stats["latency"]["count"] == 5
+
+
+@pytest.mark.asyncio
+async def test_guarded_engine_times_out_and_trips_breaker():
+    engine = guard(SlowEngine(delay=1), timeout=0.01)
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc:
+            await engine.improve("x")
+        assert exc.value.status_code == 503
+        assert exc.value.detail == "Improvement engine timed out"
+
+    with pytest.raises(HTTPException) as exc:
+        await engine.improve("x")
+    assert exc.value.detail == "Improvement engine is unavailable"
+    stats = engine.stats()
+    assert stats["timed_out"] == 2
+    assert stats["rejected"] == 1
+    assert stats["breaker"]["state"] == "open"
+
+
+@pytest.mark.asyncio
+async def test_guarded_engine_reports_failures():
+    engine = guard(SlowEngine(fail=True), failure_threshold=5)
+
+    with pytest.raises(HTTPException) as exc:
+        await engine.improve("x")
+
+    assert exc.value.detail == "Improvement engine failed"
+    assert engine.stats()["failed"] == 1
+    assert engine.breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_call_does_not_wedge_breaker():
+    engine = guard(SlowEngine(delay=1), failure_threshold=1)
+    engine.breaker.record_failure()
+    engine.breaker.reset_timeout = 0
+
+    task = asyncio.create_task(engine.improve("x"))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    engine.engine.delay = 0
+    assert await engine.improve("x") == "X"
+    assert engine.breaker.state == "closed"
+    assert engine.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_older_call_keeps_the_trial():
+    engine = guard(SlowEngine(delay=1), failure_threshold=1)
+    older = asyncio.create_task(engine.improve("x"))
+    await asyncio.sleep(0)
+    engine.breaker.record_failure()
+    engine.breaker.reset_timeout = 0
+    trial = asyncio.create_task(engine.improve("x"))
+    await asyncio.sleep(0)
+
+    older.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await older
+
+    with pytest.raises(HTTPException) as exc:
+        await engine.improve("x")
+    assert exc.value.detail == "Improvement engine is unavailable"
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+    assert engine.breaker.allow()
+
+
+class StallingEngine(LocalEngine):
+    async def stream(self, content):
+        yield "first"
+        await asyncio.sleep(1)
+        yield "never"
+
+
+@pytest.mark.asyncio
+async def test_engine_stream_matches_improve():
+    engine = guard(LocalEngine())
+
+    chunks = [chunk async for chunk in engine.stream("a\nb\n")]
+
+    assert chunks == ["a\n", "b\n", " [Improved]"]
+    assert "".join(chunks) == await engine.improve("a\nb\n")
+    assert engine.stats()["completed"] == 2
+
+    default = guard(SlowEngine())
+    assert [chunk async for chunk in default.stream("x")] == ["X"]
+
+
+@pytest.mark.asyncio
+async def test_guarded_engine_stream_times_out_per_chunk():
+    engine = guard(StallingEngine(), timeout=0.01)
+    chunks = []
+
+    with pytest.raises(HTTPException) as exc:
+        async for chunk in engine.stream("x"):
+            chunks.append(chunk)
+
+    assert chunks == ["first"]
+    assert exc.value.detail == "Improvement engine timed out"
+    stats = engine.stats()
+    assert stats["timed_out"] == 1
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_guarded_engine_stream_frees_slot_for_slow_reader():
+    engine = guard(LocalEngine(), concurrency=1, timeout=0.5)
+    stream = engine.stream("a\nb\n")
+
+    assert await anext(stream) == "a\n"
+    assert await engine.improve("x") == "x [Improved]"
+    assert [chunk async for chunk in stream] == ["b\n", " [Improved]"]
+
+
+@pytest.mark.asyncio
+async def test_guarded_engine_stream_disconnect_frees_trial():
+    engine = guard(StallingEngine(), failure_threshold=1)
+    engine.breaker.record_failure()
+    engine.breaker.reset_timeout = 0
+    stream = engine.stream("x")
+
+    assert await anext(stream) == "first"
+    await stream.aclose()
+
+    assert engine.stats()["in_flight"] == 0
+    assert await engine.improve("x") == "x [Improved]"
+    assert engine.breaker.state == "closed"
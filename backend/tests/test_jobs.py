@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.jobs import JobRunner
+
+
+@pytest.mark.asyncio
+async def test_job_runner_bounds_concurrency():
+    runner = JobRunner(workers=2, max_pending=10)
+    running = peak = 0
+
+    async def job():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    for _ in range(6):
+        runner.submit(job)
+    await runner.join()
+
+    assert peak == 2
+    assert runner.stats()["completed"] == 6
+    assert runner.pending == 0
+    runner.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_job_runner_rejects_when_full_and_counts_failures():
+    runner = JobRunner(workers=1, max_pending=2)
+
+    async def failing():
+        raise RuntimeError("boom")
+
+    runner.submit(failing)
+    runner.submit(failing)
+    with pytest.raises(HTTPException) as exc:
+        runner.submit(failing)
+    assert exc.value.status_code == 503
+
+    await runner.join()
+    stats = runner.stats()
+    assert stats["failed"] == 2
+    assert stats["rejected"] == 1
+    runner.submit(failing)
+    await runner.join()
+    runner.shutdown()
@@ -0,0 +1,66 @@
+import numpy as np
+
+from app.core import minhash
+
+BASE = " ".join(
+    f"Built service {i} with Python and Postgres for team {i % 7}."
+    for i in range(60)
+)
+
+
+def jaccard(first: str, second: str) -> float:
+    a, b = set(minhash.shingles(first)), set(minhash.shingles(second))
+    return len(a & b) / len(a | b)
+
+
+def test_signature_is_deterministic_and_compact():
+    signature = minhash.signature(BASE)
+
+    assert signature.dtype == np.uint32
+    assert signature.shape == (minhash.NUM_PERM,)
+    assert np.array_equal(signature, minhash.signature(BASE))
+    assert np.array_equal(
+        minhash.from_bytes(minhash.to_bytes(signature)), signature
+    )
+    assert len(minhash.band_keys(signature)) == minhash.BANDS
+
+
+def test_similarity_estimates_jaccard():
+    edited = BASE.replace("team 3", "squad 3")
+    other = " ".join(f"Designed brand {i} in Figma." for i in range(60))
+
+    estimate = minhash.similarity(
+        minhash.signature(BASE), minhash.signature(edited)
+    )
+
+    assert abs(estimate - jaccard(BASE, edited)) < 0.1
+    assert minhash.similarity(
+        minhash.signature(BASE), minhash.signature(other)
+    ) < 0.1
+
+
+def test_near_duplicates_share_a_bucket():
+    edited = BASE + " Also mentors juniors."
+
+    shared = set(minhash.band_keys(minhash.signature(BASE))) & set(
+        minhash.band_keys(minhash.signature(edited))
+    )
+
+    assert shared
+
+
+def test_permutations_do_not_overflow():
+    hashes = minhash.shingles(BASE) % minhash.MERSENNE_PRIME
+    prime = int(minhash.MERSENNE_PRIME)
+    expected = [
+        min((int(a) * int(h) + int(b)) % prime for h in hashes)
+        for a, b in zip(minhash._A, minhash._B)
+    ]
+
+    assert minhash.signature(BASE).tolist() == expected
+
+
+def test_text_without_words_has_no_signature():
+    assert minhash.signature("") is None
+    assert minhash.signature(" -- ... !") is None
+    assert minhash.signature("Python") is not None
@@ -0,0 +1,72 @@
+import pytest
+from fastapi import HTTPException
+
+from app.core.records import iter_csv, iter_ndjson
+
+
+async def chunked(data: bytes, size: int = 5):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def collect(records):
+    return [record async for record in records]
+
+
+@pytest.mark.asyncio
+async def test_iter_ndjson_reports_bad_lines():
+    data = (
+        '{"title": "A", "content": "Первый"}\n'
+        '\n'
+        'not json\n'
+        '[1, 2]\n'
+        '{"title": "B", "content": "x"}'
+    ).encode()
+
+    records = await collect(iter_ndjson(chunked(data)))
+
+    assert records == [
+        (1, {"title": "A", "content": "Первый"}),
+        (2, "Invalid JSON: Expecting value"),
+        (3, "Expected a JSON object"),
+        (4, {"title": "B", "content": "x"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_csv_handles_quoted_newlines():
+    data = (
+        'title,content\r\n'
+        'A,"multi\nline, with ""quotes"""\r\n'
+        'B,plain\r\n'
+        'C\r\n'
+    ).encode()
+
+    records = await collect(iter_csv(chunked(data)))
+
+    assert records == [
+        (1, {"title": "A", "content": 'multi\nline, with "quotes"'}),
+        (2, {"title": "B", "content": "plain"}),
+        (3, "Expected 2 fields, got 1"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_limits():
+    data = b'{"title": "A"}\n' + b"x" * 50 + b"\n"
+
+    with pytest.raises(HTTPException) as exc:
+        await collect(iter_ndjson(chunked(data), max_line_bytes=20))
+    assert exc.value.status_code == 413
+    assert "line" in exc.value.detail
+
+    with pytest.raises(HTTPException) as exc:
+        await collect(iter_ndjson(chunked(data), max_body_bytes=30))
+    assert exc.value.status_code == 413
+    assert "body" in exc.value.detail
+
+    quoted = b'title,content\nA,"' + b"line\n" * 10 + b'"\n'
+    with pytest.raises(HTTPException) as exc:
+        await collect(iter_csv(chunked(quoted), max_line_bytes=20))
+    assert "record" in exc.value.detail
+    assert await collect(iter_csv(chunked(quoted), max_line_bytes=100))
@@ -0,0 +1,67 @@
+import time
+
+from app.core.resilience import CircuitBreaker, LatencyHistogram
+
+
+def test_circuit_breaker_opens_and_recovers(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    now[0] += 10
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    now[0] += 10
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.stats() == {"state": "closed", "failures": 0, "opened": 2}
+
+
+def test_cancelled_trial_frees_the_half_open_slot(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+
+    now[0] += 10
+    assert breaker.allow()
+    breaker.record_cancelled(trial=True)
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()
+
+
+def test_cancelled_older_call_keeps_the_trial(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    assert breaker.allow()
+    breaker.record_failure()
+
+    now[0] += 10
+    assert breaker.allow()
+    breaker.record_cancelled(trial=False)
+    assert not breaker.allow()
+
+
+def test_latency_histogram_buckets_and_quantiles():
+    histogram = LatencyHistogram(buckets=(10, 100, float("inf")))
+    for seconds in (0.001, 0.002, 0.05, 0.5):
+        histogram.observe(seconds)
+
+    stats = histogram.stats()
+    assert stats["count"] == 4
+    assert stats["buckets"] == {"le_10": 2, "le_100": 1, "le_inf": 1}
+    assert stats["p50_ms"] == 10
+    assert stats["p95_ms"] == float("inf")
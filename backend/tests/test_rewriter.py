@@ -0,0 +1,91 @@
+from app.core.rewriter import PhraseRewriter, load_rules
+
+
+def test_longest_whole_word_match_wins():
+    rewriter = PhraseRewriter({
+        "worked": "built",
+        "worked on": "delivered",
+        "on": "ON",
+    })
+
+    assert rewriter.rewrite("I worked on it") == "I delivered it"
+    assert rewriter.rewrite("I worked hard") == "I built hard"
+    assert rewriter.rewrite("reworked one") == "reworked one"
+
+
+def test_hyphenated_and_apostrophised_words_stay_whole():
+    rewriter = PhraseRewriter({
+        "just": "", "very": "", "built": "made", "don": "do",
+        "team": "squad",
+    })
+
+    assert rewriter.rewrite(
+        "Built just-in-time compiler"
+    ) == "Made just-in-time compiler"
+    assert rewriter.rewrite("Very-high throughput") == "Very-high throughput"
+    assert rewriter.rewrite("re-built the team-wide cache") == (
+        "re-built the team-wide cache"
+    )
+    assert rewriter.rewrite("don't stop, don\u2019t") == (
+        "don't stop, don\u2019t"
+    )
+    assert rewriter.rewrite("the team's plan") == "the team's plan"
+    assert rewriter.rewrite("a 'team' - very fast") == "a 'squad' - fast"
+
+
+def test_case_and_whitespace_are_normalised():
+    rewriter = PhraseRewriter({"Was  Responsible for": "owned"})
+
+    assert rewriter.rewrite(
+        "WAS responsible\n  for billing"
+    ) == "Owned billing"
+    assert rewriter.rewrite("he was responsible for x") == "he owned x"
+
+
+def test_deletions_drop_spaces_and_pass_on_capitals():
+    rewriter = PhraseRewriter({"very": "", "really": ""})
+
+    assert rewriter.rewrite("a very good idea") == "a good idea"
+    assert rewriter.rewrite("Very really large team.") == "Large team."
+    assert rewriter.rewrite("it was very") == "it was"
+
+
+def test_deletions_respect_punctuation():
+    rewriter = PhraseRewriter({
+        "basically": "", "very": "", "really": "",
+        "was responsible for": "owned", "worked on": "built",
+    })
+
+    assert rewriter.rewrite(
+        "Basically, I was responsible for the team."
+    ) == "I owned the team."
+    assert rewriter.rewrite(
+        "Very good. Really, it worked on it."
+    ) == "Good. It built it."
+    assert rewriter.rewrite('"Basically" said') == '"Basically" said'
+    assert rewriter.rewrite("it was very.") == "it was very."
+
+
+def test_empty_rules_and_unicode():
+    assert PhraseRewriter({}).rewrite("Any text") == "Any text"
+
+    rewriter = PhraseRewriter({"naïve": "simple"})
+    assert rewriter.rewrite("İ Naïve plan") == "İ Simple plan"
+
+
+def test_digest_tracks_rules():
+    first = PhraseRewriter({"a": "b"})
+
+    assert first.digest == PhraseRewriter({"A": "b"}).digest
+    assert first.digest != PhraseRewriter({"a": "c"}).digest
+
+
+def test_load_rules(tmp_path):
+    path = tmp_path / "rules.tsv"
+    path.write_text(
+        "# comment\n\nworked on\tbuilt\nvery\t\nworked on\tdelivered\n",
+        encoding="utf-8",
+    )
+
+    assert load_rules(path) == {"worked on": "delivered", "very": ""}
+    assert load_rules()
@@ -0,0 +1,24 @@
+from app.core.search import highlight, search_terms
+
+
+def test_search_terms_are_unique_lowercase_words():
+    assert search_terms("Python, python  DEV! Резюме") == [
+        "python", "dev", "резюме"
+    ]
+    assert search_terms("  !!  ") == []
+
+
+def test_highlight_marks_whole_words_and_escapes():
+    assert highlight("Python <dev> pythonic", ["python"]) == (
+        "<mark>Python</mark> &lt;dev&gt; pythonic"
+    )
+
+
+def test_highlight_centres_snippet_on_first_match():
+    text = "a " * 200 + "Senior Python developer " + "b " * 200
+
+    snippet = highlight(text, ["developer"], width=60)
+
+    assert snippet.startswith("…") and snippet.endswith("…")
+    assert "<mark>developer</mark>" in snippet
+    assert len(snippet) < 100
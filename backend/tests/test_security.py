@@ -1,5 +1,8 @@
 from datetime import datetime, timezone, timedelta
 
+import asyncio
+import time
+
 import jwt
 import pytest
 from fastapi import HTTPException
@@ -7,7 +10,8 @@ from fastapi import HTTPException
 from app.core.config import settings
 from app.core.security import (
     hash_password, verify_password, create_jwt,
-    decode_jwt,
+    decode_jwt, hash_password_async, verify_password_async,
+    PasswordHasher,
 )
 
 
@@ -37,6 +41,65 @@ async def test_verify_password_incorrect():
     assert verify_password(wrong_password, hashed) is False
 
 
+@pytest.mark.asyncio
+async def test_hash_password_async():
+    password = "testpassword"
+    hashed = await hash_password_async(password)
+
+    assert hashed != password
+    assert await verify_password_async(password, hashed) is True
+    assert await verify_password_async("wrongpassword", hashed) is False
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_rejects_when_queue_full():
+    hasher = PasswordHasher(max_workers=1, max_pending=1, timeout=5)
+    try:
+        results = await asyncio.gather(
+            hasher.run(hash_password, "first"),
+            hasher.run(hash_password, "second"),
+            return_exceptions=True,
+        )
+    finally:
+        hasher.shutdown()
+
+    assert verify_password("first", results[0])
+    assert isinstance(results[1], HTTPException)
+    assert results[1].status_code == 503
+    stats = hasher.stats()
+    assert stats["pending"] == 0
+    assert stats["peak_pending"] == 1
+    assert stats["completed"] == 1
+    assert stats["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_timeout():
+    hasher = PasswordHasher(max_workers=1, max_pending=1, timeout=0.05)
+    try:
+        await hasher.run(time.sleep, 0)
+        with pytest.raises(HTTPException) as exc:
+            await hasher.run(time.sleep, 0.5)
+        assert exc.value.status_code == 503
+        assert exc.value.detail == "Authentication service timed out"
+
+        # The timed-out call still occupies the pool, so it keeps its slot.
+        assert hasher.stats()["pending"] == 1
+        with pytest.raises(HTTPException) as exc:
+            await hasher.run(time.sleep, 0)
+        assert exc.value.detail == "Authentication service is busy"
+
+        for _ in range(100):
+            if hasher.stats()["pending"] == 0:
+                break
+            await asyncio.sleep(0.02)
+        assert hasher.stats()["pending"] == 0
+    finally:
+        hasher.shutdown()
+
+    assert hasher.stats()["timed_out"] == 1
+
+
 @pytest.mark.asyncio
 async def test_create_jwt():
     data = {"sub": "1"}
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from app.core.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_concurrent_calls():
+    flights = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(
+        *(flights.do("key", work) for _ in range(5))
+    )
+
+    assert results == [1] * 5
+    assert calls == 1
+    assert flights.stats() == {"in_flight": 0, "leaders": 1, "coalesced": 4}
+
+    assert await flights.do("key", work) == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_exceptions():
+    flights = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flights.do("key", fail), flights.do("key", fail),
+        return_exceptions=True
+    )
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert flights.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_promotes_follower_when_leader_is_cancelled():
+    flights = SingleFlight()
+    calls = []
+
+    async def work(name):
+        calls.append(name)
+        await asyncio.sleep(0.01)
+        return name
+
+    leader = asyncio.create_task(flights.do("key", lambda: work("leader")))
+    await asyncio.sleep(0)
+    followers = [
+        asyncio.create_task(flights.do("key", lambda i=i: work(i)))
+        for i in range(3)
+    ]
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    results = await asyncio.gather(*followers)
+
+    assert leader.cancelled()
+    assert calls == ["leader", 0]
+    assert results == [0, 0, 0]
+    assert flights.stats()["in_flight"] == 0
+    assert flights.stats()["leaders"] == 2